@@ -63,6 +63,9 @@ class AppState(
         self.logger = setup_logger("app_state", "app_state.log")
         self._local = threading.local()
         self._socketio = None
+        # Set by create_job so idle workers wake immediately (see wait_for_job)
+        self._job_ready = threading.Event()
+        self._content_job_ready = threading.Event()
         self._init_db()
         self.logger.info("AppState initialized with database: %s", db_path)
 
@@ -167,6 +170,9 @@ class AppState(
                 last_checked TEXT,
                 check_interval_hours INTEGER DEFAULT 6,
                 is_active INTEGER DEFAULT 1,
+                etag TEXT,
+                last_modified TEXT,
+                feed_hash TEXT,
                 created_at TEXT DEFAULT CURRENT_TIMESTAMP
             );
 
@@ -256,6 +262,14 @@ class AppState(
                 conn.execute(f"ALTER TABLE collections ADD COLUMN {col} TEXT DEFAULT {default}")
                 conn.commit()
 
+        # ── podcasts table (feed validators for conditional GETs) ──
+        for col in ("etag", "last_modified", "feed_hash"):
+            try:
+                conn.execute(f"SELECT {col} FROM podcasts LIMIT 1")
+            except sqlite3.OperationalError:
+                conn.execute(f"ALTER TABLE podcasts ADD COLUMN {col} TEXT")
+                conn.commit()
+
         # ── sessions table ──
         try:
             conn.execute("SELECT username FROM sessions LIMIT 1")
@@ -3,6 +3,8 @@
 import json
 import subprocess
 import time
+from operator import itemgetter
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from ..constants import (
@@ -13,6 +15,38 @@ from ..constants import (
 )
 from ..utils import setup_logger
 
+# Volume/album names too vague for a name-based MusicBrainz search
+_GENERIC_TITLES = frozenset(
+    {
+        "audio",
+        "cd",
+        "disc",
+        "disk",
+        "untitled",
+        "unknown",
+        "track",
+        "album",
+        "music",
+        "my",
+        "test",
+        "new",
+    }
+)
+
+# Ranking adjustment by release-group primary type when picking a release
+_RELEASE_GROUP_BONUS = {"album": 2, "compilation": -5, "single": -5}
+
+# Content types whose bytes can be saved as-is for a matching file suffix
+_PASSTHROUGH_IMAGE_TYPES = {
+    "image/jpeg": (".jpg", ".jpeg"),
+    "image/png": (".png",),
+}
+
+
+def _artist_names(credits: List[Any]) -> List[str]:
+    """Return the artist names from a MusicBrainz ``artist-credit`` list."""
+    return [c["artist"]["name"] for c in credits if isinstance(c, dict) and "artist" in c]
+
 
 class MusicBrainzClient:
     """Audio CD identification via AcoustID fingerprinting and MusicBrainz lookup."""
@@ -46,20 +80,27 @@ class MusicBrainzClient:
         headers = {"User-Agent": APP_USER_AGENT}
 
         for attempt in range(1, retries + 1):
-            elapsed = time.time() - self._last_mb_request
+            elapsed = time.monotonic() - self._last_mb_request
             if elapsed < MB_RATE_LIMIT_SECONDS:
                 time.sleep(MB_RATE_LIMIT_SECONDS - elapsed)
 
             try:
-                self._last_mb_request = time.time()
+                self._last_mb_request = time.monotonic()
                 resp = requests.get(url, params=params, headers=headers, timeout=15)
                 resp.raise_for_status()
+                if resp.headers.get("Content-Length") == "0":
+                    self.logger.debug("MB empty response body: %s", url)
+                    return None
                 return resp
             except (requests.exceptions.ConnectionError, ConnectionResetError) as e:
                 wait = 2**attempt
                 self.logger.warning(
-                    f"MB request {url} attempt {attempt}/{retries} "
-                    f"failed ({e}), retrying in {wait}s"
+                    "MB request %s attempt %s/%s failed (%s), retrying in %ss",
+                    url,
+                    attempt,
+                    retries,
+                    e,
+                    wait,
                 )
                 time.sleep(wait)
             except requests.exceptions.HTTPError as e:
@@ -94,7 +135,7 @@ class MusicBrainzClient:
 
             duration, fingerprint = acoustid.fingerprint_file(file_path)
             self.logger.info(
-                f"Fingerprint generated (duration={duration}s, " f"fp length={len(fingerprint)})"
+                "Fingerprint generated (duration=%ss, fp length=%s)", duration, len(fingerprint)
             )
             return {"duration": int(duration), "fingerprint": fingerprint}
         except ImportError:
@@ -109,12 +150,9 @@ class MusicBrainzClient:
                 text=True,
                 check=True,
             )
-            data = json.loads(result.stdout)
-            self.logger.info("Fingerprint via fpcalc (duration=%ss)", data.get("duration"))
-            return {
-                "duration": int(data["duration"]),
-                "fingerprint": data["fingerprint"],
-            }
+            duration, fingerprint = itemgetter("duration", "fingerprint")(json.loads(result.stdout))
+            self.logger.info("Fingerprint via fpcalc (duration=%ss)", duration)
+            return {"duration": int(duration), "fingerprint": fingerprint}
         except FileNotFoundError:
             self.logger.warning(
                 "fpcalc not found — install Chromaprint or pyacoustid " "for audio fingerprinting"
@@ -191,8 +229,9 @@ class MusicBrainzClient:
                 score = result.get("score", 0)
                 if score < MIN_ACOUSTID_SCORE:
                     self.logger.info(
-                        f"Skipping AcoustID result with low score {score:.2f} "
-                        f"(threshold {MIN_ACOUSTID_SCORE})"
+                        "Skipping AcoustID result with low score %.2f (threshold %s)",
+                        score,
+                        MIN_ACOUSTID_SCORE,
                     )
                     continue
 
@@ -213,8 +252,10 @@ class MusicBrainzClient:
 
                     if rec_id:
                         self.logger.info(
-                            f"AcoustID match: '{rec_title}' by {artist_name} "
-                            f"(score={score:.2f})"
+                            "AcoustID match: '%s' by %s (score=%.2f)",
+                            rec_title,
+                            artist_name,
+                            score,
                         )
                         return {
                             "musicbrainz_recording_id": rec_id,
@@ -255,11 +296,7 @@ class MusicBrainzClient:
                 return None
             detail = detail_resp.json()
 
-            artists = [
-                a["artist"]["name"]
-                for a in detail.get("artist-credit", [])
-                if isinstance(a, dict) and "artist" in a
-            ]
+            artists = _artist_names(detail.get("artist-credit", []))
 
             tracks: List[Dict[str, Any]] = []
             for medium in detail.get("media", []):
@@ -289,22 +326,9 @@ class MusicBrainzClient:
                 lbl = label_info[0].get("label", {})
                 metadata["label"] = lbl.get("name") if isinstance(lbl, dict) else None
 
-            # Cover art
-            try:
-                cover_resp = self._mb_request(
-                    f"https://coverartarchive.org/release/{release_id}",
-                    retries=2,
-                )
-                if cover_resp and cover_resp.status_code == 200:
-                    images = cover_resp.json().get("images", [])
-                    if images:
-                        metadata["cover_art_url"] = images[0].get("image")
-                        for img in images:
-                            if "Front" in img.get("types", []):
-                                metadata["cover_art_url"] = img.get("image")
-                                break
-            except Exception as e:
-                self.logger.debug("Cover art fetch failed for release: %s", e)
+            cover_art_url = self._fetch_cover_art_url(release_id)
+            if cover_art_url:
+                metadata["cover_art_url"] = cover_art_url
 
             self.logger.info("MusicBrainz release: %s by %s", metadata["title"], metadata["artist"])
             return metadata
@@ -313,6 +337,27 @@ class MusicBrainzClient:
             self.logger.error("MusicBrainz release lookup error: %s", e)
             return None
 
+    def _fetch_cover_art_url(self, release_id: str) -> Optional[str]:
+        """Return the front cover URL for a release from CoverArtArchive, if any."""
+        try:
+            cover_resp = self._mb_request(
+                f"https://coverartarchive.org/release/{release_id}",
+                retries=2,
+            )
+            if not cover_resp or cover_resp.status_code != 200:
+                return None
+            # Only JSON listings are worth parsing; error pages are HTML
+            if not cover_resp.headers.get("Content-Type", "").startswith("application/json"):
+                return None
+            images = cover_resp.json().get("images", [])
+            for img in images:
+                if "Front" in img.get("types", []):
+                    return img.get("image")
+            return images[0].get("image") if images else None
+        except Exception as e:
+            self.logger.debug("Cover art fetch failed for release: %s", e)
+            return None
+
     def validate_release_durations(
         self,
         mb_data: Optional[Dict[str, Any]],
@@ -337,9 +382,10 @@ class MusicBrainzClient:
         if not mb_durations_ms or len(mb_durations_ms) != len(track_durations):
             if mb_durations_ms and len(mb_durations_ms) != len(track_durations):
                 self.logger.warning(
-                    f"Track count mismatch: disc has {len(track_durations)} "
-                    f"tracks, release '{mb_data.get('title')}' has "
-                    f"{len(mb_durations_ms)} — rejecting"
+                    "Track count mismatch: disc has %s tracks, release '%s' has %s — rejecting",
+                    len(track_durations),
+                    mb_data.get("title"),
+                    len(mb_durations_ms),
                 )
                 return None
             return mb_data
@@ -349,13 +395,15 @@ class MusicBrainzClient:
         )
         avg_diff_s = (total_diff / len(mb_durations_ms)) / 1000
         self.logger.info(
-            f"Release duration check: avg diff = {avg_diff_s:.1f}s/track "
-            f"for '{mb_data.get('title')}'"
+            "Release duration check: avg diff = %.1fs/track for '%s'",
+            avg_diff_s,
+            mb_data.get("title"),
         )
         if avg_diff_s > MB_DURATION_TOLERANCE_SECONDS:
             self.logger.warning(
-                f"Duration mismatch ({avg_diff_s:.1f}s avg) — rejecting "
-                f"release '{mb_data.get('title')}'"
+                "Duration mismatch (%.1fs avg) — rejecting release '%s'",
+                avg_diff_s,
+                mb_data.get("title"),
             )
             return None
 
@@ -390,65 +438,21 @@ class MusicBrainzClient:
                 self.logger.info("Recording has no linked releases")
                 return None
 
-            track_durations = disc_hints.get("track_durations", [])
-            best = None
-            best_score = -1
-
-            for rel in releases:
-                score = 0
-                media_list = rel.get("media", [])
-                if not media_list:
-                    continue
-                tc = media_list[0].get("track-count", 0)
-
-                if target_tracks and tc == target_tracks:
-                    score += 10
-                elif target_tracks and tc != target_tracks:
-                    score -= 20
-
+            def _score(rel: Dict[str, Any]) -> int:
+                tc = rel["media"][0].get("track-count", 0)
+                score = (10 if tc == target_tracks else -20) if target_tracks else 0
                 rg_type = rel.get("release-group", {}).get("primary-type", "").lower()
-                if rg_type == "album":
-                    score += 2
-                elif rg_type in ("compilation", "single"):
-                    score -= 5
+                return score + _RELEASE_GROUP_BONUS.get(rg_type, 0)
 
-                if score > best_score:
-                    best_score = score
-                    best = rel
-
-            if best is None:
-                best = releases[0]
+            scored = [(_score(rel), rel) for rel in releases if rel.get("media")]
+            best_score, best = max(scored, key=itemgetter(0), default=(0, releases[0]))
 
             self.logger.info(
-                f"Selected release '{best.get('title')}' " f"(id={best['id']}, score={best_score})"
+                "Selected release '%s' (id=%s, score=%s)", best.get("title"), best["id"], best_score
             )
 
             mb_data = self.lookup_musicbrainz_by_release_id(best["id"])
-
-            # Duration validation
-            if mb_data and track_durations and mb_data.get("tracks"):
-                mb_durations_ms = [
-                    t.get("duration_ms")
-                    for t in mb_data["tracks"]
-                    if t.get("duration_ms") is not None
-                ]
-                if mb_durations_ms and len(mb_durations_ms) == len(track_durations):
-                    total_diff = sum(
-                        abs(disc_s * 1000 - mb_ms)
-                        for disc_s, mb_ms in zip(track_durations, mb_durations_ms)
-                    )
-                    avg_diff_s = (total_diff / len(mb_durations_ms)) / 1000
-                    self.logger.info(
-                        f"Release duration check: avg diff = " f"{avg_diff_s:.1f}s/track"
-                    )
-                    if avg_diff_s > MB_DURATION_TOLERANCE_SECONDS:
-                        self.logger.warning(
-                            f"Duration mismatch ({avg_diff_s:.1f}s avg) — "
-                            f"rejecting release '{mb_data.get('title')}'"
-                        )
-                        return None
-
-            return mb_data
+            return self.validate_release_durations(mb_data, disc_hints)
 
         except Exception as e:
             self.logger.error("Error looking up releases for recording %s: %s", recording_id, e)
@@ -472,24 +476,11 @@ class MusicBrainzClient:
         clean_name = clean_title_fn(album_name) if clean_title_fn else album_name
         self.logger.info("Searching MusicBrainz for: '%s'", clean_name)
 
-        generic_titles = {
-            "audio",
-            "cd",
-            "disc",
-            "disk",
-            "untitled",
-            "unknown",
-            "track",
-            "album",
-            "music",
-            "my",
-            "test",
-            "new",
-        }
-        if clean_name.lower() in generic_titles or len(clean_name) <= 2:
+        if len(clean_name) <= 2 or clean_name.lower() in _GENERIC_TITLES:
             self.logger.warning(
-                f"Title '{clean_name}' is too generic for reliable MusicBrainz "
-                f"search — skipping name-based lookup (use AcoustID instead)"
+                "Title '%s' is too generic for reliable MusicBrainz "
+                "search — skipping name-based lookup (use AcoustID instead)",
+                clean_name,
             )
             return None
 
@@ -513,32 +504,20 @@ class MusicBrainzClient:
                 return None
 
             target_tracks = disc_hints.get("track_count", 0)
-            track_durations = disc_hints.get("track_durations", [])
-
-            best = None
-            best_score = -1
 
-            for rel in releases:
-                score = 0
-                media_list = rel.get("media", [])
-                if not media_list:
-                    continue
-                mb_tracks = media_list[0].get("track-count", 0)
-
-                if target_tracks and mb_tracks == target_tracks:
-                    score += 1
-                elif target_tracks and mb_tracks != target_tracks:
-                    continue
-
-                if rel.get("title", "").lower() == clean_name.lower():
-                    score += 1
-
-                if score > best_score:
-                    best_score = score
-                    best = rel
-
-            if best is None:
-                best = releases[0]
+            # Releases with a different track count are not candidates at all
+            clean_lower = clean_name.lower()
+            candidates = [
+                rel
+                for rel in releases
+                if rel.get("media")
+                and (not target_tracks or rel["media"][0].get("track-count", 0) == target_tracks)
+            ]
+            best = max(
+                candidates,
+                key=lambda rel: rel.get("title", "").lower() == clean_lower,
+                default=releases[0],
+            )
 
             release_id = best["id"]
             detail_resp = self._mb_request(
@@ -549,36 +528,8 @@ class MusicBrainzClient:
                 return None
             detail = detail_resp.json()
 
-            # Duration validation
-            if track_durations and target_tracks:
-                mb_durations_ms: List[int] = []
-                for medium in detail.get("media", []):
-                    for t in medium.get("tracks", []):
-                        length = t.get("length")
-                        if length is not None:
-                            mb_durations_ms.append(length)
-                if mb_durations_ms and len(mb_durations_ms) == len(track_durations):
-                    total_diff = sum(
-                        abs(disc_s * 1000 - mb_ms)
-                        for disc_s, mb_ms in zip(track_durations, mb_durations_ms)
-                    )
-                    avg_diff_s = (total_diff / len(mb_durations_ms)) / 1000
-                    self.logger.info(
-                        f"MusicBrainz duration check: avg diff = {avg_diff_s:.1f}s/track"
-                    )
-                    if avg_diff_s > MB_DURATION_TOLERANCE_SECONDS:
-                        self.logger.warning(
-                            f"Duration mismatch too large ({avg_diff_s:.1f}s avg) "
-                            f"— rejecting MusicBrainz match '{detail.get('title')}'"
-                        )
-                        return None
-
             # Build metadata
-            artists = [
-                a["artist"]["name"]
-                for a in detail.get("artist-credit", [])
-                if isinstance(a, dict) and "artist" in a
-            ]
+            artists = _artist_names(detail.get("artist-credit", []))
 
             tracks: List[Dict[str, Any]] = []
             for medium in detail.get("media", []):
@@ -607,22 +558,13 @@ class MusicBrainzClient:
                 lbl = label_info[0].get("label", {})
                 metadata["label"] = lbl.get("name") if isinstance(lbl, dict) else None
 
-            # Cover art
-            try:
-                cover_resp = self._mb_request(
-                    f"https://coverartarchive.org/release/{release_id}",
-                    retries=2,
-                )
-                if cover_resp and cover_resp.status_code == 200:
-                    images = cover_resp.json().get("images", [])
-                    if images:
-                        metadata["cover_art_url"] = images[0].get("image")
-                        for img in images:
-                            if "Front" in img.get("types", []):
-                                metadata["cover_art_url"] = img.get("image")
-                                break
-            except Exception as e:
-                self.logger.debug("Cover art fetch failed for release: %s", e)
+            # Reject before spending a rate-limited request on cover art
+            if self.validate_release_durations(metadata, disc_hints) is None:
+                return None
+
+            cover_art_url = self._fetch_cover_art_url(release_id)
+            if cover_art_url:
+                metadata["cover_art_url"] = cover_art_url
 
             self.logger.info("MusicBrainz match: %s by %s", metadata["title"], metadata["artist"])
             return metadata
@@ -652,9 +594,19 @@ class MusicBrainzClient:
             import requests
             from PIL import Image
 
-            response = requests.get(url, timeout=15)
+            response = requests.get(url, timeout=15, stream=True)
             response.raise_for_status()
 
+            # Already in the target format — write the bytes straight through
+            # instead of decoding and re-encoding with PIL.
+            content_type = response.headers.get("Content-Type", "").split(";")[0].strip()
+            if Path(output_path).suffix.lower() in _PASSTHROUGH_IMAGE_TYPES.get(content_type, ()):
+                with open(output_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
+                self.logger.info("Downloaded cover art to: %s", output_path)
+                return True
+
             image = Image.open(BytesIO(response.content))
             image.save(output_path)
             self.logger.info("Downloaded cover art to: %s", output_path)
@@ -1,23 +1,210 @@
 """TMDB (The Movie Database) API client."""
 
+import copy
+import functools
+import json
 import re
-from typing import Any, Dict, Optional
-
-from ..utils import setup_logger
+import sqlite3
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import requests
+from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..constants import (
+    APP_USER_AGENT,
+    STREAM_CHUNK_SIZE,
+    TMDB_BATCH_WORKERS,
+    TMDB_DETAIL_CACHE_TTL_SECONDS,
+    TMDB_POPULARITY_DOMINANCE,
+    TMDB_SEARCH_CACHE_TTL_SECONDS,
+)
+from ..utils import get_data_dir, setup_logger
+
+# Disc-label noise stripped from volume names before searching
+_NOISE_PATTERNS = (
+    r"DISC\s*\d*",
+    r"DVD",
+    r"BLU\s*RAY",
+    r"BD",
+    r"CD\s*\d*",
+    r"VOL(?:UME)?\s*\d*",
+    r"WIDESCREEN",
+    r"FULLSCREEN",
+    r"SPECIAL\s*EDITION",
+    r"REGION\s*\d",
+    r"NTSC",
+    r"PAL",
+    r"THE\s*MOVIE",
+)
+# Noise words and ``YYYYMMDD_HHMMSS`` timestamps, removed in a single pass
+_NOISE_RE = re.compile(r"\b(?:" + "|".join(_NOISE_PATTERNS) + r"|\d{8}\s\d{6})\b", re.IGNORECASE)
+# Anything but ASCII letters and whitespace, for the aggressive fallback title
+_NONALPHA_RE = re.compile(r"[^a-zA-Z\s]")
+# ASCII fast path for _NONALPHA_RE: underscores become spaces, other
+# non-letter / non-space characters are deleted in one translate() pass
+_ASCII_ALPHA_TABLE = str.maketrans(
+    {
+        c: (" " if c == "_" else None)
+        for c in map(chr, range(128))
+        if not (c.isalpha() or c.isspace())
+    }
+)
+
+# Successful search_tmdb results kept per client instance
+_SEARCH_MEMO_SIZE = 256
+
+# Shared accessor for TMDB genre / cast objects
+_name = itemgetter("name")
+
+
+@functools.lru_cache(maxsize=1024)
+def _clean_search_title(raw_title: str) -> str:
+    """Pure implementation of :meth:`TMDBClient._clean_search_title`, memoised."""
+    title = _NOISE_RE.sub("", raw_title.replace("_", " "))
+
+    # Drop a trailing standalone 4-digit number unless it looks like a year;
+    # a suffix slice is cheaper than a regex search on every title.
+    stripped = title.rstrip()
+    tail = stripped[-4:]
+    if len(tail) == 4 and tail.isdecimal() and (len(stripped) == 4 or not stripped[-5].isalnum()):
+        if not 1900 <= int(tail) <= 2099:
+            title = stripped[:-4]
+
+    # split()/join() collapses and trims whitespace without another regex pass
+    title = " ".join(title.split())
+    return title if title else raw_title.replace("_", " ").strip()
+
+
+def _header(response: requests.Response, name: str) -> Optional[str]:
+    """Return response header *name* if present as a string."""
+    value = response.headers.get(name)
+    return value if isinstance(value, str) else None
+
+
+def _conditional_headers(
+    entry: Optional[Tuple[int, Any, Optional[str], Optional[str]]],
+) -> Dict[str, str]:
+    """Build ``If-None-Match`` / ``If-Modified-Since`` headers from a cache entry."""
+    headers: Dict[str, str] = {}
+    if entry is not None:
+        if entry[2]:
+            headers["If-None-Match"] = entry[2]
+        if entry[3]:
+            headers["If-Modified-Since"] = entry[3]
+    return headers
+
+
+class _MetadataCache:
+    """SQLite-backed store of TMDB JSON responses, keyed by request URL.
+
+    Bodies are zlib-compressed JSON. Entries older than the caller's TTL
+    are treated as misses; their ``ETag`` / ``Last-Modified`` validators
+    let the next fetch revalidate them with a conditional GET.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, fetched_at INTEGER NOT NULL, body BLOB NOT NULL, "
+            "etag TEXT, last_modified TEXT)"
+        )
+        # Caches created before validators were stored lack the two columns
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+        for column in ("etag", "last_modified"):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE responses ADD COLUMN {column} TEXT")
+        self._conn.commit()
+
+    def get(self, key: str, ttl: int) -> Optional[Any]:
+        """Return the cached body for *key* if younger than *ttl* seconds."""
+        entry = self.entry(key)
+        if entry is None or time.time() - entry[0] > ttl:
+            return None
+        return entry[1]
+
+    def entry(self, key: str) -> Optional[Tuple[int, Any, Optional[str], Optional[str]]]:
+        """Return ``(fetched_at, body, etag, last_modified)`` for *key*, however old."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at, body, etag, last_modified FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(zlib.decompress(row[1])), row[2], row[3]
+
+    def put(
+        self,
+        key: str,
+        body: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Store *body* under *key*, replacing any previous entry."""
+        blob = zlib.compress(json.dumps(body).encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, fetched_at, body, etag, last_modified) VALUES (?, ?, ?, ?, ?)",
+                (key, int(time.time()), blob, etag, last_modified),
+            )
+            self._conn.commit()
+
+    def touch(self, key: str) -> None:
+        """Mark *key* as freshly validated without rewriting its body."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET fetched_at = ? WHERE key = ?", (int(time.time()), key)
+            )
+            self._conn.commit()
 
 
 class TMDBClient:
     """Search TMDB for movie metadata and download posters / backdrops."""
 
-    def __init__(self, api_key: Optional[str] = None) -> None:
+    def __init__(self, api_key: Optional[str] = None, cache_path: Optional[str] = None) -> None:
         """Initialise the TMDB client.
 
         Args:
             api_key: TMDB API key. If ``None``, metadata lookups
                 will be skipped.
+            cache_path: SQLite file for cached API responses. Defaults to
+                ``MEDIA_ROOT/data/tmdb_cache.db``.
         """
         self.api_key = api_key
         self.logger = setup_logger("tmdb_client", "metadata.log")
+        self._cache_path = Path(cache_path) if cache_path else None
+        self._cache: Optional[_MetadataCache] = None
+        self._cache_lock = threading.Lock()
+        self._search_memo: Dict[Tuple[str, Optional[int], str], Dict[str, Any]] = {}
+        self._memo_lock = threading.Lock()
+
+        # One keep-alive session for the API and image hosts, retrying
+        # rate-limit and transient server errors with back-off.
+        self._session = requests.Session()
+        self._session.headers.update({"User-Agent": APP_USER_AGENT})
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+        )
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        )
 
     # ── Public API ───────────────────────────────────────────────
 
@@ -36,12 +223,55 @@ class TMDBClient:
             return None
 
         disc_hints = disc_hints or {}
+        memo_key = (title, year, json.dumps(disc_hints, sort_keys=True, default=str))
+        metadata = self._search_memo.get(memo_key)
+        if metadata is None:
+            metadata = self._search_tmdb(title, year, disc_hints)
+            if metadata is None:
+                return None
+            with self._memo_lock:
+                if len(self._search_memo) >= _SEARCH_MEMO_SIZE:
+                    self._search_memo.pop(next(iter(self._search_memo)))
+                self._search_memo[memo_key] = metadata
+        # Callers own the returned dict; keep the memoised copy pristine
+        return copy.deepcopy(metadata)
+
+    def batch_search_tmdb(
+        self, queries: Iterable[Tuple[str, Optional[int], Optional[Dict[str, Any]]]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Run several :meth:`search_tmdb` lookups concurrently.
+
+        Args:
+            queries: ``(title, year, disc_hints)`` tuples.
+
+        Returns:
+            One metadata dict (or ``None``) per query, in input order.
+        """
+        queries = list(queries)
+        if not queries:
+            return []
+        # Bounded so a large import stays under TMDB's request rate limit
+        with ThreadPoolExecutor(max_workers=min(TMDB_BATCH_WORKERS, len(queries))) as pool:
+            return list(pool.map(lambda q: self.search_tmdb(*q), queries))
+
+    def download_poster(self, poster_path: str, output_path: str) -> bool:
+        """Download movie poster from TMDB."""
+        return self._download_image(poster_path, output_path, size="w500")
+
+    def download_backdrop(self, backdrop_path: str, output_path: str) -> bool:
+        """Download movie backdrop/fanart from TMDB."""
+        return self._download_image(backdrop_path, output_path, size="w1280")
+
+    # ── Search ───────────────────────────────────────────────────
+
+    def _search_tmdb(
+        self, title: str, year: Optional[int], disc_hints: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Run the TMDB search / detail / credits lookups behind :meth:`search_tmdb`."""
         clean_title = self._clean_search_title(title)
         self.logger.info("Searching TMDB for: '%s' (raw: '%s')", clean_title, title)
 
         try:
-            import requests
-
             search_url = "https://api.themoviedb.org/3/search/movie"
             params: Dict[str, Any] = {
                 "api_key": self.api_key,
@@ -50,47 +280,52 @@ class TMDBClient:
             if year:
                 params["year"] = year
 
-            response = requests.get(search_url, params=params, timeout=10)
-            response.raise_for_status()
-            results = response.json().get("results", [])
+            results = self._get_json(search_url, params, TMDB_SEARCH_CACHE_TTL_SECONDS).get(
+                "results", []
+            )
 
             if not results:
                 fallback_title = self._aggressive_clean_title(title)
                 if fallback_title != clean_title:
                     self.logger.info("Retrying TMDB with fallback title: '%s'", fallback_title)
                     params["query"] = fallback_title
-                    response = requests.get(search_url, params=params, timeout=10)
-                    response.raise_for_status()
-                    results = response.json().get("results", [])
+                    results = self._get_json(search_url, params, TMDB_SEARCH_CACHE_TTL_SECONDS).get(
+                        "results", []
+                    )
 
             if not results:
                 self.logger.info("No TMDB results for: %s", title)
                 return None
 
-            movie_id = self._pick_best_tmdb_match(results, disc_hints)
+            movie_id = self._pick_best_tmdb_match(results, disc_hints, year)
 
             # Fetch detailed information
             detail_url = f"https://api.themoviedb.org/3/movie/{movie_id}"
             credits_url = f"https://api.themoviedb.org/3/movie/{movie_id}/credits"
 
-            movie_data = requests.get(
-                detail_url, params={"api_key": self.api_key}, timeout=10
-            ).json()
-            credits_data = requests.get(
-                credits_url, params={"api_key": self.api_key}, timeout=10
-            ).json()
-
+            key_params = {"api_key": self.api_key}
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                detail_future = pool.submit(
+                    self._get_json, detail_url, key_params, TMDB_DETAIL_CACHE_TTL_SECONDS
+                )
+                credits_future = pool.submit(
+                    self._get_json, credits_url, key_params, TMDB_DETAIL_CACHE_TTL_SECONDS
+                )
+                movie_data = detail_future.result()
+                credits_data = credits_future.result()
+
+            release_year = (movie_data.get("release_date") or "")[:4]
             metadata: Dict[str, Any] = {
                 "title": movie_data.get("title"),
                 "original_title": movie_data.get("original_title"),
                 "year": (
-                    movie_data.get("release_date", "")[:4]
-                    if movie_data.get("release_date")
+                    int(release_year)
+                    if len(release_year) == 4 and release_year.isdecimal()
                     else None
                 ),
                 "overview": movie_data.get("overview"),
                 "runtime_minutes": movie_data.get("runtime"),
-                "genres": [g["name"] for g in movie_data.get("genres", [])],
+                "genres": list(map(_name, movie_data.get("genres", ()))),
                 "rating": movie_data.get("vote_average"),
                 "tmdb_id": movie_id,
                 "poster_path": movie_data.get("poster_path"),
@@ -102,11 +337,12 @@ class TMDBClient:
                 metadata["collection_name"] = movie_data["belongs_to_collection"].get("name")
 
             if "crew" in credits_data:
-                directors = [c["name"] for c in credits_data["crew"] if c["job"] == "Director"]
-                metadata["director"] = directors[0] if directors else None
+                metadata["director"] = next(
+                    (c["name"] for c in credits_data["crew"] if c["job"] == "Director"), None
+                )
 
             if "cast" in credits_data:
-                metadata["cast"] = [c["name"] for c in credits_data["cast"][:10]]
+                metadata["cast"] = list(map(_name, credits_data["cast"][:10]))
 
             self.logger.info("Found TMDB match: %s (%s)", metadata["title"], metadata["year"])
             return metadata
@@ -115,14 +351,6 @@ class TMDBClient:
             self.logger.error("Error searching TMDB: %s", e)
             return None
 
-    def download_poster(self, poster_path: str, output_path: str) -> bool:
-        """Download movie poster from TMDB."""
-        return self._download_image(poster_path, output_path, size="w500")
-
-    def download_backdrop(self, backdrop_path: str, output_path: str) -> bool:
-        """Download movie backdrop/fanart from TMDB."""
-        return self._download_image(backdrop_path, output_path, size="w1280")
-
     # ── Title Cleaning ───────────────────────────────────────────
 
     def _clean_search_title(self, raw_title: str) -> str:
@@ -131,97 +359,171 @@ class TMDBClient:
         Handles common disc naming patterns like underscores, disc markers,
         trailing timestamps, region codes, etc.
         """
-        title = raw_title.replace("_", " ")
-
-        noise_patterns = [
-            r"\bDISC\s*\d*\b",
-            r"\bDVD\b",
-            r"\bBLU\s*RAY\b",
-            r"\bBD\b",
-            r"\bCD\s*\d*\b",
-            r"\bVOL(UME)?\s*\d*\b",
-            r"\bWIDESCREEN\b",
-            r"\bFULLSCREEN\b",
-            r"\bSPECIAL\s*EDITION\b",
-            r"\bREGION\s*\d\b",
-            r"\bNTSC\b",
-            r"\bPAL\b",
-            r"\bTHE\s*MOVIE\b",
-        ]
-        for pat in noise_patterns:
-            title = re.sub(pat, "", title, flags=re.IGNORECASE)
-
-        title = re.sub(r"\b\d{8}[\s_]\d{6}\b", "", title)
-
-        match = re.search(r"\b(\d{4})\s*$", title)
-        if match:
-            num = int(match.group(1))
-            if num < 1900 or num > 2099:
-                title = title[: match.start()]
-
-        title = re.sub(r"\s+", " ", title).strip()
-        return title if title else raw_title.replace("_", " ").strip()
+        return _clean_search_title(raw_title)
 
     def _aggressive_clean_title(self, raw_title: str) -> str:
         """More aggressive title cleaning as a fallback."""
-        title = raw_title.replace("_", " ")
-        title = re.sub(r"[^a-zA-Z\s]", "", title)
+        if raw_title.isascii():
+            title = raw_title.translate(_ASCII_ALPHA_TABLE)
+        else:
+            title = _NONALPHA_RE.sub("", raw_title.replace("_", " "))
         words = [w for w in title.split() if len(w) > 1 or w.upper() in ("I", "A")]
         return " ".join(words).strip() if words else raw_title
 
     # ── Internals ────────────────────────────────────────────────
 
-    def _pick_best_tmdb_match(self, results: list, disc_hints: Dict[str, Any]) -> int:
+    def _pick_best_tmdb_match(
+        self, results: list, disc_hints: Dict[str, Any], year: Optional[int] = None
+    ) -> int:
         """Pick the best TMDB result using disc hints for disambiguation."""
         estimated_runtime = disc_hints.get("estimated_runtime_min")
 
         if not estimated_runtime or len(results) <= 1:
             return results[0]["id"]
 
+        if self._top_result_dominates(results, year):
+            self.logger.info(
+                "Selected TMDB ID %s by popularity (no runtime lookups)", results[0]["id"]
+            )
+            return results[0]["id"]
+
         best_id = results[0]["id"]
         best_diff = float("inf")
 
-        for r in results[:5]:
-            import requests
-
-            try:
-                detail = requests.get(
-                    f"https://api.themoviedb.org/3/movie/{r['id']}",
-                    params={"api_key": self.api_key},
-                    timeout=5,
-                ).json()
-                tmdb_runtime = detail.get("runtime", 0)
-                if tmdb_runtime:
-                    diff = abs(tmdb_runtime - estimated_runtime)
-                    self.logger.debug(
-                        f"  TMDB match '{detail.get('title')}' runtime={tmdb_runtime}, "
-                        f"disc≈{estimated_runtime}, diff={diff}"
-                    )
-                    if diff < best_diff:
-                        best_diff = diff
-                        best_id = r["id"]
-            except Exception as e:
-                self.logger.debug("Failed to fetch TMDB detail for id=%s: %s", r.get("id"), e)
+        # The detail lookups are independent, so fetch them concurrently
+        candidates = results[:5]
+        with ThreadPoolExecutor(max_workers=len(candidates)) as pool:
+            details = list(pool.map(self._fetch_movie_detail, [r["id"] for r in candidates]))
+
+        for r, detail in zip(candidates, details):
+            tmdb_runtime = detail.get("runtime", 0) if detail else 0
+            if tmdb_runtime:
+                diff = abs(tmdb_runtime - estimated_runtime)
+                self.logger.debug(
+                    "  TMDB match '%s' runtime=%s, disc≈%s, diff=%s",
+                    detail.get("title"),
+                    tmdb_runtime,
+                    estimated_runtime,
+                    diff,
+                )
+                if diff < best_diff:
+                    best_diff = diff
+                    best_id = r["id"]
 
         self.logger.info("Selected TMDB ID %s (runtime diff: %s min)", best_id, best_diff)
         return best_id
 
+    def _get_cache(self) -> Optional[_MetadataCache]:
+        """Open the response cache on first use; None if it is unavailable."""
+        with self._cache_lock:
+            if self._cache is None:
+                path = self._cache_path or get_data_dir() / "tmdb_cache.db"
+                try:
+                    self._cache = _MetadataCache(path)
+                except (OSError, sqlite3.Error) as e:
+                    self.logger.warning("TMDB cache unavailable at %s: %s", path, e)
+                    return None
+            return self._cache
+
+    def _get_json(
+        self, url: str, params: Dict[str, Any], ttl: int, timeout: int = 10
+    ) -> Dict[str, Any]:
+        """GET a TMDB JSON endpoint, serving fresh responses from the disk cache.
+
+        The API key is left out of the cache key so rotating it keeps the cache.
+        """
+        key = url + "?" + urlencode(sorted((k, v) for k, v in params.items() if k != "api_key"))
+        cache = self._get_cache()
+        entry = None
+        if cache is not None:
+            try:
+                entry = cache.entry(key)
+            except (sqlite3.Error, ValueError) as e:
+                self.logger.debug("TMDB cache read failed for %s: %s", key, e)
+        if entry is not None and time.time() - entry[0] <= ttl:
+            return entry[1]
+
+        response = self._session.get(
+            url, params=params, headers=_conditional_headers(entry), timeout=timeout
+        )
+        if entry is not None and response.status_code == 304:
+            try:
+                cache.touch(key)
+            except sqlite3.Error as e:
+                self.logger.debug("TMDB cache touch failed for %s: %s", key, e)
+            return entry[1]
+        response.raise_for_status()
+        body = response.json()
+
+        if cache is not None:
+            try:
+                cache.put(
+                    key,
+                    body,
+                    etag=_header(response, "ETag"),
+                    last_modified=_header(response, "Last-Modified"),
+                )
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                self.logger.debug("TMDB cache write failed for %s: %s", key, e)
+        return body
+
+    @staticmethod
+    def _top_result_dominates(results: list, year: Optional[int]) -> bool:
+        """True if the first result is clearly the intended movie without runtimes.
+
+        It must be far more popular than the runner-up and, when the year is
+        known, released within a year of it.
+        """
+        top_popularity = results[0].get("popularity") or 0
+        runner_up = results[1].get("popularity") or 0
+        if top_popularity <= TMDB_POPULARITY_DOMINANCE * runner_up:
+            return False
+        if year is None:
+            return True
+        release_year = (results[0].get("release_date") or "")[:4]
+        return release_year.isdigit() and abs(int(release_year) - year) <= 1
+
+    def _fetch_movie_detail(self, movie_id: int) -> Optional[Dict[str, Any]]:
+        """Fetch ``/movie/{id}`` details, or None if the request fails."""
+        try:
+            return self._get_json(
+                f"https://api.themoviedb.org/3/movie/{movie_id}",
+                {"api_key": self.api_key},
+                TMDB_DETAIL_CACHE_TTL_SECONDS,
+                timeout=5,
+            )
+        except Exception as e:
+            self.logger.debug("Failed to fetch TMDB detail for id=%s: %s", movie_id, e)
+            return None
+
     def _download_image(self, image_path: str, output_path: str, size: str = "w500") -> bool:
         """Download an image (poster or backdrop) from TMDB."""
         if not image_path:
             return False
         try:
-            from io import BytesIO
-
-            import requests
-            from PIL import Image
-
             url = f"https://image.tmdb.org/t/p/{size}{image_path}"
-            response = requests.get(url, timeout=10)
+            etag_path = Path(output_path + ".etag")
+            headers = {}
+            if etag_path.exists() and Path(output_path).exists():
+                headers["If-None-Match"] = etag_path.read_text().strip()
+            response = self._session.get(url, headers=headers, timeout=10, stream=True)
+            if headers and response.status_code == 304:
+                self.logger.debug("TMDB image unchanged: %s", output_path)
+                return True
             response.raise_for_status()
 
-            image = Image.open(BytesIO(response.content))
-            image.save(output_path)
+            if Path(image_path).suffix.lower() == Path(output_path).suffix.lower():
+                # Same format on both ends — copy the bytes, no decode/re-encode
+                with open(output_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                        f.write(chunk)
+            else:
+                image = Image.open(BytesIO(response.content))
+                image.save(output_path)
+
+            etag = _header(response, "ETag")
+            if etag:
+                etag_path.write_text(etag)
 
             self.logger.info("Downloaded TMDB image to: %s", output_path)
             return True
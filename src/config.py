@@ -9,7 +9,7 @@ import json
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from .constants import DEFAULT_CONFIG_PATH
 
@@ -40,6 +40,15 @@ _REQUIRED_TOP_KEYS: List[str] = [
     "auth",
 ]
 
+# Set views of the above for one-shot difference checks in validate_config
+_REQUIRED_TOP_KEY_SET = frozenset(_REQUIRED_TOP_KEYS)
+_REQUIRED_SCHEMA_SETS: Dict[str, FrozenSet[str]] = {
+    section: frozenset(sub_keys) for section, sub_keys in _REQUIRED_SCHEMA.items()
+}
+
+# Parsed (unresolved) config per file path, keyed on (st_mtime_ns, st_size)
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
 
 class ConfigError(Exception):
     """Raised when the configuration file is missing or invalid."""
@@ -62,15 +71,28 @@ def load_config(config_path: str = DEFAULT_CONFIG_PATH) -> Dict[str, Any]:
     base_dir = Path(__file__).parent.parent
     full_path = base_dir / config_path
 
-    if not full_path.exists():
-        raise ConfigError(f"Configuration file not found: {full_path}")
-
     try:
-        with open(full_path, "r") as f:
-            config = json.load(f)
-    except json.JSONDecodeError as exc:
-        raise ConfigError(f"Invalid JSON in {full_path}: {exc}") from exc
-
+        st = full_path.stat()
+    except FileNotFoundError:
+        raise ConfigError(f"Configuration file not found: {full_path}") from None
+
+    # Every component loads the same file at startup; parse it once per
+    # on-disk version.  Placeholders are still resolved per call so the
+    # result tracks the current environment.
+    cache_key = str(full_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        config = cached[1]
+    else:
+        try:
+            with open(full_path, "r") as f:
+                config = json.load(f)
+        except json.JSONDecodeError as exc:
+            raise ConfigError(f"Invalid JSON in {full_path}: {exc}") from exc
+        _CONFIG_CACHE[cache_key] = (stamp, config)
+
+    # _resolve builds new containers, so callers never share the cached dict
     return _resolve(config)
 
 
@@ -83,16 +105,23 @@ def validate_config(config: Dict[str, Any]) -> List[str]:
     """
     errors: List[str] = []
 
-    for key in _REQUIRED_TOP_KEYS:
-        if key not in config:
-            errors.append(f"Missing required config section: '{key}'")
+    # Set differences do the membership tests; the declared lists are only
+    # walked when something is missing, to keep error order stable.
+    missing_sections = _REQUIRED_TOP_KEY_SET - config.keys()
+    if missing_sections:
+        for key in _REQUIRED_TOP_KEYS:
+            if key in missing_sections:
+                errors.append(f"Missing required config section: '{key}'")
 
-    for section, sub_keys in _REQUIRED_SCHEMA.items():
+    for section, required in _REQUIRED_SCHEMA_SETS.items():
         if section not in config:
             continue  # already reported above
-        for sub in sub_keys:
-            if sub not in config[section]:
-                errors.append(f"Missing required key '{sub}' in config section '{section}'")
+        section_cfg = config[section]
+        missing = required - (section_cfg.keys() if isinstance(section_cfg, dict) else set())
+        if missing:
+            for sub in _REQUIRED_SCHEMA[section]:
+                if sub in missing:
+                    errors.append(f"Missing required key '{sub}' in config section '{section}'")
 
     # Validate base_directory is not an unresolved placeholder
     base_dir = config.get("output", {}).get("base_directory", "")
@@ -110,14 +139,23 @@ def validate_config(config: Dict[str, Any]) -> List[str]:
 _PLACEHOLDER_RE = re.compile(r"\$\{(\w+)(?::-([^}]*))?\}")
 
 
-def _resolve(obj: Any) -> Any:
-    """Recursively resolve ``${ENV_VAR:-default}`` in string values."""
+def _resolve(obj: Any, _memo: Optional[Dict[str, str]] = None) -> Any:
+    """Recursively resolve ``${ENV_VAR:-default}`` in string values.
+
+    ``_memo`` maps raw strings to their resolved form for the duration of
+    one top-level call, so repeated placeholders are substituted once.
+    """
+    if _memo is None:
+        _memo = {}
     if isinstance(obj, str):
-        return _PLACEHOLDER_RE.sub(_replace_match, obj)
+        resolved = _memo.get(obj)
+        if resolved is None:
+            resolved = _memo[obj] = _PLACEHOLDER_RE.sub(_replace_match, obj)
+        return resolved
     elif isinstance(obj, dict):
-        return {k: _resolve(v) for k, v in obj.items()}
+        return {k: _resolve(v, _memo) for k, v in obj.items()}
     elif isinstance(obj, list):
-        return [_resolve(v) for v in obj]
+        return [_resolve(v, _memo) for v in obj]
     return obj
 
 
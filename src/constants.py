@@ -5,7 +5,9 @@ All magic numbers, extension sets, thresholds and default values live here
 so they can be imported by any module without circular dependencies.
 """
 
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 # ── Version ──────────────────────────────────────────────────────
 APP_VERSION = "0.3.0"
@@ -69,29 +71,50 @@ AUDIO_CD_EXTENSIONS = frozenset({".aiff", ".aif", ".wav", ".cda"})
 # All extensions the library scanner should index
 ALL_MEDIA_EXTENSIONS = VIDEO_EXTENSIONS | AUDIO_EXTENSIONS | IMAGE_EXTENSIONS | DOCUMENT_EXTENSIONS
 
+
+def is_media_file(name: str) -> bool:
+    """Return True if the file *name* has an extension the scanner indexes."""
+    dot = name.rfind(".")
+    if dot <= 0:  # no extension, or a bare dotfile like ".mp4"
+        return False
+    return name[dot:].lower() in ALL_MEDIA_EXTENSIONS
+
+
 # ── MIME type mapping ────────────────────────────────────────────
-MIME_TYPES: dict[str, str] = {
-    ".mp4": "video/mp4",
-    ".mkv": "video/x-matroska",
-    ".avi": "video/x-msvideo",
-    ".m4v": "video/mp4",
-    ".mov": "video/quicktime",
-    ".webm": "video/webm",
-    ".flv": "video/x-flv",
-    ".wmv": "video/x-ms-wmv",
-    ".mp3": "audio/mpeg",
-    ".flac": "audio/flac",
-    ".aac": "audio/aac",
-    ".m4a": "audio/mp4",
-    ".ogg": "audio/ogg",
-    ".wav": "audio/wav",
-    ".opus": "audio/opus",
-    ".wma": "audio/x-ms-wma",
-    ".aiff": "audio/aiff",
-}
+# Read-only; covers every VIDEO_EXTENSIONS / AUDIO_EXTENSIONS entry we stream
+MIME_TYPES: Mapping[str, str] = MappingProxyType(
+    {
+        ".mp4": "video/mp4",
+        ".mkv": "video/x-matroska",
+        ".avi": "video/x-msvideo",
+        ".m4v": "video/mp4",
+        ".mov": "video/quicktime",
+        ".webm": "video/webm",
+        ".flv": "video/x-flv",
+        ".wmv": "video/x-ms-wmv",
+        ".mp3": "audio/mpeg",
+        ".flac": "audio/flac",
+        ".aac": "audio/aac",
+        ".m4a": "audio/mp4",
+        ".ogg": "audio/ogg",
+        ".wav": "audio/wav",
+        ".opus": "audio/opus",
+        ".wma": "audio/x-ms-wma",
+        ".aiff": "audio/aiff",
+    }
+)
 
 # ── Streaming / HTTP ─────────────────────────────────────────────
 STREAM_CHUNK_SIZE = 256 * 1024  # 256 KB — used for range-request streaming
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB — copy size for large remote downloads
+DOWNLOAD_WRITE_BUFFER = 4 * DOWNLOAD_CHUNK_SIZE  # coalesce copied chunks into 4 MB writes
+
+# ── Background workers ───────────────────────────────────────────
+# Idle workers wake at once for jobs created in this process. Jobs created by
+# another process sharing the DB (e.g. a separate --mode server) are only seen
+# on these rechecks, so keep them at the old poll intervals.
+JOB_QUEUE_RECHECK_SECONDS = 2
+CONTENT_QUEUE_RECHECK_SECONDS = 3
 
 # ── Logging ──────────────────────────────────────────────────────
 LOG_MAX_BYTES = 10 * 1024 * 1024  # 10 MB per log file
@@ -112,6 +135,16 @@ MIN_ACOUSTID_SCORE = 0.6
 MB_RATE_LIMIT_SECONDS = 1.1  # MusicBrainz requires ≤ 1 request/second
 MB_DURATION_TOLERANCE_SECONDS = 15  # avg seconds diff before rejecting a match
 
+# ── TMDB ─────────────────────────────────────────────────────────
+TMDB_SEARCH_CACHE_TTL_SECONDS = 30 * 24 * 3600  # search results rarely change
+TMDB_DETAIL_CACHE_TTL_SECONDS = 7 * 24 * 3600  # details / credits get edited more often
+# Top search hit wins outright when this many times as popular as the runner-up
+TMDB_POPULARITY_DOMINANCE = 2.0
+TMDB_BATCH_WORKERS = 4  # concurrent searches in batch_search_tmdb (TMDB allows ~40 req/10 s)
+
+# ── Spotify import ───────────────────────────────────────────────
+SPOTIFY_MAX_TRACKS = 500  # stop walking embed JSON once this many tracks are found
+
 # ── Library scanner ──────────────────────────────────────────────
 LIBRARY_SKIP_DIRS = frozenset({"data", ".cache"})
 
@@ -4,20 +4,160 @@ Handles: YouTube/video URLs (yt-dlp), web articles (trafilatura),
          podcast feed parsing (feedparser), and Spotify/playlist import.
 """
 
+import hashlib
 import html as _html_mod
 import json
+import os
 import re
+import shutil
 import subprocess
+import threading
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, Optional
-from urllib.request import Request, urlopen
+from operator import itemgetter
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .app_state import AppState
 from .config import load_config
+from .constants import (
+    APP_USER_AGENT,
+    AUDIO_EXTENSIONS,
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_WRITE_BUFFER,
+    MIME_TYPES,
+    SPOTIFY_MAX_TRACKS,
+)
 from .utils import format_size, sanitize_filename, setup_logger
 
+# orjson is optional; it decodes the large Spotify page blobs several times faster
+# and also handles the yt-dlp and trafilatura JSON plus the article JSON-LD
+try:
+    import orjson
+
+    _loads_json = orjson.loads
+
+    def _dumps_json(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _loads_json = json.loads
+
+    def _dumps_json(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# yt-dlp --newline progress lines: "[download]  42.7% of ..."
+_YTDLP_PROGRESS_RE = re.compile(r"\[download\]\s+(\d+(?:\.\d+)?)%")
+
+# Spotify page scraping
+_PLAYLIST_ID_RE = re.compile(r"playlist[/:]([A-Za-z0-9]+)")
+# Page regexes run on the raw response bytes; only matched JSON is decoded
+_NEXT_DATA_RE = re.compile(rb'<script\s+id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+_JSON_BLOCK_RE = re.compile(rb'<script[^>]*type="application/json"[^>]*>(.*?)</script>', re.DOTALL)
+_LD_JSON_RE = re.compile(rb'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>', re.DOTALL)
+_OG_TITLE_RE = re.compile(rb'<meta\s+property="og:title"\s+content="([^"]+)"')
+_MUSIC_SONG_RE = re.compile(rb'<meta\s+name="music:song"\s+content="[^"]*?/track/[^"]*"[^>]*/?>')
+
+
+_ARTICLE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <script type="application/ld+json">{metadata}</script>
+    <style>
+        body {{ font-family: Georgia, serif; max-width: 720px; margin: 2rem auto;
+               padding: 0 1rem; line-height: 1.7; color: #1a1a1a; }}
+        h1 {{ font-size: 1.8rem; margin-bottom: 0.2rem; }}
+        .meta {{ color: #666; font-size: 0.9rem; margin-bottom: 2rem; }}
+        a {{ color: #1a6fbf; }}
+    </style>
+</head>
+<body>
+    <h1>{title}</h1>
+    <div class="meta">
+        <span>By {author}</span> &middot; <span>{date}</span>
+        &middot; <a href="{url}">Original</a>
+    </div>
+    <article>{body}</article>
+</body>
+</html>"""
+
+
+# Audio Content-Type → file extension for podcast episodes
+_AUDIO_EXT_BY_MIME = {
+    mime: ext for ext, mime in MIME_TYPES.items() if mime.startswith("audio/")
+} | {"audio/x-m4a": ".m4a", "audio/mp3": ".mp3", "audio/x-wav": ".wav"}
+
+
+def _episode_extension(content_type: str, audio_url: str) -> str:
+    """Pick a file extension from the response type, then the URL path, else .mp3."""
+    ext = _AUDIO_EXT_BY_MIME.get(content_type.split(";", 1)[0].strip().lower())
+    if ext:
+        return ext
+    suffix = PurePosixPath(urlparse(audio_url).path).suffix.lower()
+    return suffix if suffix in AUDIO_EXTENSIONS else ".mp3"
+
+
+# Embed-page trackList entries carry just these four fields; anything with
+# the keys _extract_track_info looks for goes through the generic path.
+_EMBED_TRACK_FIELDS = itemgetter("title", "subtitle", "duration", "uri")
+_GENERIC_TRACK_KEYS = frozenset(
+    {"name", "artists", "album", "duration_ms", "coverArt", "externalIds"}
+)
+
+
+def _extract_embed_track(t: Any, playlist_art: str) -> Optional[Dict[str, Any]]:
+    """Fast path for the embed track shape; None means use the generic extractor."""
+    if not isinstance(t, dict) or not _GENERIC_TRACK_KEYS.isdisjoint(t):
+        return None
+    try:
+        name, artist, duration, uri = _EMBED_TRACK_FIELDS(t)
+    except KeyError:
+        return None
+    if not name or not isinstance(duration, int):
+        return None
+    return {
+        "title": name,
+        "artist": artist or "",
+        "album": "",
+        "duration_ms": duration,
+        "artwork_url": playlist_art,
+        "spotify_uri": uri,
+        "isrc": "",
+    }
+
+
+def _advise_sequential(f) -> None:
+    """Tell the kernel *f* will be accessed front to back (tunes readahead/writeback).
+
+    No-op where ``posix_fadvise`` is unavailable (macOS).
+    """
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+def _drop_from_page_cache(f) -> None:
+    """Flush *f* to disk and tell the kernel its pages won't be read again soon.
+
+    Keeps large one-off downloads from evicting hotter data (SQLite, thumbnails)
+    from the page cache. No-op where ``posix_fadvise`` is unavailable (macOS).
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    f.flush()
+    os.fsync(f.fileno())
+    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
 
 def _escape_html(text: str) -> str:
     """HTML-escape text to prevent XSS in archived articles."""
@@ -65,6 +205,7 @@ class ContentDownloader:
             )
         )
         self.ytdlp_format = dl_cfg.get("ytdlp_format", "bestvideo[height<=1080]+bestaudio/best")
+        self.download_parallelism = dl_cfg.get("parallelism", 2)
 
         pod_cfg = self.config.get("podcasts", {})
         self.podcast_dir = Path(
@@ -78,30 +219,101 @@ class ContentDownloader:
         for d in (self.download_dir, self.articles_dir, self.books_dir, self.podcast_dir):
             d.mkdir(parents=True, exist_ok=True)
 
+        # Serialises library writes from concurrent downloads
+        self._db_lock = threading.Lock()
+
+        # Long-lived pool for podcast auto-downloads; feed checks submit to it
+        # without waiting.  _pending_episodes stops a later check from
+        # queueing an episode that is still downloading.
+        self._download_pool = ThreadPoolExecutor(
+            max_workers=max(1, pod_cfg.get("download_parallelism", 4)),
+            thread_name_prefix="podcast-download",
+        )
+        self._pending_episodes: Set[Tuple[str, str]] = set()  # (podcast_id, episode_id)
+        self._pending_lock = threading.Lock()
+
+        # Shared keep-alive session for Spotify, artwork and episode fetches
+        self._session = requests.Session()
+        self._session.headers.update({"User-Agent": APP_USER_AGENT})
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.5),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def close(self) -> None:
+        """Stop the podcast download pool, dropping episodes still queued.
+
+        Downloads already running are not waited for.
+        """
+        self._download_pool.shutdown(wait=False, cancel_futures=True)
+
     # ── Video Downloads (yt-dlp) ─────────────────────────────────
 
-    def download_video(self, url: str, job_id: str = None) -> Optional[str]:
+    def download_video(self, url: str, job_id: Optional[str] = None) -> Optional[str]:
         """Download a video via yt-dlp. Returns output file path or None."""
         self.logger.info("Downloading video: %s", url)
 
-        # Use yt-dlp to extract info first for naming
         try:
-            info_cmd = ["yt-dlp", "--no-download", "--print-json", "--no-warnings", url]
-            result = subprocess.run(info_cmd, capture_output=True, text=True, timeout=60)
-            if result.returncode == 0:
-                info = json.loads(result.stdout.strip().split("\n")[0])
-                title = sanitize_filename(info.get("title", "download"))
-                uploader = info.get("uploader", "Unknown")
-            else:
-                title = f"download_{uuid.uuid4().hex[:8]}"
-                uploader = "Unknown"
+            from yt_dlp import YoutubeDL
+        except ImportError:
+            return self._download_video_cli(url, job_id)
+
+        opts = {
+            "format": self.ytdlp_format,
+            "outtmpl": str(self.download_dir / "%(title)s.%(ext)s"),
+            "merge_output_format": "mp4",
+            "quiet": True,
+            "no_warnings": True,
+            "noprogress": True,
+            "socket_timeout": 60,
+        }
+        if job_id:
+            report = self._progress_reporter(job_id)
+
+            def hook(d: Dict[str, Any]) -> None:
+                total = d.get("total_bytes") or d.get("total_bytes_estimate")
+                if d.get("status") == "downloading" and total:
+                    report(100.0 * d.get("downloaded_bytes", 0) / total)
+
+            opts["progress_hooks"] = [hook]
+        try:
+            # One in-process extraction gives both the metadata and the file
+            with YoutubeDL(opts) as ydl:
+                info = ydl.extract_info(url, download=True)
+                downloads = info.get("requested_downloads") or []
+                filepath = downloads[0].get("filepath") if downloads else None
+                output = Path(filepath or ydl.prepare_filename(info))
         except Exception as e:
-            self.logger.warning("Could not extract video info: %s", e)
-            title = f"download_{uuid.uuid4().hex[:8]}"
-            uploader = "Unknown"
+            self.logger.error("yt-dlp failed: %s", e)
+            return None
 
-        output_template = str(self.download_dir / f"{title}.%(ext)s")
+        if not output.is_file():
+            self.logger.error("yt-dlp succeeded but output file not found")
+            return None
+        return self._register_video(
+            output, info.get("title") or output.stem, info.get("uploader") or "Unknown", url
+        )
+
+    def download_videos(self, urls: Iterable[str]) -> List[Optional[str]]:
+        """Download several videos concurrently; returns one path (or None) per URL.
 
+        Overlaps one video's network fetch with another's ffmpeg merge.
+        """
+        urls = list(urls)
+        if not urls:
+            return []
+        workers = max(1, min(self.download_parallelism, len(urls)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.download_video, urls))
+
+    def _download_video_cli(self, url: str, job_id: Optional[str] = None) -> Optional[str]:
+        """Fallback for :meth:`download_video` when the yt_dlp module is unavailable."""
+        # One yt-dlp process both downloads and prints two JSON lines: the
+        # title/uploader just before downloading, and the final path once the
+        # file has been merged and moved into place.
         cmd = [
             "yt-dlp",
             "-f",
@@ -109,55 +321,111 @@ class ContentDownloader:
             "--merge-output-format",
             "mp4",
             "-o",
-            output_template,
+            str(self.download_dir / "%(title)s.%(ext)s"),
             "--no-warnings",
+            "--print",
+            "before_dl:%(.{title,uploader})j",
+            "--print",
+            "after_move:%(.{filepath})j",
             "--progress",
+            "--newline",
             url,
         ]
 
         try:
-            proc = subprocess.run(cmd, capture_output=True, text=True, timeout=3600)
+            # Stream output line by line; keep only a tail for error reporting
+            recent_output = deque(maxlen=30)
+            report = self._progress_reporter(job_id)
+            info: Dict[str, Any] = {}
+            with subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
+            ) as proc:
+                watchdog = threading.Timer(3600, proc.kill)
+                watchdog.start()
+                try:
+                    for line in proc.stdout:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        if line.startswith("{"):
+                            try:
+                                info.update(_loads_json(line))
+                                continue
+                            except (TypeError, ValueError):  # not a JSON object after all
+                                pass
+                        recent_output.append(line)
+                        pct_match = _YTDLP_PROGRESS_RE.match(line)
+                        if pct_match:
+                            report(float(pct_match.group(1)))
+                    proc.wait()
+                finally:
+                    timed_out = not watchdog.is_alive()
+                    watchdog.cancel()
+
+            if timed_out:
+                self.logger.error("yt-dlp timed out after 1 hour")
+                return None
             if proc.returncode == 0:
-                # Find the output file
-                for f in self.download_dir.iterdir():
-                    if f.stem == title and f.suffix in (".mp4", ".mkv", ".webm"):
-                        output_path = str(f)
-                        self.logger.info("Video downloaded: %s", output_path)
-
-                        # Register in library
-                        media_id = uuid.uuid4().hex
-                        stat = f.stat()
-                        item = {
-                            "id": media_id,
-                            "title": title,
-                            "filename": f.name,
-                            "file_path": output_path,
-                            "file_size": stat.st_size,
-                            "size_formatted": format_size(stat.st_size),
-                            "created_at": datetime.now().isoformat(),
-                            "modified_at": datetime.now().isoformat(),
-                            "media_type": "video",
-                            "source_url": url,
-                            "artist": uploader,
-                        }
-                        self.app_state.upsert_media(item)
-                        return output_path
+                filepath = info.get("filepath")
+                f = Path(filepath) if filepath else None
+                if f is not None and f.is_file():
+                    return self._register_video(
+                        f, info.get("title") or f.stem, info.get("uploader") or "Unknown", url
+                    )
 
                 self.logger.error("yt-dlp succeeded but output file not found")
                 return None
             else:
-                self.logger.error("yt-dlp failed: %s", proc.stderr)
+                self.logger.error("yt-dlp failed: %s", "\n".join(recent_output))
                 return None
-        except subprocess.TimeoutExpired:
-            self.logger.error("yt-dlp timed out after 1 hour")
-            return None
         except FileNotFoundError:
             self.logger.error("yt-dlp not installed. Install with: pip install yt-dlp")
             return None
 
+    def _progress_reporter(self, job_id: Optional[str]):
+        """Return a callback that records download percentage on *job_id*.
+
+        Updates are only written when the whole-number percentage changes,
+        so a fast download does not turn into thousands of DB commits.
+        """
+        last = [-1]
+
+        def report(pct: float) -> None:
+            if not job_id or int(pct) == last[0]:
+                return
+            last[0] = int(pct)
+            self.app_state.update_job_progress(job_id, round(pct, 1))
+
+        return report
+
+    def _register_video(self, f: Path, title: str, uploader: str, url: str) -> str:
+        """Add a downloaded video to the library and return its path."""
+        output_path = str(f)
+        self.logger.info("Video downloaded: %s", output_path)
+
+        media_id = uuid.uuid4().hex
+        stat = f.stat()
+        now_iso = datetime.now().isoformat()
+        item = {
+            "id": media_id,
+            "title": title,
+            "filename": f.name,
+            "file_path": output_path,
+            "file_size": stat.st_size,
+            "size_formatted": format_size(stat.st_size),
+            "created_at": now_iso,
+            "modified_at": now_iso,
+            "media_type": "video",
+            "source_url": url,
+            "artist": uploader,
+        }
+        with self._db_lock:
+            self.app_state.upsert_media(item)
+        return output_path
+
     # ── Article Archiving ────────────────────────────────────────
 
-    def archive_article(self, url: str, job_id: str = None) -> Optional[str]:
+    def archive_article(self, url: str, job_id: Optional[str] = None) -> Optional[str]:
         """Download and archive a web article as HTML + optional PDF."""
         self.logger.info("Archiving article: %s", url)
 
@@ -180,61 +448,47 @@ class ContentDownloader:
                 self.logger.error("Could not extract article content: %s", url)
                 return None
 
-            article_data = json.loads(result)
+            article_data = _loads_json(result)
             title = sanitize_filename(article_data.get("title", "article"))
             author = article_data.get("author", "Unknown")
-            date_str = article_data.get("date", datetime.now().strftime("%Y-%m-%d"))
+            now = datetime.now()
+            now_iso = now.isoformat()
+            date_str = article_data.get("date", now.strftime("%Y-%m-%d"))
             text = article_data.get("text", "")
 
             # Save as HTML
             safe_title = f"{date_str}_{title}"[:120]
             html_path = self.articles_dir / f"{safe_title}.html"
 
-            html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{article_data.get('title', 'Article')}</title>
-    <style>
-        body {{ font-family: Georgia, serif; max-width: 720px; margin: 2rem auto;
-               padding: 0 1rem; line-height: 1.7; color: #1a1a1a; }}
-        h1 {{ font-size: 1.8rem; margin-bottom: 0.2rem; }}
-        .meta {{ color: #666; font-size: 0.9rem; margin-bottom: 2rem; }}
-        a {{ color: #1a6fbf; }}
-    </style>
-</head>
-<body>
-    <h1>{article_data.get('title', 'Article')}</h1>
-    <div class="meta">
-        <span>By {author}</span> &middot; <span>{date_str}</span>
-        &middot; <a href="{url}">Original</a>
-    </div>
-    <article>{_escape_html(text).replace(chr(10), '<br>')}</article>
-</body>
-</html>"""
+            # Article metadata travels inside the page as schema.org JSON-LD.
+            # "<" is escaped so no value can close the <script> element.
+            metadata = _dumps_json(
+                {
+                    "@context": "https://schema.org",
+                    "@type": "Article",
+                    "url": url,
+                    "headline": article_data.get("title"),
+                    "author": author,
+                    "datePublished": date_str,
+                    "publisher": article_data.get("hostname"),
+                    "archivedAt": now_iso,
+                }
+            )
+            html_content = _ARTICLE_TEMPLATE.format(
+                metadata=metadata.decode("utf-8").replace("<", "\\u003c"),
+                title=_escape_html(article_data.get("title") or "Article"),
+                author=_escape_html(str(author)),
+                date=_escape_html(str(date_str)),
+                url=_escape_html(url),
+                # Escape line by line and join with <br> in a single pass
+                body="<br>".join(map(_escape_html, text.split("\n"))),
+            )
 
             with open(html_path, "w", encoding="utf-8") as f:
                 f.write(html_content)
 
             self.logger.info("Article archived: %s", html_path)
 
-            # Save metadata JSON
-            meta_path = self.articles_dir / f"{safe_title}.json"
-            with open(meta_path, "w", encoding="utf-8") as f:
-                json.dump(
-                    {
-                        "source_url": url,
-                        "title": article_data.get("title"),
-                        "author": author,
-                        "date": date_str,
-                        "hostname": article_data.get("hostname"),
-                        "archived_at": datetime.now().isoformat(),
-                    },
-                    f,
-                    indent=2,
-                )
-
             # Register in library
             media_id = uuid.uuid4().hex
             stat = html_path.stat()
@@ -245,8 +499,8 @@ class ContentDownloader:
                 "file_path": str(html_path),
                 "file_size": stat.st_size,
                 "size_formatted": format_size(stat.st_size),
-                "created_at": datetime.now().isoformat(),
-                "modified_at": datetime.now().isoformat(),
+                "created_at": now_iso,
+                "modified_at": now_iso,
                 "media_type": "document",
                 "source_url": url,
                 "artist": author,
@@ -260,8 +514,17 @@ class ContentDownloader:
 
     # ── Podcast Feed Parsing & Download ──────────────────────────
 
-    def parse_podcast_feed(self, feed_url: str) -> Optional[Dict[str, Any]]:
-        """Parse a podcast RSS feed. Returns feed info dict."""
+    def parse_podcast_feed(
+        self, feed_url: str, pod: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Parse a podcast RSS feed. Returns feed info dict.
+
+        When *pod* carries ``etag`` / ``last_modified`` from a previous fetch
+        the request is conditional; an unchanged feed returns
+        ``{"not_modified": True, "episodes": []}`` without parsing.  Servers
+        that ignore validators are caught by ``feed_hash``: a body identical
+        to the last one parsed is not handed to feedparser again.
+        """
         try:
             import feedparser
         except ImportError:
@@ -269,7 +532,27 @@ class ContentDownloader:
             return None
 
         try:
-            feed = feedparser.parse(feed_url)
+            headers = {}
+            if pod and pod.get("etag"):
+                headers["If-None-Match"] = pod["etag"]
+            if pod and pod.get("last_modified"):
+                headers["If-Modified-Since"] = pod["last_modified"]
+            resp = self._session.get(feed_url, headers=headers, timeout=30)
+            if resp.status_code == 304:
+                return {"not_modified": True, "episodes": []}
+            resp.raise_for_status()
+
+            feed_hash = hashlib.sha256(resp.content).hexdigest()
+            if pod and pod.get("feed_hash") == feed_hash:
+                return {
+                    "not_modified": True,
+                    "episodes": [],
+                    "etag": resp.headers.get("ETag"),
+                    "last_modified": resp.headers.get("Last-Modified"),
+                    "feed_hash": feed_hash,
+                }
+
+            feed = feedparser.parse(resp.content, response_headers=dict(resp.headers))
             if feed.bozo and not feed.entries:
                 self.logger.error("Invalid feed: %s", feed_url)
                 return None
@@ -280,6 +563,9 @@ class ContentDownloader:
                 "description": feed.feed.get("summary", feed.feed.get("subtitle", "")),
                 "artwork_url": None,
                 "episodes": [],
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+                "feed_hash": feed_hash,
             }
 
             # Get artwork
@@ -353,37 +639,37 @@ class ContentDownloader:
             self.logger.warning("Podcast already subscribed: %s", feed_url)
             return None
 
+        # Store episodes
+        self.app_state.add_episodes_bulk(pod_id, feed_info.get("episodes", []))
+
         # Download artwork
-        if feed_info.get("artwork_url"):
+        art_url = feed_info.get("artwork_url")
+        art_bytes = self._fetch_podcast_artwork(art_url) if art_url else None
+        if art_bytes:
             try:
-                import requests
-
-                resp = requests.get(feed_info["artwork_url"], timeout=15)
-                if resp.status_code == 200:
-                    art_path = self.podcast_dir / f"{pod_id}_artwork.jpg"
-                    with open(art_path, "wb") as f:
-                        f.write(resp.content)
-                    self.app_state.update_podcast(pod_id, artwork_path=str(art_path))
-            except Exception as e:
-                self.logger.warning("Could not download podcast artwork: %s", e)
-
-        # Store episodes
-        for ep in feed_info.get("episodes", []):
-            self.app_state.add_episode(
-                podcast_id=pod_id,
-                title=ep["title"],
-                audio_url=ep["audio_url"],
-                duration_seconds=ep.get("duration_seconds"),
-                published_at=ep.get("published_at"),
-                description=ep.get("description", ""),
-            )
+                art_path = self.podcast_dir / f"{pod_id}_artwork.jpg"
+                art_path.write_bytes(art_bytes)
+                self.app_state.update_podcast(pod_id, artwork_path=str(art_path))
+            except OSError as e:
+                self.logger.warning("Could not save podcast artwork: %s", e)
 
         self.logger.info(
-            f"Subscribed to podcast: {feed_info['title']} "
-            f"({len(feed_info.get('episodes', []))} episodes)"
+            "Subscribed to podcast: %s (%d episodes)",
+            feed_info["title"],
+            len(feed_info.get("episodes", [])),
         )
         return pod_id
 
+    def _fetch_podcast_artwork(self, url: str) -> Optional[bytes]:
+        """Download podcast artwork; returns the image bytes or None."""
+        try:
+            resp = self._session.get(url, timeout=15)
+            if resp.status_code == 200:
+                return resp.content
+        except Exception as e:
+            self.logger.warning("Could not download podcast artwork: %s", e)
+        return None
+
     def check_podcast_feeds(self):
         """Check all due podcast feeds for new episodes."""
         due = self.app_state.get_due_podcasts()
@@ -391,53 +677,93 @@ class ContentDownloader:
             return
 
         self.logger.info("Checking %s podcast feeds", len(due))
+        checked_at = datetime.now().isoformat()
+
+        # Feed fetches are network-bound and run concurrently; feed DB writes
+        # stay on this thread as each result arrives.  Auto-downloads go to
+        # the long-lived download pool so episode bodies overlap everything else.
+        workers = self.config.get("podcasts", {}).get("feed_parallelism", 4)
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(due)))) as pool:
+            futures = {
+                pool.submit(self.parse_podcast_feed, pod["feed_url"], pod): pod for pod in due
+            }
+            for future in as_completed(futures):
+                pod = futures[future]
+                try:
+                    feed_info = future.result()
+                    if not feed_info:
+                        continue
+                    for episode_id in self._apply_feed_update(pod, feed_info, checked_at):
+                        self._queue_episode_download(pod["id"], episode_id)
+                except Exception as e:
+                    self.logger.error("Error checking feed %s: %s", pod["feed_url"], e)
+
+    def _queue_episode_download(self, podcast_id: str, episode_id: str) -> None:
+        """Submit an episode to the download pool unless it is already queued."""
+        with self._pending_lock:
+            key = (podcast_id, episode_id)
+            if key in self._pending_episodes:
+                return
+            self._pending_episodes.add(key)
+        future = self._download_pool.submit(self.download_podcast_episode, podcast_id, episode_id)
 
-        for pod in due:
-            try:
-                feed_info = self.parse_podcast_feed(pod["feed_url"])
-                if not feed_info:
-                    continue
+        def _done(_future):
+            with self._pending_lock:
+                self._pending_episodes.discard(key)
 
-                new_count = 0
-                for ep in feed_info.get("episodes", []):
-                    if not self.app_state.episode_exists(pod["id"], ep["audio_url"]):
-                        self.app_state.add_episode(
-                            podcast_id=pod["id"],
-                            title=ep["title"],
-                            audio_url=ep["audio_url"],
-                            duration_seconds=ep.get("duration_seconds"),
-                            published_at=ep.get("published_at"),
-                            description=ep.get("description", ""),
-                        )
-                        new_count += 1
-
-                self.app_state.update_podcast(
-                    pod["id"],
-                    last_checked=datetime.now().isoformat(),
-                    title=feed_info.get("title") or pod["title"],
-                )
+        future.add_done_callback(_done)
 
-                if new_count:
-                    self.logger.info("Podcast '%s': %s new episodes", pod["title"], new_count)
+    def _apply_feed_update(
+        self, pod: Dict[str, Any], feed_info: Dict[str, Any], checked_at: str
+    ) -> List[str]:
+        """Store new episodes from a parsed feed; *checked_at* is the check's timestamp.
 
-                    # Auto-download if enabled
-                    if self.config.get("podcasts", {}).get("auto_download", True):
-                        episodes = self.app_state.get_episodes(pod["id"])
-                        for ep in episodes:
-                            if not ep.get("is_downloaded") and ep.get("audio_url"):
-                                self.download_podcast_episode(pod["id"], ep["id"])
-                                break  # Download one at a time
+        Returns the ids of the episodes to auto-download (possibly empty).
+        """
+        known = self.app_state.get_known_audio_urls(pod["id"])
+        new_episodes = []
+        for ep in feed_info.get("episodes", []):
+            if ep["audio_url"] not in known:
+                known.add(ep["audio_url"])  # also drops repeats within the feed
+                new_episodes.append(ep)
+        new_count = self.app_state.add_episodes_bulk(pod["id"], new_episodes)
+
+        # A 304 carries no validators, so the stored ones are kept
+        validators = {
+            key: feed_info[key]
+            for key in ("etag", "last_modified", "feed_hash")
+            if key in feed_info
+        }
+        self.app_state.update_podcast(
+            pod["id"],
+            last_checked=checked_at,
+            title=feed_info.get("title") or pod["title"],
+            **validators,
+        )
 
-            except Exception as e:
-                self.logger.error("Error checking feed %s: %s", pod["feed_url"], e)
+        if new_count:
+            self.logger.info("Podcast '%s': %s new episodes", pod["title"], new_count)
+
+            # Auto-download if enabled, a bounded number of episodes per check
+            pod_cfg = self.config.get("podcasts", {})
+            if pod_cfg.get("auto_download", True):
+                limit = pod_cfg.get("auto_download_per_check", 4)
+                pending = [
+                    ep["id"]
+                    for ep in self.app_state.get_episodes(pod["id"])
+                    if not ep.get("is_downloaded") and ep.get("audio_url")
+                ]
+                return pending[:limit]
+        return []
 
     def download_podcast_episode(self, podcast_id: str, episode_id: str) -> Optional[str]:
         """Download a single podcast episode."""
         pod = self.app_state.get_podcast(podcast_id)
-        episodes = self.app_state.get_episodes(podcast_id)
-        episode = next((e for e in episodes if e["id"] == episode_id), None)
+        episode = self.app_state.get_episode(episode_id)
 
-        if not pod or not episode or not episode.get("audio_url"):
+        if not pod or not episode or episode["podcast_id"] != podcast_id:
+            return None
+        if not episode.get("audio_url"):
             return None
 
         pod_title = sanitize_filename(pod.get("title", "podcast"))
@@ -445,29 +771,24 @@ class ContentDownloader:
         pod_dir = self.podcast_dir / pod_title
         pod_dir.mkdir(parents=True, exist_ok=True)
 
-        ext = ".mp3"
         audio_url = episode["audio_url"]
-        if ".m4a" in audio_url:
-            ext = ".m4a"
-        elif ".ogg" in audio_url:
-            ext = ".ogg"
-
-        out_path = pod_dir / f"{ep_title}{ext}"
 
         try:
-            import requests
-
-            resp = requests.get(audio_url, stream=True, timeout=300)
+            resp = self._session.get(audio_url, stream=True, timeout=300)
             resp.raise_for_status()
-            with open(out_path, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    f.write(chunk)
-
-            self.app_state.update_episode(episode_id, file_path=str(out_path), is_downloaded=1)
+            ext = _episode_extension(resp.headers.get("Content-Type", ""), audio_url)
+            out_path = pod_dir / f"{ep_title}{ext}"
+            # Copy straight from the socket; undo any gzip/deflate transfer encoding
+            resp.raw.decode_content = True
+            with open(out_path, "wb", buffering=DOWNLOAD_WRITE_BUFFER) as f:
+                _advise_sequential(f)
+                shutil.copyfileobj(resp.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+                _drop_from_page_cache(f)
 
             # Also add to main library
             stat = out_path.stat()
             media_id = uuid.uuid4().hex
+            now_iso = datetime.now().isoformat()
             item = {
                 "id": media_id,
                 "title": episode["title"],
@@ -475,14 +796,17 @@ class ContentDownloader:
                 "file_path": str(out_path),
                 "file_size": stat.st_size,
                 "size_formatted": format_size(stat.st_size),
-                "created_at": datetime.now().isoformat(),
-                "modified_at": datetime.now().isoformat(),
+                "created_at": now_iso,
+                "modified_at": now_iso,
                 "media_type": "audio",
                 "source_url": audio_url,
                 "artist": pod.get("author", ""),
                 "duration_seconds": episode.get("duration_seconds"),
             }
-            self.app_state.upsert_media(item)
+            # Feed checks run several episode downloads at once
+            with self._db_lock:
+                self.app_state.update_episode(episode_id, file_path=str(out_path), is_downloaded=1)
+                self.app_state.upsert_media(item)
 
             self.logger.info("Episode downloaded: %s", out_path)
             return str(out_path)
@@ -501,7 +825,7 @@ class ContentDownloader:
         self.logger.info("Importing Spotify playlist: %s", url)
 
         # Extract playlist ID from various Spotify URL formats
-        match = re.search(r"playlist[/:]([A-Za-z0-9]+)", url)
+        match = _PLAYLIST_ID_RE.search(url)
         if not match:
             self.logger.error("Could not extract playlist ID from URL: %s", url)
             return None
@@ -539,59 +863,65 @@ class ContentDownloader:
             "AppleWebKit/537.36 (KHTML, like Gecko) "
             "Chrome/120.0.0.0 Safari/537.36",
         }
-        req = Request(embed_url, headers=headers)
-        response = urlopen(req, timeout=30)
-        html = response.read().decode("utf-8", errors="replace")
+        # oEmbed is cheap and always carries the title; start it now so its
+        # round trip overlaps the (much larger) embed page download.
+        oembed_pool = ThreadPoolExecutor(max_workers=1)
+        oembed_future = oembed_pool.submit(self._fetch_spotify_oembed_title, playlist_id, headers)
+        oembed_pool.shutdown(wait=False)
+
+        response = self._session.get(embed_url, headers=headers, timeout=30)
+        response.raise_for_status()
+        html = response.content
 
         tracks = []
         playlist_title = None
 
         # Extract the __NEXT_DATA__ or resource JSON embedded in the page
         # Spotify embed pages include a <script id="__NEXT_DATA__"> tag
-        next_data_match = re.search(
-            r'<script\s+id="__NEXT_DATA__"[^>]*>(.*?)</script>', html, re.DOTALL
-        )
+        next_data_match = _NEXT_DATA_RE.search(html)
         if next_data_match:
             try:
-                data = json.loads(next_data_match.group(1))
+                data = _loads_json(next_data_match.group(1))
                 # Navigate the JSON structure for track data
                 tracks, playlist_title = self._parse_next_data(data)
                 if tracks:
                     return tracks, playlist_title
-            except (json.JSONDecodeError, KeyError) as e:
+            except (ValueError, KeyError) as e:
                 self.logger.debug("__NEXT_DATA__ parse failed: %s", e)
 
         # Fallback: try to find any JSON with track info
-        json_blocks = re.findall(
-            r'<script[^>]*type="application/json"[^>]*>(.*?)</script>', html, re.DOTALL
-        )
+        json_blocks = _JSON_BLOCK_RE.findall(html)
         for block in json_blocks:
             try:
-                data = json.loads(block)
+                data = _loads_json(block)
                 tracks, playlist_title = self._parse_next_data(data)
                 if tracks:
                     return tracks, playlist_title
-            except (json.JSONDecodeError, KeyError):
+            except (ValueError, KeyError):
                 continue
 
-        # Last fallback: try the oEmbed API for at least the title
+        # Last fallback: the oEmbed API for at least the title
+        playlist_title = oembed_future.result() or playlist_title
+
+        # Try scraping the regular playlist page for meta tags
+        if not tracks:
+            tracks, scraped_title = self._scrape_spotify_page(playlist_id, headers)
+            playlist_title = scraped_title or playlist_title
+
+        return tracks, playlist_title
+
+    def _fetch_spotify_oembed_title(self, playlist_id: str, headers: Dict[str, str]):
+        """Return the playlist title from Spotify's oEmbed API, or None."""
         try:
             oembed_url = (
                 f"https://open.spotify.com/oembed?url="
                 f"https://open.spotify.com/playlist/{playlist_id}"
             )
-            req2 = Request(oembed_url, headers=headers)
-            resp2 = urlopen(req2, timeout=15)
-            oembed = json.loads(resp2.read().decode("utf-8"))
-            playlist_title = oembed.get("title", playlist_title)
+            resp = self._session.get(oembed_url, headers=headers, timeout=15)
+            resp.raise_for_status()
+            return _loads_json(resp.content).get("title")
         except Exception:
-            pass
-
-        # Try scraping the regular playlist page for meta tags
-        if not tracks:
-            tracks, playlist_title = self._scrape_spotify_page(playlist_id, headers)
-
-        return tracks, playlist_title
+            return None
 
     def _parse_next_data(self, data):
         """Parse Spotify __NEXT_DATA__ JSON for track listings."""
@@ -612,7 +942,9 @@ class ContentDownloader:
                     playlist_art = sources[0].get("url", "")
 
             for t in entity.get("trackList", []):
-                track_info = self._extract_track_info(t, playlist_art)
+                track_info = _extract_embed_track(t, playlist_art) or self._extract_track_info(
+                    t, playlist_art
+                )
                 if track_info:
                     tracks.append(track_info)
             if tracks:
@@ -620,36 +952,42 @@ class ContentDownloader:
         except (KeyError, TypeError):
             pass
 
-        # Fallback: walk the JSON tree looking for track-like objects
-        def walk(obj, depth=0):
-            nonlocal title
-            if depth > 15:
-                return
+        # Fallback: walk the JSON tree looking for track-like objects.
+        # Iterative pre-order DFS; children are pushed reversed so tracks
+        # come out in document order.
+        stack = [(data, 0)]
+        while stack and len(tracks) < SPOTIFY_MAX_TRACKS:
+            obj, depth = stack.pop()
             if isinstance(obj, dict):
-                if "track" in obj and isinstance(obj["track"], dict):
-                    t = obj["track"]
-                    track_info = self._extract_track_info(t)
-                    if track_info:
-                        tracks.append(track_info)
-                elif obj.get("type") == "track" and (obj.get("name") or obj.get("title")):
-                    track_info = self._extract_track_info(obj)
+                get = obj.get
+                candidate = None
+                nested = get("track")
+                if isinstance(nested, dict):
+                    candidate = nested
+                elif get("type") == "track" and (get("name") or get("title")):
+                    candidate = obj
+                elif get("entityType") == "track" and get("title"):
+                    candidate = obj
+                if candidate is not None:
+                    track_info = self._extract_track_info(candidate)
                     if track_info:
                         tracks.append(track_info)
-                elif obj.get("entityType") == "track" and obj.get("title"):
-                    track_info = self._extract_track_info(obj)
-                    if track_info:
-                        tracks.append(track_info)
-                if obj.get("type") == "playlist" or obj.get("__typename") == "Playlist":
-                    title = title or obj.get("name")
-                if "name" in obj and "trackList" in obj:
-                    title = title or obj.get("name")
-                for v in obj.values():
-                    walk(v, depth + 1)
+                if not title and (
+                    get("type") == "playlist"
+                    or get("__typename") == "Playlist"
+                    or ("name" in obj and "trackList" in obj)
+                ):
+                    title = get("name")
+                children = obj.values()
             elif isinstance(obj, list):
-                for item in obj:
-                    walk(item, depth + 1)
+                children = obj
+            else:
+                continue
+            if depth < 15:
+                stack.extend(
+                    (v, depth + 1) for v in reversed(children) if isinstance(v, (dict, list))
+                )
 
-        walk(data)
         return tracks, title
 
     def _extract_track_info(self, t, fallback_artwork=""):
@@ -664,7 +1002,7 @@ class ContentDownloader:
             artist_names = [a.get("name", "") for a in artists if isinstance(a, dict)]
             artist = ", ".join(filter(None, artist_names))
         else:
-            artist = t.get("subtitle", "") or str(artists) if artists else ""
+            artist = t.get("subtitle", "") or (str(artists) if artists else "")
 
         album_obj = t.get("album", {})
         album = album_obj.get("name", "") if isinstance(album_obj, dict) else ""
@@ -706,22 +1044,20 @@ class ContentDownloader:
         title = None
         try:
             page_url = f"https://open.spotify.com/playlist/{playlist_id}"
-            req = Request(page_url, headers=headers)
-            resp = urlopen(req, timeout=30)
-            html = resp.read().decode("utf-8", errors="replace")
+            resp = self._session.get(page_url, headers=headers, timeout=30)
+            resp.raise_for_status()
+            html = resp.content
 
             # Extract title from <title> or og:title
-            title_match = re.search(r'<meta\s+property="og:title"\s+content="([^"]+)"', html)
+            title_match = _OG_TITLE_RE.search(html)
             if title_match:
-                title = title_match.group(1)
+                title = title_match.group(1).decode("utf-8", errors="replace")
 
             # Try to parse Spotify's structured data
-            ld_matches = re.findall(
-                r'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>', html, re.DOTALL
-            )
+            ld_matches = _LD_JSON_RE.findall(html)
             for ld in ld_matches:
                 try:
-                    data = json.loads(ld)
+                    data = _loads_json(ld)
                     if isinstance(data, dict) and "track" in data:
                         for t in data["track"]:
                             if isinstance(t, dict):
@@ -736,19 +1072,18 @@ class ContentDownloader:
                                         "isrc": "",
                                     }
                                 )
-                except json.JSONDecodeError:
+                except ValueError:  # bad JSON or invalid UTF-8
                     continue
 
             # If still no tracks, try a simpler regex scrape of meta tags
             if not tracks:
                 # Spotify pages include music:song tags
-                song_titles = re.findall(
-                    r'<meta\s+name="music:song"\s+content="[^"]*?/track/[^"]*"' r"[^>]*/?>", html
-                )
+                song_titles = _MUSIC_SONG_RE.findall(html)
                 if song_titles:
                     self.logger.info(
-                        f"Found {len(song_titles)} song references via meta tags"
-                        " but cannot get full details without API access"
+                        "Found %d song references via meta tags"
+                        " but cannot get full details without API access",
+                        len(song_titles),
                     )
         except Exception as e:
             self.logger.debug("Scrape fallback failed: %s", e)
@@ -788,12 +1123,14 @@ class ContentDownloader:
     def _parse_duration(duration_str: str) -> Optional[float]:
         """Parse iTunes duration string (HH:MM:SS or seconds) to float."""
         try:
-            if ":" in duration_str:
-                parts = duration_str.split(":")
-                if len(parts) == 3:
-                    return int(parts[0]) * 3600 + int(parts[1]) * 60 + float(parts[2])
-                elif len(parts) == 2:
-                    return int(parts[0]) * 60 + float(parts[1])
+            # One split covers both shapes; a fourth field stays glued to the
+            # seconds and fails float(), as before.
+            parts = duration_str.split(":", 2)
+            n = len(parts)
+            if n == 3:
+                return int(parts[0]) * 3600 + int(parts[1]) * 60 + float(parts[2])
+            if n == 2:
+                return int(parts[0]) * 60 + float(parts[1])
             return float(duration_str)
-        except (ValueError, TypeError):
+        except (ValueError, AttributeError):
             return None
@@ -2,24 +2,313 @@
 Disc detection and automatic ripping daemon
 """
 
+import functools
+import hashlib
 import json
+import os
+import plistlib
+import re
+import select
 import shutil
 import signal
+import sqlite3
+import struct
+import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Set
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 from .config import load_config
 from .constants import AUDIO_CD_EXTENSIONS, IGNORE_VOLUMES
 from .metadata import MetadataExtractor
 from .ripper import Ripper
-from .utils import configure_notifications, send_notification, setup_logger
+from .utils import configure_notifications, get_data_dir, send_notification, setup_logger
 
 if TYPE_CHECKING:
     from .app_state import AppState
 
 
+_PROC_MOUNTS = "/proc/self/mounts"
+_MAX_PROBE_WORKERS = 8  # concurrent ffprobe processes per audio CD
+# Per-title duration line in `HandBrakeCLI --scan` output
+_HB_DURATION_RE = re.compile(r"\+ duration:\s+(\d+):(\d+):(\d+)")
+# Titles shorter than this are menus/logos; HandBrake skips them by default too
+_MIN_TITLE_SECONDS = 10
+# Volume-name noise dropped by extract_title_from_volume ("_" becomes a space)
+_TITLE_CLEAN_RE = re.compile(r"DISC|DVD|_")
+_DVD_SECTOR = 2048
+_BD_TICKS_PER_SECOND = 45000
+_CD_SECTORS_PER_SECOND = 75
+
+
+def _clean_title_token(match: "re.Match[str]") -> str:
+    """Replacement for _TITLE_CLEAN_RE: underscores become spaces, markers vanish."""
+    return " " if match.group(0) == "_" else ""
+
+
+def _unescape_mount(field: str) -> str:
+    """Undo the octal escaping of whitespace in a /proc mounts field."""
+    return re.sub(r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), field)
+
+
+def _bcd(byte: int) -> int:
+    """Decode a packed binary-coded-decimal byte."""
+    return (byte >> 4) * 10 + (byte & 0x0F)
+
+
+def _read_pcm_duration(path: Path) -> Optional[float]:
+    """Return the duration of an AIFF or WAV file from its header, or None.
+
+    Walks the top-level chunks for the format and size fields only, so no
+    sample data is read.
+    """
+    with open(path, "rb") as f:
+        header = f.read(12)
+        if len(header) < 12:
+            return None
+        if header[:4] == b"FORM" and header[8:12] in (b"AIFF", b"AIFC"):
+            order = ">"
+        elif header[:4] == b"RIFF" and header[8:12] == b"WAVE":
+            order = "<"
+        else:
+            return None
+        byte_rate = None
+        while True:
+            chunk = f.read(8)
+            if len(chunk) < 8:
+                return None
+            chunk_id = chunk[:4]
+            (size,) = struct.unpack(order + "I", chunk[4:])
+            if chunk_id == b"COMM":
+                # channels, sample frames, sample size, 80-bit extended sample rate
+                _, frames, _, exponent, mantissa = struct.unpack(">hIhHQ", f.read(18))
+                rate = mantissa * 2.0 ** ((exponent & 0x7FFF) - 16383 - 63)
+                return frames / rate if rate else None
+            if chunk_id == b"fmt ":
+                (byte_rate,) = struct.unpack("<I", f.read(16)[8:12])
+                f.seek(size - 16 + (size & 1), os.SEEK_CUR)
+            elif chunk_id == b"data" and order == "<":
+                return size / byte_rate if byte_rate else None
+            else:
+                f.seek(size + (size & 1), os.SEEK_CUR)
+
+
+def _read_dvd_title_durations(video_ts: Path) -> List[int]:
+    """Return the runtime in seconds of every title on a DVD.
+
+    Reads the title table in ``VIDEO_TS.IFO`` and, for each title, the
+    playback time of its entry program chain in the owning ``VTS_xx_0.IFO``.
+    Returns an empty list if the IFO files are missing or malformed.
+    """
+    vmg = (video_ts / "VIDEO_TS.IFO").read_bytes()
+    if vmg[:12] != b"DVDVIDEO-VMG":
+        return []
+    (tt_srpt,) = struct.unpack_from(">I", vmg, 0xC4)
+    base = tt_srpt * _DVD_SECTOR
+    (title_count,) = struct.unpack_from(">H", vmg, base)
+
+    vts_cache: Dict[int, bytes] = {}
+    durations = []
+    for i in range(title_count):
+        vts_number, vts_title = struct.unpack_from(">BB", vmg, base + 8 + i * 12 + 6)
+        if vts_number not in vts_cache:
+            vts_cache[vts_number] = (video_ts / f"VTS_{vts_number:02d}_0.IFO").read_bytes()
+        seconds = _vts_title_seconds(vts_cache[vts_number], vts_title)
+        if seconds is not None:
+            durations.append(seconds)
+    return durations
+
+
+def _vts_title_seconds(vts: bytes, vts_title: int) -> Optional[int]:
+    """Return the playback time of *vts_title*'s entry PGC in a VTS IFO."""
+    if vts[:12] != b"DVDVIDEO-VTS":
+        return None
+    (pgci_sector,) = struct.unpack_from(">I", vts, 0xCC)
+    pgci = pgci_sector * _DVD_SECTOR
+    (pgc_count,) = struct.unpack_from(">H", vts, pgci)
+    for i in range(pgc_count):
+        category, offset = struct.unpack_from(">II", vts, pgci + 8 + i * 8)
+        # Bit 31 marks an entry PGC; bits 24-30 hold the VTS title number
+        if category >> 31 and (category >> 24) & 0x7F == vts_title:
+            hours, minutes, secs = struct.unpack_from(">BBB", vts, pgci + offset + 4)
+            return _bcd(hours) * 3600 + _bcd(minutes) * 60 + _bcd(secs)
+    return None
+
+
+def _read_bluray_title_durations(bdmv: Path) -> List[int]:
+    """Return the runtime in seconds of every playlist on a Blu-ray.
+
+    Sums the IN/OUT times of the play items in each ``PLAYLIST/*.mpls``.
+    """
+    durations = []
+    with os.scandir(bdmv / "PLAYLIST") as it:
+        names = sorted(e.name for e in it if e.name.lower().endswith(".mpls"))
+    for name in names:
+        data = (bdmv / "PLAYLIST" / name).read_bytes()
+        if data[:4] != b"MPLS":
+            continue
+        (playlist,) = struct.unpack_from(">I", data, 8)
+        (item_count,) = struct.unpack_from(">H", data, playlist + 6)
+        pos = playlist + 10
+        ticks = 0
+        for _ in range(item_count):
+            (length,) = struct.unpack_from(">H", data, pos)
+            in_time, out_time = struct.unpack_from(">II", data, pos + 14)
+            ticks += out_time - in_time
+            pos += 2 + length
+        durations.append(ticks // _BD_TICKS_PER_SECOND)
+    return durations
+
+
+class _MountWatcher:
+    """Block until the kernel mount table changes.
+
+    Linux flags ``/proc/self/mounts`` with ``POLLPRI`` whenever a filesystem
+    is mounted or unmounted, so the monitor can sleep in ``epoll`` instead of
+    rescanning the mount path every few seconds.  A self-pipe lets
+    :meth:`wake` interrupt a pending :meth:`wait`.
+    """
+
+    def __init__(self):
+        self._fd = os.open(_PROC_MOUNTS, os.O_RDONLY)
+        self._wake_r, self._wake_w = os.pipe()
+        self._epoll = select.epoll()
+        self._epoll.register(self._fd, select.EPOLLPRI | select.EPOLLERR)
+        self._epoll.register(self._wake_r, select.EPOLLIN)
+        self._drain_mounts()
+
+    @classmethod
+    def create(cls) -> Optional["_MountWatcher"]:
+        """Return a watcher, or None where mount events are unavailable (macOS)."""
+        if not hasattr(select, "epoll") or not os.path.exists(_PROC_MOUNTS):
+            return None
+        try:
+            return cls()
+        except OSError:
+            return None
+
+    def _drain_mounts(self) -> None:
+        # The POLLPRI flag stays raised until the table is re-read from the start
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        while os.read(self._fd, 65536):
+            pass
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Sleep until the mount table changes, :meth:`wake` or *timeout*.
+
+        Returns True if the mount table changed.
+        """
+        changed = False
+        for fd, _ in self._epoll.poll(-1 if timeout is None else timeout):
+            if fd == self._fd:
+                self._drain_mounts()
+                changed = True
+            else:
+                os.read(self._wake_r, 512)
+        return changed
+
+    def wake(self) -> None:
+        """Interrupt a blocked :meth:`wait` (safe from another thread)."""
+        try:
+            os.write(self._wake_w, b"x")
+        except OSError:  # already closed by the monitor loop
+            pass
+
+    def close(self) -> None:
+        self._epoll.close()
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            os.close(fd)
+
+
+# Directory (relative to the volume) whose listing identifies a disc's content
+_FINGERPRINT_DIRS = {"dvd": "VIDEO_TS", "bluray": "BDMV/STREAM", "audio_cd": "."}
+
+
+def _is_audio_cd_track(name: str) -> bool:
+    """Return True if *name* looks like an audio CD track file."""
+    return os.path.splitext(name)[1].lower() in AUDIO_CD_EXTENSIONS
+
+
+def _classify_volume(path: str) -> str:
+    """Return a volume's disc type from one directory listing.
+
+    Raises OSError if the volume can't be listed (e.g. still spinning up).
+    """
+    disc_type = "unknown"
+    with os.scandir(path) as it:
+        for entry in it:
+            name = entry.name
+            if name == "VIDEO_TS":
+                return "dvd"
+            if name == "BDMV":
+                disc_type = "bluray"
+            elif disc_type == "unknown" and _is_audio_cd_track(name):
+                disc_type = "audio_cd"
+    return disc_type
+
+
+def _dir_stamp(path: str) -> Optional[Tuple[int, int, int]]:
+    """A directory's (device, inode, mtime), or None if it can't be stat'ed."""
+    try:
+        st = os.stat(path, follow_symlinks=False)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino, st.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=16)
+def _classify_mounted(path: str, st_dev: int, st_ino: int, st_mtime_ns: int) -> str:
+    """Memoised _classify_volume for a mounted volume.
+
+    Keyed on the volume root's device and inode, which change whenever a
+    different filesystem is mounted there, and its mtime, which changes when
+    entries appear in a directory not yet mounted over. A poll therefore only
+    re-reads a volume after one of those changes. Listing errors propagate
+    and are never cached.
+    """
+    return _classify_volume(path)
+
+
+class _DiscHintsCache:
+    """SQLite store of disc hints keyed by a content fingerprint.
+
+    Re-inserting a disc already seen skips the HandBrake scan / ffprobe pass.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS hints ("
+            "content_hash TEXT PRIMARY KEY, disc_type TEXT NOT NULL, "
+            "hints_json TEXT NOT NULL, created_at INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """Return the cached hints for *content_hash*, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT hints_json FROM hints WHERE content_hash = ?", (content_hash,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, content_hash: str, disc_type: str, hints: Dict[str, Any]) -> None:
+        """Store *hints* under *content_hash*, replacing any previous entry."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO hints "
+                "(content_hash, disc_type, hints_json, created_at) VALUES (?, ?, ?, ?)",
+                (content_hash, disc_type, json.dumps(hints), int(time.time())),
+            )
+            self._conn.commit()
+
+
 class DiscMonitor:
     """Monitors for disc insertion and triggers automatic ripping"""
 
@@ -56,8 +345,27 @@ class DiscMonitor:
 
         self.mount_path = Path(self.config["disc_detection"]["mount_path"])
         self.check_interval = self.config["disc_detection"]["check_interval_seconds"]
+        self._mtime_fast_path = self.config["disc_detection"].get("mtime_fast_path", True)
+        self._last_mount_mtime: Optional[int] = None
+        self._last_volumes: Set[str] = set()
+        # Non-disc directories seen by the last scan: path -> (dev, ino, mtime)
+        self._non_disc_dirs: Dict[str, Tuple[int, int, int]] = {}
+        self._ffprobe_timeout = self.config["disc_detection"].get("ffprobe_timeout", 10)
+        self._scan_timeout = self.config["disc_detection"].get("handbrake_scan_timeout", 60)
         self.known_volumes: Set[str] = set()
         self.running = False
+        self._watcher: Optional[_MountWatcher] = None
+        self._hints_cache: Optional[_DiscHintsCache] = None
+        # Discs are processed off the poll loop, one at a time (a drive can't
+        # be scanned or ripped twice at once)
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="disc-worker")
+        # Disc type per volume name, as found by the last get_mounted_volumes() scan
+        self._disc_types: Dict[str, str] = {}
+        # Volumes processed successfully, kept across restarts: name -> mount
+        # stamp. Written by the disc worker and pruned by the poll loop.
+        self._seen_path = get_data_dir() / "known_volumes.json"
+        self._seen_volumes: Dict[str, List[float]] = self._load_seen_volumes()
+        self._seen_lock = threading.Lock()
 
         # Resolve tool paths for environments with minimal PATH
         self._ffprobe = shutil.which("ffprobe") or "ffprobe"
@@ -75,21 +383,59 @@ class DiscMonitor:
         Returns:
             Set of volume names
         """
-        volumes = set()
+        # Polling only: the mount point's mtime changes whenever a volume
+        # directory is added or removed, so an unchanged mtime means the
+        # last scan still holds. (Mount events already signal every change.)
+        # Mounting a disc over an existing directory leaves that mtime alone,
+        # so directories that weren't discs yet are re-checked on their own.
+        mount_mtime = None
+        if self._mtime_fast_path and self._watcher is None:
+            try:
+                mount_mtime = self.mount_path.stat().st_mtime_ns
+            except OSError:
+                pass
+            if (
+                mount_mtime is not None
+                and mount_mtime == self._last_mount_mtime
+                and all(_dir_stamp(path) == stamp for path, stamp in self._non_disc_dirs.items())
+            ):
+                return set(self._last_volumes)
 
-        if not self.mount_path.exists():
-            return volumes
+        volumes = set()
+        disc_types: Dict[str, str] = {}
+        non_disc_dirs: Dict[str, Tuple[int, int, int]] = {}
+        complete = True
 
         try:
-            for item in self.mount_path.iterdir():
-                if item.is_dir() and item.name not in self.ignore_volumes:
-                    # Check if it looks like a disc (has VIDEO_TS or similar)
-                    if self.is_disc_volume(item):
-                        volumes.add(item.name)
+            with os.scandir(self.mount_path) as it:
+                for entry in it:
+                    if entry.name in self.ignore_volumes or not entry.is_dir(follow_symlinks=False):
+                        continue
+                    # One readdir per mount decides both "is it a disc" and its type
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                        disc_type = _classify_mounted(
+                            entry.path, st.st_dev, st.st_ino, st.st_mtime_ns
+                        )
+                    except OSError:
+                        complete = False  # e.g. still spinning up; look again next poll
+                        continue
+                    if disc_type != "unknown":
+                        volumes.add(entry.name)
+                        disc_types[entry.name] = disc_type
+                    else:
+                        non_disc_dirs[entry.path] = (st.st_dev, st.st_ino, st.st_mtime_ns)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             self.logger.error("Error scanning volumes: %s", e)
+            complete = False
 
-        return volumes
+        self._disc_types = disc_types
+        self._non_disc_dirs = non_disc_dirs
+        self._last_mount_mtime = mount_mtime if complete else None
+        self._last_volumes = volumes
+        return set(volumes)
 
     def is_disc_volume(self, volume_path: Path) -> bool:
         """
@@ -101,19 +447,7 @@ class DiscMonitor:
         Returns:
             True if it appears to be a disc
         """
-        # Check for VIDEO_TS directory (DVD)
-        if (volume_path / "VIDEO_TS").exists():
-            return True
-
-        # Check for BDMV directory (Blu-ray)
-        if (volume_path / "BDMV").exists():
-            return True
-
-        # Check for audio CD (.aiff/.cda files directly in volume)
-        if self.is_audio_cd(volume_path):
-            return True
-
-        return False
+        return self.get_disc_type(volume_path) != "unknown"
 
     def is_audio_cd(self, volume_path: Path) -> bool:
         """
@@ -127,16 +461,14 @@ class DiscMonitor:
             True if it appears to be an audio CD
         """
         try:
-            for item in volume_path.iterdir():
-                if item.suffix.lower() in AUDIO_CD_EXTENSIONS:
-                    return True
-        except (PermissionError, OSError):
-            pass
-        return False
+            with os.scandir(volume_path) as it:
+                return any(_is_audio_cd_track(entry.name) for entry in it)
+        except OSError:
+            return False
 
     def get_disc_type(self, volume_path: Path) -> str:
         """
-        Determine the type of disc.
+        Determine the type of disc from a single directory listing.
 
         Args:
             volume_path: Path to volume
@@ -144,13 +476,10 @@ class DiscMonitor:
         Returns:
             'dvd', 'bluray', 'audio_cd', or 'unknown'
         """
-        if (volume_path / "VIDEO_TS").exists():
-            return "dvd"
-        if (volume_path / "BDMV").exists():
-            return "bluray"
-        if self.is_audio_cd(volume_path):
-            return "audio_cd"
-        return "unknown"
+        try:
+            return _classify_volume(str(volume_path))
+        except OSError:
+            return "unknown"
 
     def get_audio_cd_info(self, volume_path: Path) -> dict:
         """
@@ -162,8 +491,6 @@ class DiscMonitor:
         Returns:
             Dict with track_count, total_duration, track_durations, etc.
         """
-        import subprocess
-
         info = {
             "track_count": 0,
             "total_duration_seconds": 0,
@@ -171,49 +498,131 @@ class DiscMonitor:
             "track_files": [],
         }
         try:
-            audio_files = sorted(
-                [
-                    f
-                    for f in volume_path.iterdir()
-                    if f.suffix.lower() in {".aiff", ".aif", ".wav", ".cda"}
-                ]
-            )
+            with os.scandir(volume_path) as it:
+                audio_files = sorted(
+                    Path(entry.path) for entry in it if _is_audio_cd_track(entry.name)
+                )
             info["track_count"] = len(audio_files)
             info["track_files"] = [str(f) for f in audio_files]
             if audio_files:
                 info["sample_track_path"] = str(audio_files[0])
 
-            for audio_file in audio_files:
-                try:
-                    result = subprocess.run(
-                        [
-                            self._ffprobe,
-                            "-v",
-                            "quiet",
-                            "-print_format",
-                            "json",
-                            "-show_format",
-                            str(audio_file),
-                        ],
-                        capture_output=True,
-                        text=True,
-                        timeout=10,
-                    )
-                    data = json.loads(result.stdout)
-                    duration = float(data.get("format", {}).get("duration", 0))
-                    info["track_durations"].append(duration)
-                    info["total_duration_seconds"] += duration
-                except Exception as e:
-                    self.logger.debug("ffprobe failed for %s: %s", audio_file.name, e)
+            # The disc's TOC gives every track length in one read
+            toc = self._read_toc(volume_path)
+            if toc:
+                info.update(toc)
+            # Otherwise each probe is independent, so run them side by side;
+            # map() keeps the durations in track order.
+            elif audio_files:
+                workers = min(_MAX_PROBE_WORKERS, len(audio_files))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    for duration in pool.map(self._probe_duration, audio_files):
+                        if duration is not None:
+                            info["track_durations"].append(duration)
+                            info["total_duration_seconds"] += duration
 
             self.logger.info(
-                f"Audio CD info: {info['track_count']} tracks, "
-                f"{info['total_duration_seconds']:.0f}s total"
+                "Audio CD info: %d tracks, %.0fs total",
+                info["track_count"],
+                info["total_duration_seconds"],
             )
         except Exception as e:
             self.logger.error("Error reading audio CD info: %s", e)
         return info
 
+    def _read_toc(self, volume_path: Path) -> Optional[Dict[str, Any]]:
+        """Read an audio CD's table of contents with libdiscid.
+
+        Returns the MusicBrainz disc ID, TOC string and per-track durations,
+        or None when python-libdiscid is not installed or the device has no
+        readable TOC (e.g. a folder of ripped AIFF files).
+        """
+        try:
+            import libdiscid
+        except ImportError:
+            return None
+        device = self._device_for(volume_path)
+        if not device:
+            return None
+        try:
+            disc = libdiscid.read(device)
+        except Exception as e:
+            self.logger.debug("Could not read TOC from %s: %s", device, e)
+            return None
+        durations = [length / _CD_SECTORS_PER_SECOND for length in disc.track_lengths]
+        return {
+            "discid": disc.id,
+            "toc": disc.toc,
+            "track_count": len(durations),
+            "track_offsets": list(disc.track_offsets),
+            "track_durations": durations,
+            "total_duration_seconds": sum(durations),
+        }
+
+    def _device_for(self, volume_path: Path) -> Optional[str]:
+        """Return the block device a volume is mounted from, or None."""
+        if sys.platform == "darwin":
+            try:
+                result = subprocess.run(
+                    ["diskutil", "info", "-plist", str(volume_path)],
+                    capture_output=True,
+                    timeout=10,
+                )
+                return plistlib.loads(result.stdout).get("DeviceNode")
+            except Exception as e:
+                self.logger.debug("diskutil failed for %s: %s", volume_path, e)
+                return None
+        try:
+            with open(_PROC_MOUNTS, encoding="utf-8") as f:
+                for line in f:
+                    fields = line.split()
+                    # Mount points escape spaces etc. as octal (\040)
+                    if len(fields) > 1 and _unescape_mount(fields[1]) == str(volume_path):
+                        return fields[0] if fields[0].startswith("/dev/") else None
+        except OSError:
+            pass
+        return None
+
+    def _probe_duration(self, audio_file: Path) -> Optional[float]:
+        """Return the duration of *audio_file* in seconds, or None.
+
+        AIFF/WAV tracks are timed from their headers; anything else (or a
+        header that can't be parsed) goes through ffprobe.
+        """
+        try:
+            duration = _read_pcm_duration(audio_file)
+        except (OSError, struct.error) as e:
+            self.logger.debug("Could not read header of %s: %s", audio_file.name, e)
+            duration = None
+        if duration is not None:
+            return duration
+        try:
+            # Ask for the one field needed, printed bare (no JSON to decode)
+            result = subprocess.run(
+                [
+                    self._ffprobe,
+                    "-v",
+                    "error",
+                    "-show_entries",
+                    "format=duration",
+                    "-of",
+                    "default=noprint_wrappers=1:nokey=1",
+                    str(audio_file),
+                ],
+                capture_output=True,
+                text=True,
+                timeout=self._ffprobe_timeout,
+            )
+            return float(result.stdout.strip())
+        except subprocess.TimeoutExpired:
+            self.logger.warning(
+                "ffprobe timed out after %ss for %s", self._ffprobe_timeout, audio_file.name
+            )
+            return None
+        except Exception as e:
+            self.logger.debug("ffprobe failed for %s: %s", audio_file.name, e)
+            return None
+
     def get_dvd_disc_hints(self, volume_path: Path) -> dict:
         """
         Extract hints from a DVD disc for better TMDB matching.
@@ -225,43 +634,142 @@ class DiscMonitor:
         Returns:
             Dict with hints: estimated_runtime_min, title_count, disc_label, etc.
         """
-        import subprocess
-
         hints = {
             "disc_label": volume_path.name,
             "estimated_runtime_min": None,
             "title_count": 0,
         }
+        durations = self._read_title_durations(volume_path)
+        if durations is None:
+            durations = self._scan_title_durations(volume_path)
+        durations = [d for d in durations if d >= _MIN_TITLE_SECONDS]
+        if durations:
+            hints["title_count"] = len(durations)
+            # Pick the longest title as the main feature
+            hints["estimated_runtime_min"] = round(max(durations) / 60)
+            self.logger.info(
+                "DVD hints: %d titles, longest ~%s min",
+                hints["title_count"],
+                hints["estimated_runtime_min"],
+            )
+        return hints
+
+    def _read_title_durations(self, volume_path: Path) -> Optional[List[int]]:
+        """Read title runtimes straight from the disc structure.
+
+        Returns None when the IFO/MPLS files can't be parsed, so the caller
+        can fall back to a HandBrake scan.
+        """
         try:
-            # Use HandBrake scan to get title info including duration
-            result = subprocess.run(
+            if (volume_path / "VIDEO_TS").is_dir():
+                durations = _read_dvd_title_durations(volume_path / "VIDEO_TS")
+            elif (volume_path / "BDMV").is_dir():
+                durations = _read_bluray_title_durations(volume_path / "BDMV")
+            else:
+                return None
+        except (OSError, struct.error, ValueError) as e:
+            self.logger.debug("Could not read disc structure: %s", e)
+            return None
+        return durations or None
+
+    def _scan_title_durations(self, volume_path: Path) -> List[int]:
+        """Return title runtimes in seconds from a ``HandBrakeCLI --scan``.
+
+        The scan's stderr is read line by line; HandBrake is stopped as soon
+        as its title summary ends instead of buffering everything it prints.
+        """
+        durations: List[int] = []
+        try:
+            with subprocess.Popen(
                 [self._handbrake, "--scan", "--input", str(volume_path)],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=60,
-            )
-            scan_output = result.stderr or ""
-
-            # Parse title durations from scan output
-            import re
-
-            duration_matches = re.findall(r"\+ duration:\s+(\d+):(\d+):(\d+)", scan_output)
-            if duration_matches:
-                hints["title_count"] = len(duration_matches)
-                # Pick the longest title as the main feature
-                durations_min = []
-                for h, m, s in duration_matches:
-                    dur = int(h) * 60 + int(m) + int(s) / 60
-                    durations_min.append(dur)
-                hints["estimated_runtime_min"] = round(max(durations_min))
-                self.logger.info(
-                    f"DVD hints: {hints['title_count']} titles, "
-                    f"longest ~{hints['estimated_runtime_min']} min"
-                )
+                bufsize=1,
+            ) as proc:
+                watchdog = threading.Timer(self._scan_timeout, proc.kill)
+                watchdog.start()
+                try:
+                    for line in proc.stderr:
+                        # Cheap prefix gate: only duration lines reach the regex
+                        stripped = line.lstrip()
+                        if stripped.startswith("+ duration:"):
+                            match = _HB_DURATION_RE.match(stripped)
+                            if match:
+                                h, m, sec = match.groups()
+                                durations.append(int(h) * 3600 + int(m) * 60 + int(sec))
+                        elif durations and not line.startswith(("+", " ")):
+                            break  # past the "+ title N:" summary blocks
+                finally:
+                    timed_out = not watchdog.is_alive()
+                    watchdog.cancel()
+                    if proc.poll() is None:
+                        proc.kill()
+                    proc.wait()
+            if timed_out:
+                self.logger.warning("HandBrake scan timed out after %ss", self._scan_timeout)
         except Exception as e:
             self.logger.debug("Could not get DVD hints: %s", e)
+        return durations
+
+    def disc_fingerprint(self, volume_path: Path, disc_type: str) -> Optional[str]:
+        """Return a cheap content hash for a disc, or None if it can't be read.
+
+        Hashes the volume name plus the names and sizes of the files that make
+        up the disc's content (VOBs, m2ts streams or audio tracks), without
+        reading any file data.
+        """
+        subdir = _FINGERPRINT_DIRS.get(disc_type)
+        if subdir is None:
+            return None
+        try:
+            with os.scandir(volume_path / subdir) as it:
+                entries = sorted(
+                    (entry.name, entry.stat().st_size) for entry in it if entry.is_file()
+                )
+        except OSError:
+            return None
+        digest = hashlib.sha256(f"{disc_type}\0{volume_path.name}".encode("utf-8"))
+        for name, size in entries:
+            digest.update(f"\0{name}\0{size}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def get_disc_hints(self, volume_path: Path, disc_type: str) -> Dict[str, Any]:
+        """Collect metadata hints for a disc, reusing a cached scan when possible."""
+        if disc_type == "audio_cd":
+            scan = self.get_audio_cd_info
+        elif disc_type in ("dvd", "bluray"):
+            scan = self.get_dvd_disc_hints
+        else:
+            return {}
+
+        content_hash: Optional[str] = self.disc_fingerprint(volume_path, disc_type)
+        if content_hash is None:  # disc contents couldn't be read; nothing to key on
+            return scan(volume_path)
+        cache = self._get_hints_cache()
+        if cache:
+            cached = cache.get(content_hash)
+            if cached is not None:
+                self.logger.info("Using cached disc hints for %s", volume_path.name)
+                return cached
+
+        hints = scan(volume_path)
+        # A scan that found nothing (drive still spinning up, tool missing or
+        # timed out) is not cached, so the next insertion scans again
+        if cache and (hints.get("title_count") or hints.get("track_durations")):
+            cache.put(content_hash, disc_type, hints)
         return hints
 
+    def _get_hints_cache(self) -> Optional[_DiscHintsCache]:
+        """Open the disc hints cache on first use; None if it is unavailable."""
+        if self._hints_cache is None:
+            try:
+                self._hints_cache = _DiscHintsCache(get_data_dir() / "disc_hints.db")
+            except (OSError, sqlite3.Error) as e:
+                self.logger.warning("Disc hints cache unavailable: %s", e)
+                return None
+        return self._hints_cache
+
     def extract_title_from_volume(self, volume_name: str) -> str:
         """
         Extract a clean title from volume name
@@ -272,9 +780,8 @@ class DiscMonitor:
         Returns:
             Cleaned title
         """
-        # Remove common disc markers
-        title = volume_name.replace("_", " ")
-        title = title.replace("DISC", "").replace("DVD", "").strip()
+        # Remove common disc markers and turn underscores into spaces in one pass
+        title = _TITLE_CLEAN_RE.sub(_clean_title_token, volume_name).strip()
 
         # Remove trailing numbers that look like disc numbers (1-4)
         # but keep numbers that could be part of a real title (e.g. "2001")
@@ -287,7 +794,7 @@ class DiscMonitor:
 
         return title.strip()
 
-    def process_disc(self, volume_name: str):
+    def process_disc(self, volume_name: str) -> bool:
         """
         Process a newly detected disc.
         Detects disc type (DVD/Blu-ray/Audio CD), collects disc hints,
@@ -295,22 +802,22 @@ class DiscMonitor:
 
         Args:
             volume_name: Name of the volume
+
+        Returns:
+            True if a job was enqueued or the direct rip succeeded
         """
         volume_path = self.mount_path / volume_name
 
         self.logger.info("Processing new disc: %s", volume_name)
         send_notification("Disc Detected", f"Found: {volume_name}")
 
-        disc_type = self.get_disc_type(volume_path)
+        disc_type = self._disc_types.get(volume_name) or self.get_disc_type(volume_path)
         title_guess = self.extract_title_from_volume(volume_name)
         self.logger.info("Disc type: %s, title guess: %s", disc_type, title_guess)
 
         # Collect disc hints for better metadata matching
         disc_hints = {"disc_type": disc_type}
-        if disc_type == "audio_cd":
-            disc_hints.update(self.get_audio_cd_info(volume_path))
-        elif disc_type in ("dvd", "bluray"):
-            disc_hints.update(self.get_dvd_disc_hints(volume_path))
+        disc_hints.update(self.get_disc_hints(volume_path, disc_type))
 
         # If we have app_state, use the job queue
         if self.app_state:
@@ -326,7 +833,7 @@ class DiscMonitor:
                 "disc_detected",
                 {"volume_name": volume_name, "job_id": job_id, "disc_type": disc_type},
             )
-            return
+            return True
 
         # Fallback: direct ripping (standalone mode)
         try:
@@ -353,12 +860,81 @@ class DiscMonitor:
                     self.logger.info("Metadata extraction complete")
 
                 send_notification("All Done!", f"{title_guess} is ready")
-            else:
-                self.logger.error("Rip failed for: %s", volume_name)
+                return True
+            self.logger.error("Rip failed for: %s", volume_name)
 
         except Exception as e:
             self.logger.error("Error processing disc %s: %s", volume_name, e)
             send_notification("Error", f"Failed to process {volume_name}")
+        return False
+
+    def _volume_stamp(self, volume_name: str) -> Optional[List[float]]:
+        """Identify one mount of a volume by its root's device, inode and ctime."""
+        try:
+            st = (self.mount_path / volume_name).stat()
+        except OSError:
+            return None
+        return [st.st_dev, st.st_ino, st.st_ctime]
+
+    def _load_seen_volumes(self) -> Dict[str, List[float]]:
+        """Load the volumes recorded by a previous run, if any."""
+        try:
+            with open(self._seen_path, encoding="utf-8") as f:
+                seen = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning("Ignoring unreadable %s: %s", self._seen_path.name, e)
+            return {}
+        return seen if isinstance(seen, dict) else {}
+
+    def _remember_volume(self, volume_name: str) -> None:
+        """Record *volume_name* as handled so a restart doesn't process it again."""
+        stamp = self._volume_stamp(volume_name)
+        if stamp is None:
+            return
+        with self._seen_lock:
+            if self._seen_volumes.get(volume_name) == stamp:
+                return
+            self._seen_volumes = {**self._seen_volumes, volume_name: stamp}
+            self._save_seen_volumes()
+
+    def _forget_volumes(self, volumes: Set[str]) -> None:
+        """Drop ejected *volumes*; a disc mounted under the same name is new."""
+        with self._seen_lock:
+            seen = {v: s for v, s in self._seen_volumes.items() if v not in volumes}
+            if seen == self._seen_volumes:
+                return
+            self._seen_volumes = seen
+            self._save_seen_volumes()
+
+    def _save_seen_volumes(self) -> None:
+        """Write _seen_volumes atomically. Caller holds _seen_lock."""
+        tmp = self._seen_path.with_name(self._seen_path.name + ".tmp")
+        try:
+            tmp.write_text(json.dumps(self._seen_volumes), encoding="utf-8")
+            os.replace(tmp, self._seen_path)
+        except OSError as e:
+            self.logger.warning("Could not save known volumes: %s", e)
+
+    def clear_known_volumes(self) -> None:
+        """Forget volumes handled by earlier runs so they are processed again."""
+        with self._seen_lock:
+            self._seen_volumes = {}
+            self._seen_path.unlink(missing_ok=True)
+
+    def _safe_process_disc(self, volume_name: str):
+        """Run process_disc on the worker thread, logging instead of raising."""
+        # One failure must not stop later discs from being processed
+        try:
+            handled = self.process_disc(volume_name)
+        except Exception as e:
+            self.logger.error("Error processing disc %s: %s", volume_name, e)
+            return
+        # Only now is the disc handled: one that failed, was cancelled, or was
+        # still queued at shutdown is processed again after a restart
+        if handled:
+            self._remember_volume(volume_name)
 
     def check_for_new_discs(self):
         """Check for newly inserted discs"""
@@ -375,6 +951,8 @@ class DiscMonitor:
 
         # Log changes
         if removed_volumes:
+            _classify_mounted.cache_clear()
+            self._forget_volumes(removed_volumes)
             for vol in removed_volumes:
                 self.logger.info("Disc removed: %s", vol)
 
@@ -384,11 +962,7 @@ class DiscMonitor:
                 self.logger.info("New disc detected: %s", vol)
 
                 if self.config["automation"]["auto_detect_disc"]:
-                    # Process in a try block to prevent one failure from stopping monitoring
-                    try:
-                        self.process_disc(vol)
-                    except Exception as e:
-                        self.logger.error("Error processing disc: %s", e)
+                    self._worker.submit(self._safe_process_disc, vol)
                 else:
                     send_notification("Disc Detected", f"{vol} - auto-rip disabled")
 
@@ -400,18 +974,25 @@ class DiscMonitor:
         # Initial scan — also process any discs already present
         self.known_volumes = self.get_mounted_volumes()
         self.logger.info("Initial volumes: %s", self.known_volumes)
+        self._forget_volumes(set(self._seen_volumes) - self.known_volumes)
 
         if self.known_volumes and self.config["automation"].get("auto_detect_disc", True):
             for vol in self.known_volumes:
+                # Still the same mount a previous run already handled
+                if self._seen_volumes.get(vol) == self._volume_stamp(vol):
+                    self.logger.info("Skipping disc handled before restart: %s", vol)
+                    continue
                 self.logger.info("Processing disc present at startup: %s", vol)
-                try:
-                    self.process_disc(vol)
-                except Exception as e:
-                    self.logger.error("Error processing startup disc: %s", e)
+                self._worker.submit(self._safe_process_disc, vol)
 
         print("🔍 Disc monitor started")
         print(f"📀 Watching: {self.mount_path}")
-        print(f"⏱️  Check interval: {self.check_interval} seconds")
+        # Sleep on kernel mount events where available; poll otherwise
+        self._watcher = _MountWatcher.create()
+        if self._watcher:
+            print("⏱️  Waiting on mount events")
+        else:
+            print(f"⏱️  Check interval: {self.check_interval} seconds")
         auto_rip = self.config["automation"]["auto_detect_disc"]
         print(f"🤖 Auto-rip: {'Enabled' if auto_rip else 'Disabled'}")
         print("\nWaiting for discs... (Press Ctrl+C to stop)\n")
@@ -421,16 +1002,33 @@ class DiscMonitor:
         try:
             while self.running:
                 self.check_for_new_discs()
-                time.sleep(self.check_interval)
+                if self._watcher:
+                    # Events wake us at once; the interval is a safety net that
+                    # also retries a scan a spinning-up drive left incomplete
+                    self._watcher.wait(self.check_interval)
+                else:
+                    time.sleep(self.check_interval)
 
         except KeyboardInterrupt:
             self.logger.info("Received shutdown signal")
             self.stop()
+        finally:
+            if self._watcher:
+                self._watcher.close()
+                self._watcher = None
+            # Drop queued discs without waiting for the one in flight. Standalone,
+            # that is a rip lasting up to hours, so stop it too; otherwise it
+            # is only enqueueing a job and finishes on its own.
+            self._worker.shutdown(wait=False, cancel_futures=True)
+            if self.app_state is None:
+                self.ripper.cancel()
 
     def stop(self):
         """Stop monitoring"""
         self.logger.info("Stopping disc monitoring...")
         self.running = False
+        if self._watcher:
+            self._watcher.wake()
         send_notification("Disc Monitor Stopped", "No longer watching for media")
         print("\n👋 Disc monitor stopped")
 
@@ -450,6 +1048,11 @@ def main():
     parser.add_argument(
         "--no-auto-rip", action="store_true", help="Disable automatic ripping (notify only)"
     )
+    parser.add_argument(
+        "--force-rescan",
+        action="store_true",
+        help="Process discs already mounted even if a previous run handled them",
+    )
 
     args = parser.parse_args()
 
@@ -460,6 +1063,9 @@ def main():
     # Create monitor
     monitor = DiscMonitor(config_path=args.config)
 
+    if args.force_rescan:
+        monitor.clear_known_volumes()
+
     # Override auto-rip if requested
     if args.no_auto_rip:
         monitor.config["automation"]["auto_detect_disc"] = False
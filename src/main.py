@@ -153,6 +153,7 @@ def main():
         def shutdown(signum, frame):
             logger.info("Shutdown signal received")
             _shutdown_event.set()
+            content_dl.close()
             if not args.background:
                 print("\n Shutting down...")
             sys.exit(0)
@@ -166,6 +167,7 @@ def main():
         def shutdown(signum, frame):
             logger.info("Shutdown signal received")
             _shutdown_event.set()
+            content_dl.close()
             if not args.background:
                 print("\n Shutting down...")
             sys.exit(0)
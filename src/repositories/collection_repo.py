@@ -110,11 +110,26 @@ class CollectionRepositoryMixin:
     # ── Playlist Tracks ──────────────────────────────────────────
 
     def add_playlist_tracks(self, collection_id: int, tracks: List[Dict[str, Any]]) -> None:
-        """Add playlist tracks (from Spotify import) to a collection."""
+        """Replace a collection's playlist tracks (from Spotify import) in one transaction."""
+        rows = [
+            (
+                collection_id,
+                i,
+                t.get("title", "Unknown"),
+                t.get("artist", ""),
+                t.get("album", ""),
+                t.get("duration_ms", 0),
+                t.get("artwork_url", ""),
+                t.get("spotify_uri", ""),
+                t.get("isrc", ""),
+                t.get("matched_media_id"),
+            )
+            for i, t in enumerate(tracks)
+        ]
         conn = self._get_conn()
-        conn.execute("DELETE FROM playlist_tracks WHERE collection_id = ?", (collection_id,))
-        for i, t in enumerate(tracks):
-            conn.execute(
+        with conn:
+            conn.execute("DELETE FROM playlist_tracks WHERE collection_id = ?", (collection_id,))
+            conn.executemany(
                 """
 
                 INSERT INTO playlist_tracks
@@ -123,20 +138,8 @@ class CollectionRepositoryMixin:
                      matched_media_id)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
-                (
-                    collection_id,
-                    i,
-                    t.get("title", "Unknown"),
-                    t.get("artist", ""),
-                    t.get("album", ""),
-                    t.get("duration_ms", 0),
-                    t.get("artwork_url", ""),
-                    t.get("spotify_uri", ""),
-                    t.get("isrc", ""),
-                    t.get("matched_media_id"),
-                ),
+                rows,
             )
-        conn.commit()
 
     def get_playlist_tracks(self, collection_id: int) -> List[Dict[str, Any]]:
         """Retrieve playlist tracks for a collection."""
@@ -172,6 +175,7 @@ class CollectionRepositoryMixin:
             (collection_id,),
         ).fetchall()
         media = conn.execute("SELECT id, title, artist, collection_name FROM media").fetchall()
+        matches = []
         for track in tracks:
             t_title = (track["title"] or "").lower().strip()
             t_artist = (track["artist"] or "").lower().strip()
@@ -186,8 +190,8 @@ class CollectionRepositoryMixin:
                     elif not t_artist or not m_artist:
                         best = m["id"]
             if best:
-                conn.execute(
-                    "UPDATE playlist_tracks SET matched_media_id = ? WHERE id = ?",
-                    (best, track["id"]),
-                )
-        conn.commit()
+                matches.append((best, track["id"]))
+        with conn:
+            conn.executemany(
+                "UPDATE playlist_tracks SET matched_media_id = ? WHERE id = ?", matches
+            )
@@ -44,6 +44,10 @@ class JobRepositoryMixin:
             ),
         )
         conn.commit()
+        # The rip worker drains every queued job; the content worker skips rips
+        self._job_ready.set()
+        if job_type != "rip":
+            self._content_job_ready.set()
         self.broadcast(
             "job_created",
             {
@@ -86,6 +90,24 @@ class JobRepositoryMixin:
         ).fetchone()
         return dict(row) if row else None
 
+    def wait_for_job(self, timeout: float) -> bool:
+        """Block until a job is created or *timeout* seconds pass.
+
+        Returns True if woken by a new job. Call after get_next_queued_job()
+        comes back empty; a job created in between is not missed. Only jobs
+        created through this process signal the wait, so keep *timeout* short
+        enough to pick up jobs other processes add to the shared database.
+        """
+        woken = self._job_ready.wait(timeout)
+        self._job_ready.clear()
+        return woken
+
+    def wait_for_content_job(self, timeout: float) -> bool:
+        """Like wait_for_job, but only woken by non-rip jobs."""
+        woken = self._content_job_ready.wait(timeout)
+        self._content_job_ready.clear()
+        return woken
+
     def update_job_status(self, job_id: str, status: str, **kwargs: Any) -> None:
         """Update job status and optional fields."""
         conn = self._get_conn()
@@ -2,7 +2,7 @@
 
 import sqlite3
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 
 class PodcastRepositoryMixin:
@@ -59,6 +59,9 @@ class PodcastRepositoryMixin:
             "last_checked",
             "check_interval_hours",
             "is_active",
+            "etag",
+            "last_modified",
+            "feed_hash",
         }
         sets: list[str] = []
         vals: list[Any] = []
@@ -122,6 +125,39 @@ class PodcastRepositoryMixin:
         except sqlite3.IntegrityError:
             return None
 
+    def add_episodes_bulk(self, podcast_id: str, episodes: List[Dict[str, Any]]) -> int:
+        """Add several episodes in one transaction, returns the number inserted.
+
+        Each dict uses the :meth:`add_episode` keyword names.
+        """
+        rows = [
+            (
+                str(uuid.uuid4())[:8],
+                podcast_id,
+                ep["title"],
+                ep.get("audio_url"),
+                ep.get("duration_seconds"),
+                ep.get("published_at"),
+                ep.get("description", ""),
+            )
+            for ep in episodes
+        ]
+        if not rows:
+            return 0
+        conn = self._get_conn()
+        with conn:
+            cur = conn.executemany(
+                """
+
+                INSERT OR IGNORE INTO podcast_episodes
+                    (id, podcast_id, title, audio_url, duration_seconds,
+                     published_at, description)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+                rows,
+            )
+        return cur.rowcount
+
     def get_episodes(self, podcast_id: str) -> List[Dict[str, Any]]:
         """Get episodes for a podcast, newest first."""
         conn = self._get_conn()
@@ -131,6 +167,12 @@ class PodcastRepositoryMixin:
         ).fetchall()
         return [dict(r) for r in rows]
 
+    def get_episode(self, ep_id: str) -> Optional[Dict[str, Any]]:
+        """Get a single podcast episode by ID."""
+        conn = self._get_conn()
+        row = conn.execute("SELECT * FROM podcast_episodes WHERE id = ?", (ep_id,)).fetchone()
+        return dict(row) if row else None
+
     def update_episode(self, ep_id: str, **kwargs: Any) -> None:
         """Update allowed fields on a podcast episode."""
         conn = self._get_conn()
@@ -146,6 +188,14 @@ class PodcastRepositoryMixin:
             conn.execute(f"UPDATE podcast_episodes SET {', '.join(sets)} WHERE id = ?", vals)
             conn.commit()
 
+    def get_known_audio_urls(self, podcast_id: str) -> Set[str]:
+        """Audio URLs of all stored episodes for a podcast."""
+        conn = self._get_conn()
+        rows = conn.execute(
+            "SELECT audio_url FROM podcast_episodes WHERE podcast_id = ?", (podcast_id,)
+        ).fetchall()
+        return {r[0] for r in rows}
+
     def episode_exists(self, podcast_id: str, audio_url: str) -> bool:
         """Check if an episode already exists (by audio URL)."""
         conn = self._get_conn()
@@ -6,6 +6,7 @@ import platform
 import re
 import shutil
 import subprocess
+import threading
 import time
 from collections import deque
 from datetime import datetime
@@ -63,8 +64,24 @@ class Ripper:
         notify_enabled = self.config.get("automation", {}).get("notification_enabled", True)
         configure_notifications(notify_enabled)
 
+        # Running HandBrake process, so cancel() can stop it from another thread
+        self._process: Optional[subprocess.Popen] = None
+        self._cancelled = threading.Event()
+
         self.logger.info("Ripper initialized")
 
+    def cancel(self) -> None:
+        """Stop the rip in progress, if any, and refuse to start new ones.
+
+        Used at shutdown: HandBrake is terminated, and an audio CD rip stops
+        after the track being converted.
+        """
+        self._cancelled.set()
+        process = self._process
+        if process and process.poll() is None:
+            self.logger.info("Stopping rip in progress")
+            process.terminate()
+
     def check_handbrake_installed(self) -> bool:
         """
         Check if HandBrakeCLI is installed
@@ -243,6 +260,9 @@ class Ripper:
             process = subprocess.Popen(
                 cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
             )
+            self._process = process
+            if self._cancelled.is_set():
+                process.terminate()
 
             # Keep a ring buffer of recent output for error diagnostics
             recent_output = deque(maxlen=30)
@@ -293,7 +313,7 @@ class Ripper:
                 if recent_output:
                     tail = "\n".join(recent_output)
                     self.logger.error(
-                        f"HandBrake output (last {len(recent_output)} lines):\n{tail}"
+                        "HandBrake output (last %d lines):\n%s", len(recent_output), tail
                     )
                 send_notification("Rip Failed", f"{title_name} encountered an error")
                 return None
@@ -302,6 +322,8 @@ class Ripper:
             self.logger.error("Error during rip process: %s", e)
             send_notification("Rip Failed", str(e))
             return None
+        finally:
+            self._process = None
 
     def eject_disc(self, disc_path: str):
         """
@@ -365,6 +387,9 @@ class Ripper:
         ripped = 0
 
         for idx, track_file in enumerate(audio_files, 1):
+            if self._cancelled.is_set():
+                self.logger.info("Audio CD rip cancelled after %s/%s tracks", idx - 1, total)
+                return None
             track_name = track_file.stem
             output_file = album_dir / f"{idx:02d} - {sanitize_filename(track_name)}.mp3"
 
@@ -395,8 +420,10 @@ class Ripper:
                 else:
                     stderr_tail = result.stderr.strip().splitlines()[-10:]
                     self.logger.error(
-                        f"  ffmpeg failed for track {idx} (exit {result.returncode}):\n"
-                        + "\n".join(stderr_tail)
+                        "  ffmpeg failed for track %s (exit %s):\n%s",
+                        idx,
+                        result.returncode,
+                        "\n".join(stderr_tail),
                     )
             except Exception as e:
                 self.logger.error("  Error ripping track %s: %s", idx, e)
@@ -14,7 +14,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from ..constants import ALL_MEDIA_EXTENSIONS, LIBRARY_SKIP_DIRS
+from ..constants import LIBRARY_SKIP_DIRS, is_media_file
 from ..utils import detect_media_type, format_size, generate_media_id, setup_logger
 
 if TYPE_CHECKING:
@@ -58,7 +58,7 @@ class LibraryScannerService:
             rel_parts = file_path.relative_to(self.library_path).parts
             if rel_parts and rel_parts[0] in LIBRARY_SKIP_DIRS:
                 continue
-            if file_path.suffix.lower() not in ALL_MEDIA_EXTENSIONS:
+            if not is_media_file(file_path.name):
                 continue
 
             try:
@@ -2,6 +2,7 @@
 Utility functions for the media ripper application
 """
 
+import functools
 import logging
 import os
 import re
@@ -9,7 +10,7 @@ import shutil
 import sys
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 from dotenv import load_dotenv
 
@@ -26,6 +27,9 @@ from .constants import (
 
 load_dotenv()
 
+# Characters not allowed in filenames on common filesystems → "_"
+_INVALID_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
+
 # Module-level flag for notification suppression
 _notifications_enabled = True
 
@@ -106,25 +110,21 @@ def setup_logger(name: str, log_file: str, level=None, debug: bool = False) -> l
     return logger
 
 
+@functools.lru_cache(maxsize=1024)
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize filename by removing invalid characters
 
+    Results are memoised — podcast and playlist titles repeat a lot.
+
     Args:
         filename: Original filename
 
     Returns:
         Sanitized filename
     """
-    # Remove or replace invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, "_")
-
-    # Remove leading/trailing spaces and dots
-    filename = filename.strip(". ")
-
-    return filename
+    # Replace invalid characters, then remove leading/trailing spaces and dots
+    return filename.translate(_INVALID_FILENAME_CHARS).strip(". ")
 
 
 def format_size(size_bytes: int) -> str:
@@ -236,13 +236,13 @@ def print_progress(
 # ── Natural (numeric-aware) sorting ──────────────────────────────
 
 
-def natural_sort_key(path: Path):
+def natural_sort_key(path: Union[Path, os.DirEntry]):
     """
     Sort key that orders embedded numbers numerically so that
     'Track 2' sorts before 'Track 10'.
 
     Args:
-        path: A Path object whose *name* is used for ordering
+        path: A Path or os.DirEntry whose *name* is used for ordering
 
     Returns:
         A list of alternating str/int chunks suitable for sorted().
@@ -9,6 +9,7 @@ import time
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+from ..constants import CONTENT_QUEUE_RECHECK_SECONDS
 from ..observability.errors import ErrorTracker
 from ..observability.metrics import MetricsCollector
 from ..observability.tracing import end_background_trace, trace_background_job
@@ -56,7 +57,7 @@ def content_worker(
         try:
             row = app_state.get_next_queued_content_job()
             if not row:
-                time.sleep(3)
+                app_state.wait_for_content_job(CONTENT_QUEUE_RECHECK_SECONDS)
                 continue
 
             job = row
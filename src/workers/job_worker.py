@@ -6,12 +6,12 @@ optionally renames output files, and syncs poster artwork.
 """
 
 import json
-import time
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ..constants import AUDIO_EXTENSIONS
+from ..constants import AUDIO_EXTENSIONS, JOB_QUEUE_RECHECK_SECONDS
 from ..observability.errors import ErrorTracker
 from ..observability.metrics import MetricsCollector
 from ..observability.tracing import end_background_trace, trace_background_job
@@ -56,7 +56,7 @@ def job_worker(
         try:
             job = app_state.get_next_queued_job()
             if not job:
-                time.sleep(2)
+                app_state.wait_for_job(JOB_QUEUE_RECHECK_SECONDS)
                 continue
 
             job_id = job["id"]
@@ -99,17 +99,14 @@ def job_worker(
                 # For audio CDs, inject a sample track path so AcoustID
                 # fingerprinting can identify the album.
                 if disc_type == "audio_cd" and Path(output).is_dir():
-                    sample = next(
-                        (
-                            f
-                            for f in sorted(Path(output).iterdir(), key=natural_sort_key)
-                            if f.suffix.lower() in AUDIO_EXTENSIONS
-                        ),
-                        None,
-                    )
+                    with os.scandir(output) as it:
+                        tracks = [
+                            e for e in it if os.path.splitext(e.name)[1].lower() in AUDIO_EXTENSIONS
+                        ]
+                    sample = min(tracks, key=natural_sort_key, default=None)
                     if sample:
-                        disc_hints["sample_track_path"] = str(sample)
-                        logger.info("Set sample_track_path: %s", sample)
+                        disc_hints["sample_track_path"] = sample.path
+                        logger.info("Set sample_track_path: %s", sample.path)
 
                 # Extract and save metadata
                 metadata = None
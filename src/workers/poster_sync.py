@@ -36,7 +36,8 @@ def sync_video_poster(
         return
 
     try:
-        shutil.copy2(poster_src, str(dest))
+        # A real copy, not a link: poster sources get rewritten in place later
+        shutil.copyfile(poster_src, str(dest))
         metadata["poster_file"] = str(dest)
         logger.info("Poster synced: %s", dest.name)
     except Exception as e:
@@ -57,24 +58,56 @@ def sync_album_poster(
     if not poster_src or not os.path.exists(poster_src):
         return
 
-    thumbnails_dir = get_data_dir() / "thumbnails"
-    for track_file in sorted(Path(album_dir).iterdir(), key=natural_sort_key):
-        if track_file.suffix.lower() not in AUDIO_EXTENSIONS:
-            continue
-        dest = thumbnails_dir / f"{track_file.stem}_poster.jpg"
+    data_dir = get_data_dir()
+    thumbnails_dir = str(data_dir / "thumbnails")
+    metadata_dir = data_dir / "metadata"
+    with os.scandir(album_dir) as it:
+        tracks = sorted(
+            (e for e in it if os.path.splitext(e.name)[1].lower() in AUDIO_EXTENSIONS),
+            key=natural_sort_key,
+        )
+
+    # Copy every poster first. Each is an independent copy (poster sources are
+    # rewritten in place by later downloads), but only the first is read from
+    # poster_src, which may be on another filesystem; the rest are copied from
+    # that first copy in the thumbnails directory.
+    posters = {}
+    copy_src = poster_src
+    for entry in tracks:
+        stem = os.path.splitext(entry.name)[0]
+        dest = os.path.join(thumbnails_dir, f"{stem}_poster.jpg")
         try:
-            shutil.copy2(poster_src, str(dest))
+            shutil.copyfile(copy_src, dest)
+            copy_src = dest
         except Exception as e:
-            logger.error("Failed to copy poster for %s: %s", track_file.name, e)
-
-        # Update per-track metadata JSON with poster path
-        track_meta_file = get_data_dir() / "metadata" / f"{track_file.stem}.json"
-        if track_meta_file.exists():
-            try:
-                with open(track_meta_file, "r") as f:
-                    track_meta = json.load(f)
-                track_meta["poster_file"] = str(dest)
-                with open(track_meta_file, "w") as f:
-                    json.dump(track_meta, f, indent=2)
-            except Exception as e:
-                logger.debug("Failed to update track metadata JSON %s: %s", track_meta_file, e)
+            logger.error("Failed to copy poster for %s: %s", entry.name, e)
+        posters[stem] = dest
+
+    # Then point each track's metadata JSON at its poster in one pass
+    for stem, dest in posters.items():
+        _set_track_poster(metadata_dir / f"{stem}.json", dest, logger)
+
+
+def _set_track_poster(track_meta_file: Path, dest: str, logger: "logging.Logger") -> None:
+    """Set ``poster_file`` in a track's metadata JSON, skipping no-op rewrites.
+
+    The file is replaced atomically so a crash never leaves it half-written.
+    """
+    try:
+        with open(track_meta_file, "r", encoding="utf-8") as f:
+            track_meta = json.load(f)
+    except FileNotFoundError:
+        return
+    except Exception as e:
+        logger.debug("Failed to read track metadata JSON %s: %s", track_meta_file, e)
+        return
+    if track_meta.get("poster_file") == dest:
+        return
+    track_meta["poster_file"] = dest
+    tmp = track_meta_file.with_name(track_meta_file.name + ".tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(track_meta, f, separators=(",", ":"), ensure_ascii=False)
+        os.replace(tmp, track_meta_file)
+    except Exception as e:
+        logger.debug("Failed to update track metadata JSON %s: %s", track_meta_file, e)
@@ -181,6 +181,25 @@ class TestAppState:
         next_job = app_state.get_next_queued_job()
         assert next_job["id"] == id1
 
+    def test_create_job_wakes_waiting_worker(self, app_state):
+        """wait_for_job returns as soon as a job is created, not at the timeout"""
+        import threading
+        import time
+
+        app_state.wait_for_job(0)  # drop any signal left by earlier jobs
+        threading.Timer(0.05, app_state.create_job, args=("Wake", "/vol/wake")).start()
+        start = time.monotonic()
+        assert app_state.wait_for_job(10) is True
+        assert time.monotonic() - start < 5
+        assert app_state.get_next_queued_job()["title"] == "Wake"
+
+    def test_rip_job_does_not_wake_content_worker(self, app_state):
+        app_state.wait_for_content_job(0)
+        app_state.create_job("Disc", "/vol/disc", job_type="rip")
+        assert app_state.wait_for_content_job(0) is False
+        app_state.create_job("Clip", "https://example.com/v", job_type="download")
+        assert app_state.wait_for_content_job(0) is True
+
     def test_update_job_status(self, app_state):
         """Test updating job status"""
         job_id = app_state.create_job("Test", "/vol/test")
@@ -133,6 +133,13 @@ class TestPlaylistTracks:
         assert len(result) == 1
         assert result[0]["title"] == "New"
 
+    def test_failed_replace_keeps_existing(self, app_state):
+        col_id = app_state.create_collection("Atomic")
+        app_state.add_playlist_tracks(col_id, [{"title": "Old"}])
+        with pytest.raises(AttributeError):
+            app_state.add_playlist_tracks(col_id, [{"title": "New"}, None])
+        assert [t["title"] for t in app_state.get_playlist_tracks(col_id)] == ["Old"]
+
 
 class TestMatchPlaylistTracks:
     def test_match_by_title_and_artist(self, app_state):
@@ -4,7 +4,7 @@ import json
 
 import pytest
 
-from src.config import ConfigError, load_config, validate_config
+from src.config import ConfigError, _resolve, load_config, validate_config
 
 
 @pytest.fixture
@@ -50,12 +50,58 @@ class TestLoadConfig:
         base_dir = result.get("output", {}).get("base_directory", "")
         assert "${" not in base_dir  # Should be resolved, not a raw placeholder
 
+    def test_reload_returns_independent_copies(self, tmp_path):
+        path = tmp_path / "cfg.json"
+        path.write_text(json.dumps({"web_server": {"port": 8096}}))
+        first = load_config(str(path))
+        first["web_server"]["port"] = 1
+        assert load_config(str(path))["web_server"]["port"] == 8096
+
+    def test_reload_picks_up_file_changes(self, tmp_path):
+        path = tmp_path / "cfg.json"
+        path.write_text(json.dumps({"v": 1}))
+        assert load_config(str(path))["v"] == 1
+        path.write_text(json.dumps({"v": 22}))
+        assert load_config(str(path))["v"] == 22
+
+    def test_cached_config_still_resolves_current_env(self, tmp_path, monkeypatch):
+        path = tmp_path / "cfg.json"
+        path.write_text(json.dumps({"root": "${TEST_CFG_ROOT:-/default}"}))
+        monkeypatch.setenv("TEST_CFG_ROOT", "/one")
+        assert load_config(str(path))["root"] == "/one"
+        monkeypatch.setenv("TEST_CFG_ROOT", "/two")
+        assert load_config(str(path))["root"] == "/two"
+
     def test_missing_file_raises_config_error(self):
         """load_config should raise ConfigError for missing files."""
         with pytest.raises(ConfigError, match="not found"):
             load_config("nonexistent_file_that_does_not_exist.json")
 
 
+# ── _resolve ─────────────────────────────────────────────────────
+
+
+class TestResolve:
+    def test_repeated_placeholders_resolved_everywhere(self, monkeypatch):
+        monkeypatch.setenv("TEST_MEDIA_ROOT", "/srv/media")
+        raw = {
+            "a": "${TEST_MEDIA_ROOT:-/fallback}",
+            "b": {"c": "${TEST_MEDIA_ROOT:-/fallback}"},
+            "d": ["${TEST_MEDIA_ROOT:-/fallback}", 5],
+        }
+        assert _resolve(raw) == {
+            "a": "/srv/media",
+            "b": {"c": "/srv/media"},
+            "d": ["/srv/media", 5],
+        }
+
+    def test_memo_not_shared_between_calls(self, monkeypatch):
+        monkeypatch.setenv("TEST_MEDIA_ROOT", "/first")
+        assert _resolve("${TEST_MEDIA_ROOT}") == "/first"
+        monkeypatch.setenv("TEST_MEDIA_ROOT", "/second")
+        assert _resolve("${TEST_MEDIA_ROOT}") == "/second"
+
+
 # ── validate_config ──────────────────────────────────────────────
 
 
@@ -87,6 +133,13 @@ class TestValidateConfig:
         assert any("metadata" in e for e in errors)
         assert any("auth" in e for e in errors)
 
+    def test_missing_sections_reported_in_schema_order(self):
+        errors = validate_config({"auth": {"enabled": True}})
+        assert errors[:5] == [
+            f"Missing required config section: '{key}'"
+            for key in ("output", "metadata", "automation", "web_server", "disc_detection")
+        ]
+
     def test_missing_sub_key(self):
         """Missing required sub-keys should be reported."""
         config = {
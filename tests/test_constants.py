@@ -0,0 +1,24 @@
+"""Tests for shared constants — extension sets and MIME mapping."""
+
+import pytest
+
+from src.constants import AUDIO_EXTENSIONS, MIME_TYPES, VIDEO_EXTENSIONS, is_media_file
+
+
+class TestMimeTypes:
+    def test_covers_streamable_extensions(self):
+        assert not (VIDEO_EXTENSIONS | AUDIO_EXTENSIONS) - MIME_TYPES.keys()
+
+    def test_read_only(self):
+        with pytest.raises(TypeError):
+            MIME_TYPES[".xyz"] = "application/x-test"  # type: ignore[index]
+
+
+class TestIsMediaFile:
+    @pytest.mark.parametrize("name", ["movie.mp4", "Song.FLAC", "a.b.c.pdf", "cover.JPG"])
+    def test_known_extensions(self, name):
+        assert is_media_file(name)
+
+    @pytest.mark.parametrize("name", ["README", "notes.docx", "archive.", ".mp4", ""])
+    def test_rejects_others(self, name):
+        assert not is_media_file(name)
@@ -2,9 +2,11 @@
 Tests for the content_downloader module.
 """
 
+import io
 import json
+import sys
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -74,6 +76,28 @@ class TestParseDuration:
         assert ContentDownloader._parse_duration("") is None
 
 
+class _FakePopen:
+    """Minimal stand-in for a subprocess.Popen used as a context manager."""
+
+    def __init__(self, lines, returncode=0):
+        self.stdout = io.StringIO("".join(lines))
+        self.returncode = returncode
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def wait(self, timeout=None):
+        return self.returncode
+
+    def terminate(self):
+        pass
+
+    kill = terminate
+
+
 class TestContentDownloader:
     """Tests for ContentDownloader main methods"""
 
@@ -85,9 +109,71 @@ class TestContentDownloader:
 
     def test_download_video_no_ytdlp(self, downloader):
         """download_video returns None when yt-dlp is not available"""
-        with patch("subprocess.run", side_effect=FileNotFoundError):
-            result = downloader.download_video("https://example.com/video")
-            assert result is None
+        with patch.dict(sys.modules, {"yt_dlp": None}):
+            with patch("subprocess.Popen", side_effect=FileNotFoundError):
+                result = downloader.download_video("https://example.com/video")
+                assert result is None
+
+    def test_download_video_cli_fallback_finds_output(self, downloader):
+        """Without the yt_dlp module the CLI output path is read from yt-dlp"""
+        (downloader.download_dir / "Other.mp4").write_bytes(b"x")
+
+        out = downloader.download_dir / "Mr. Clip.mkv"
+        out.write_bytes(b"video")
+        lines = [
+            json.dumps({"title": "Mr. Clip", "uploader": "U"}) + "\n",
+            "[download]  50.0% of 1MiB\n",
+            "[download] 100%\n",
+            json.dumps({"filepath": str(out)}) + "\n",
+        ]
+
+        with patch.dict(sys.modules, {"yt_dlp": None}):
+            with patch("subprocess.Popen", return_value=_FakePopen(lines)) as popen:
+                with patch.object(downloader.app_state, "update_job_progress") as progress:
+                    result = downloader.download_video("https://example.com/video", job_id="j1")
+        popen.assert_called_once()
+        assert result == str(downloader.download_dir / "Mr. Clip.mkv")
+        assert downloader.app_state.get_all_media()[0]["title"] == "Mr. Clip"
+        assert [c.args for c in progress.call_args_list] == [("j1", 50.0), ("j1", 100.0)]
+
+    def test_download_video_cli_failure_returns_none(self, downloader):
+        failed = _FakePopen(["ERROR: Unsupported URL\n"], returncode=1)
+        with patch.dict(sys.modules, {"yt_dlp": None}):
+            with patch("subprocess.Popen", return_value=failed):
+                assert downloader.download_video("https://example.com/video") is None
+
+    def test_download_video_in_process(self, downloader):
+        """yt-dlp runs in-process and the downloaded file is registered"""
+        out = downloader.download_dir / "Clip.mp4"
+
+        class FakeYoutubeDL:
+            def __init__(self, opts):
+                self.opts = opts
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def extract_info(self, url, download):
+                assert download is True
+                out.write_bytes(b"video")
+                return {
+                    "title": "Clip",
+                    "uploader": "Someone",
+                    "requested_downloads": [{"filepath": str(out)}],
+                }
+
+        fake_module = MagicMock(YoutubeDL=FakeYoutubeDL)
+        with patch.dict(sys.modules, {"yt_dlp": fake_module}):
+            with patch("subprocess.run") as mock_run:
+                result = downloader.download_video("https://example.com/video")
+        mock_run.assert_not_called()
+        assert result == str(out)
+        (item,) = downloader.app_state.get_all_media()
+        assert item["title"] == "Clip"
+        assert item["artist"] == "Someone"
 
     def test_archive_article_no_trafilatura(self, downloader):
         """archive_article returns None when trafilatura is not installed"""
@@ -125,6 +211,30 @@ class TestContentDownloader:
         result = downloader.process_content_job(job)
         assert result is None
 
+    def test_close_cancels_queued_episode_downloads(self, downloader):
+        import threading
+
+        workers = downloader._download_pool._max_workers
+        release = threading.Event()
+        started = threading.Semaphore(0)
+
+        def slow_download(podcast_id, episode_id):
+            started.release()
+            release.wait(5)
+
+        with patch.object(downloader, "download_podcast_episode", side_effect=slow_download) as dl:
+            for n in range(workers + 2):
+                downloader._queue_episode_download("pod", f"ep{n}")
+            for _ in range(workers):
+                assert started.acquire(timeout=5)
+            downloader.close()
+            release.set()
+            downloader._download_pool.shutdown(wait=True)
+        # Only the downloads already running went ahead
+        assert dl.call_count == workers
+        with pytest.raises(RuntimeError):
+            downloader._download_pool.submit(lambda: None)
+
 
 class TestPodcastDB:
     """Tests for podcast database operations via ContentDownloader"""
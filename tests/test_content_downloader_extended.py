@@ -1,9 +1,12 @@
 """Tests for ContentDownloader — video download, article archive, podcast, playlists."""
 
 import json
-from unittest.mock import patch
+import os
+import sys
+from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
 from src.app_state import AppState
 
@@ -96,6 +99,11 @@ class TestParseDurationExtended:
 
         assert ContentDownloader._parse_duration("") is None
 
+    def test_too_many_fields_returns_none(self):
+        from src.content_downloader import ContentDownloader
+
+        assert ContentDownloader._parse_duration("1:02:03:04") is None
+
 
 # ── process_content_job ──────────────────────────────────────────
 
@@ -165,6 +173,29 @@ class TestSubscribePodcast:
                 pods = app_state.get_all_podcasts()
                 assert len(pods) >= 1
 
+    def test_subscribe_saves_artwork(self, downloader, app_state):
+        feed = {
+            "title": "Art Pod",
+            "author": "Host",
+            "description": "",
+            "artwork_url": "https://example.com/art.jpg",
+            "episodes": [],
+        }
+        art = MagicMock(status_code=200, content=b"jpeg-bytes")
+        with (
+            patch.object(downloader, "parse_podcast_feed", return_value=feed),
+            patch.object(downloader._session, "get", return_value=art),
+        ):
+            pod_id = downloader.subscribe_podcast("https://example.com/art-feed.xml")
+
+        art_path = app_state.get_podcast(pod_id)["artwork_path"]
+        with open(art_path, "rb") as f:
+            assert f.read() == b"jpeg-bytes"
+
+    def test_artwork_failure_returns_none(self, downloader):
+        with patch.object(downloader._session, "get", side_effect=requests.Timeout):
+            assert downloader._fetch_podcast_artwork("https://example.com/art.jpg") is None
+
     def test_subscribe_no_feed_returns_none(self, downloader):
         with patch.object(downloader, "parse_podcast_feed", return_value=None):
             result = downloader.subscribe_podcast("https://example.com/bad-feed")
@@ -175,16 +206,280 @@ class TestSubscribePodcast:
 
 
 class TestDownloadVideo:
-    @patch("shutil.which", return_value=None)
-    def test_no_ytdlp_returns_none(self, mock_which, downloader):
-        result = downloader.download_video("https://youtube.com/watch?v=abc")
+    def test_no_ytdlp_returns_none(self, downloader):
+        with patch.dict(sys.modules, {"yt_dlp": None}):
+            with patch("subprocess.Popen", side_effect=FileNotFoundError):
+                result = downloader.download_video("https://youtube.com/watch?v=abc")
         assert result is None
 
+    def test_download_videos_preserves_order(self, downloader):
+        urls = ["https://example.com/a", "https://example.com/b", "https://example.com/c"]
+
+        def fake_download(url):
+            return None if url.endswith("b") else f"/videos/{url[-1]}.mp4"
+
+        with patch.object(downloader, "download_video", side_effect=fake_download) as m:
+            assert downloader.download_videos(urls) == ["/videos/a.mp4", None, "/videos/c.mp4"]
+        assert m.call_count == 3
+
+    def test_download_videos_empty(self, downloader):
+        assert downloader.download_videos([]) == []
+
+    def test_extraction_error_returns_none(self, downloader):
+        fake_module = MagicMock()
+        fake_module.YoutubeDL.return_value.__enter__.return_value.extract_info.side_effect = (
+            Exception("Unsupported URL")
+        )
+        with patch.dict(sys.modules, {"yt_dlp": fake_module}):
+            assert downloader.download_video("https://example.com/nope") is None
+
+
+# ── download_podcast_episode ─────────────────────────────────────
+
+
+class TestDownloadPodcastEpisode:
+    def test_streams_episode_to_disk(self, downloader, app_state):
+        import io
+
+        pod_id = app_state.add_podcast(
+            feed_url="https://example.com/feed.xml", title="Pod", author="Host"
+        )
+        app_state.add_episode(
+            podcast_id=pod_id, title="Ep 1", audio_url="https://cdn.example.com/ep1.mp3"
+        )
+        (episode,) = app_state.get_episodes(pod_id)
+        resp = MagicMock(
+            raw=io.BytesIO(b"ID3" + b"\x00" * 4096), headers={"Content-Type": "audio/mpeg"}
+        )
+        with patch.object(downloader._session, "get", return_value=resp):
+            out = downloader.download_podcast_episode(pod_id, episode["id"])
+
+        assert out.endswith("Ep 1.mp3")
+        with open(out, "rb") as f:
+            assert f.read() == b"ID3" + b"\x00" * 4096
+        assert resp.raw.decode_content is True
+        assert app_state.get_episodes(pod_id)[0]["is_downloaded"]
+
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="posix_fadvise unavailable")
+    def test_page_cache_hints(self, downloader, app_state):
+        import io
+
+        pod_id = app_state.add_podcast(feed_url="https://example.com/feed.xml", title="Pod")
+        ep_id = app_state.add_episode(
+            podcast_id=pod_id, title="Ep 1", audio_url="https://cdn.example.com/ep1.mp3"
+        )
+        resp = MagicMock(raw=io.BytesIO(b"ID3"), headers={"Content-Type": "audio/mpeg"})
+        with (
+            patch.object(downloader._session, "get", return_value=resp),
+            patch("os.posix_fadvise") as fadvise,
+        ):
+            downloader.download_podcast_episode(pod_id, ep_id)
+
+        advice = [c.args[3] for c in fadvise.call_args_list]
+        assert advice == [os.POSIX_FADV_SEQUENTIAL, os.POSIX_FADV_DONTNEED]
+
+
+class TestEpisodeExtension:
+    @pytest.mark.parametrize(
+        "content_type, url, expected",
+        [
+            ("audio/mp4", "https://cdn.example.com/ep", ".m4a"),
+            ("audio/x-m4a; charset=binary", "https://cdn.example.com/ep", ".m4a"),
+            ("audio/ogg", "https://cdn.example.com/ep.mp3", ".ogg"),
+            ("application/octet-stream", "https://cdn.example.com/ep.OPUS?x=1", ".opus"),
+            ("", "https://cdn.example.com/ep?format=.m4a", ".mp3"),
+        ],
+    )
+    def test_extension(self, content_type, url, expected):
+        from src.content_downloader import _episode_extension
+
+        assert _episode_extension(content_type, url) == expected
+
+
+# ── parse_podcast_feed ───────────────────────────────────────────
+
+_RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Pod</title>
+<item><title>Ep 1</title><enclosure url="https://cdn.example.com/1.mp3" type="audio/mpeg"/></item>
+</channel></rss>"""
+
+
+class TestParsePodcastFeed:
+    def test_fetches_through_session(self, downloader):
+        resp = MagicMock(status_code=200, content=_RSS, headers={"ETag": '"e1"'})
+        with patch.object(downloader._session, "get", return_value=resp) as mock_get:
+            info = downloader.parse_podcast_feed("https://example.com/feed.xml")
+        assert mock_get.call_args[1]["headers"] == {}
+        assert info["title"] == "Pod"
+        assert [e["audio_url"] for e in info["episodes"]] == ["https://cdn.example.com/1.mp3"]
+        assert info["etag"] == '"e1"'
+
+    def test_unchanged_feed_skips_parsing(self, downloader, app_state):
+        app_state.add_podcast(feed_url="https://example.com/feed.xml", title="Pod")
+        (pod,) = app_state.get_all_podcasts()
+        app_state.update_podcast(pod["id"], etag='"e1"', last_modified="Mon, 01 Jan 2024")
+        (pod,) = app_state.get_due_podcasts()
+
+        resp = MagicMock(status_code=304)
+        with patch.object(downloader._session, "get", return_value=resp) as mock_get:
+            downloader.check_podcast_feeds()
+        assert mock_get.call_args[1]["headers"] == {
+            "If-None-Match": '"e1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024",
+        }
+        (pod,) = app_state.get_all_podcasts()
+        assert pod["last_checked"] is not None
+        assert pod["etag"] == '"e1"'
+
+    def test_identical_body_skips_feedparser(self, downloader, app_state):
+        app_state.add_podcast(feed_url="https://example.com/feed.xml", title="Pod")
+        resp = MagicMock(status_code=200, content=_RSS, headers={})
+        with patch.object(downloader._session, "get", return_value=resp):
+            downloader.check_podcast_feeds()
+            (pod,) = app_state.get_all_podcasts()
+            assert pod["feed_hash"]
+
+            with patch("feedparser.parse") as parse:
+                info = downloader.parse_podcast_feed(pod["feed_url"], pod)
+        parse.assert_not_called()
+        assert info["not_modified"] is True
+        assert info["feed_hash"] == pod["feed_hash"]
+
+
+# ── Spotify embed ────────────────────────────────────────────────
+
+
+class TestFetchSpotifyEmbed:
+    def test_parses_next_data_via_shared_session(self, downloader):
+        data = {
+            "props": {
+                "pageProps": {
+                    "state": {
+                        "data": {
+                            "entity": {
+                                "name": "Road Trip",
+                                "trackList": [
+                                    {
+                                        "title": "Song A",
+                                        "subtitle": "Band",
+                                        "duration": 200000,
+                                        "uri": "spotify:track:a",
+                                    },
+                                    {"title": "Song B", "subtitle": "Duo", "duration": 1000},
+                                ],
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        page = f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(data)}</script>'
+        resp = MagicMock(content=page.encode("utf-8"))
+        with patch.object(downloader._session, "get", return_value=resp) as mock_get:
+            tracks, title = downloader._fetch_spotify_embed("abc123")
+        assert title == "Road Trip"
+        assert [(t["title"], t["artist"]) for t in tracks] == [
+            ("Song A", "Band"),
+            ("Song B", "Duo"),
+        ]
+        assert tracks[0]["duration_ms"] == 200000
+        assert tracks[0]["spotify_uri"] == "spotify:track:a"
+        urls = [c[0][0] for c in mock_get.call_args_list]
+        assert "https://open.spotify.com/embed/playlist/abc123" in urls
+
+    def test_oembed_title_used_when_embed_has_no_tracks(self, downloader):
+        def fake_get(url, **kwargs):
+            if "oembed" in url:
+                return MagicMock(content=b'{"title": "From oEmbed"}')
+            return MagicMock(content=b"<html>nothing here</html>")
+
+        with (
+            patch.object(downloader._session, "get", side_effect=fake_get),
+            patch.object(
+                downloader, "_scrape_spotify_page", side_effect=lambda pid, h: ([], None)
+            ) as scrape,
+        ):
+            tracks, title = downloader._fetch_spotify_embed("abc123")
+        assert (tracks, title) == ([], "From oEmbed")
+        scrape.assert_called_once()
+
+    def test_scrape_matches_on_raw_bytes(self, downloader):
+        ld = {"track": [{"name": "Señor", "byArtist": {"name": "Ana"}}]}
+        page = (
+            '<meta property="og:title" content="Mañana Mix">'
+            f'<script type="application/ld+json">{json.dumps(ld, ensure_ascii=False)}</script>'
+        ).encode("utf-8")
+        with patch.object(downloader._session, "get", return_value=MagicMock(content=page)):
+            tracks, title = downloader._scrape_spotify_page("abc123", {})
+        assert title == "Mañana Mix"
+        assert [(t["title"], t["artist"]) for t in tracks] == [("Señor", "Ana")]
+
+    def test_oembed_failure_is_ignored(self, downloader):
+        with patch.object(downloader._session, "get", side_effect=requests.ConnectionError):
+            assert downloader._fetch_spotify_oembed_title("abc123", {}) is None
+
+
+class TestParseNextData:
+    def test_generic_walk_keeps_document_order(self, downloader):
+        data = {
+            "blocks": [
+                {"__typename": "Playlist", "name": "Mix"},
+                {"items": [{"track": {"name": "One"}}, {"type": "track", "name": "Two"}]},
+                {"entityType": "track", "title": "Three"},
+            ]
+        }
+        tracks, title = downloader._parse_next_data(data)
+        assert title == "Mix"
+        assert [t["title"] for t in tracks] == ["One", "Two", "Three"]
+
+    def test_generic_walk_stops_at_track_cap(self, downloader):
+        from src.constants import SPOTIFY_MAX_TRACKS
+
+        data = {"items": [{"track": {"name": f"T{i}"}} for i in range(SPOTIFY_MAX_TRACKS + 50)]}
+        tracks, _ = downloader._parse_next_data(data)
+        assert len(tracks) == SPOTIFY_MAX_TRACKS
+        assert tracks[0]["title"] == "T0"
+
 
 # ── archive_article ──────────────────────────────────────────────
 
 
 class TestArchiveArticle:
+    def test_archived_html_escaped_with_line_breaks(self, downloader):
+        article = {
+            "title": "<b>News</b>",
+            "author": "Reporter",
+            "date": "2024-05-01",
+            "text": "First & only\nSecond <line>",
+        }
+        fake = MagicMock()
+        fake.fetch_url.return_value = "<html></html>"
+        fake.extract.return_value = json.dumps(article)
+        with patch.dict(sys.modules, {"trafilatura": fake}):
+            path = downloader.archive_article("https://example.com/post")
+
+        with open(path, encoding="utf-8") as f:
+            page = f.read()
+        assert "<title>&lt;b&gt;News&lt;/b&gt;</title>" in page
+        assert "<article>First &amp; only<br>Second &lt;line&gt;</article>" in page
+
+    def test_metadata_embedded_as_json_ld(self, downloader):
+        article = {"title": "Café </script>", "author": "A", "date": "2024-05-01", "text": "B"}
+        fake = MagicMock()
+        fake.fetch_url.return_value = "<html></html>"
+        fake.extract.return_value = json.dumps(article)
+        with patch.dict(sys.modules, {"trafilatura": fake}):
+            path = downloader.archive_article("https://example.com/cafe")
+
+        with open(path, encoding="utf-8") as f:
+            page = f.read()
+        block = page.split('<script type="application/ld+json">', 1)[1].split("</script>", 1)[0]
+        meta = json.loads(block)
+        assert meta["@type"] == "Article"
+        assert meta["headline"] == "Café </script>"
+        assert meta["url"] == "https://example.com/cafe"
+        assert not list(downloader.articles_dir.glob("*.json"))
+
     def test_archive_graceful_on_missing_trafilatura(self, downloader):
         """If trafilatura is not available, should return None gracefully."""
         # The method imports trafilatura inline — if it's not installed,
@@ -208,3 +503,59 @@ class TestCheckPodcastFeeds:
         app_state.add_podcast(feed_url="https://example.com/feed.xml", title="Test Pod")
         with patch.object(downloader, "parse_podcast_feed", return_value=None):
             downloader.check_podcast_feeds()
+
+    def test_all_due_feeds_parsed_and_stored(self, downloader, app_state):
+        urls = [f"https://example.com/feed{i}.xml" for i in range(3)]
+        for i, url in enumerate(urls):
+            app_state.add_podcast(feed_url=url, title=f"Pod {i}")
+
+        def fake_parse(feed_url, pod):
+            if feed_url.endswith("feed1.xml"):
+                raise RuntimeError("boom")
+            return {
+                "title": "",
+                "episodes": [{"title": "Ep", "audio_url": feed_url + "/ep.mp3"}],
+            }
+
+        with patch.object(downloader, "parse_podcast_feed", side_effect=fake_parse) as m:
+            downloader.check_podcast_feeds()
+
+        assert sorted(c.args[0] for c in m.call_args_list) == urls
+        counts = {
+            p["feed_url"]: len(app_state.get_episodes(p["id"]))
+            for p in app_state.get_all_podcasts()
+        }
+        assert counts == {urls[0]: 1, urls[1]: 0, urls[2]: 1}
+
+    def test_auto_download_submitted_per_feed(self, downloader, app_state):
+        downloader.config["podcasts"]["auto_download"] = True
+        downloader.config["podcasts"]["auto_download_per_check"] = 2
+        urls = [f"https://example.com/feed{i}.xml" for i in range(2)]
+        for i, url in enumerate(urls):
+            app_state.add_podcast(feed_url=url, title=f"Pod {i}")
+
+        def fake_parse(feed_url, pod):
+            eps = [{"title": f"Ep {n}", "audio_url": f"{feed_url}/{n}.mp3"} for n in range(3)]
+            return {"title": "", "episodes": eps}
+
+        with (
+            patch.object(downloader, "parse_podcast_feed", side_effect=fake_parse),
+            patch.object(downloader, "_download_pool") as pool,
+        ):
+            downloader.check_podcast_feeds()
+
+        submitted = [c.args[1:] for c in pool.submit.call_args_list]
+        assert len(submitted) == 4
+        for pod in app_state.get_all_podcasts():
+            assert sum(1 for pod_id, _ in submitted if pod_id == pod["id"]) == 2
+
+    def test_episode_already_queued_is_not_resubmitted(self, downloader):
+        with patch.object(downloader, "_download_pool") as pool:
+            downloader._queue_episode_download("pod", "ep1")
+            downloader._queue_episode_download("pod", "ep1")
+        pool.submit.assert_called_once_with(downloader.download_podcast_episode, "pod", "ep1")
+
+        # Once the download finishes the episode can be queued again
+        done_callback = pool.submit.return_value.add_done_callback.call_args[0][0]
+        done_callback(pool.submit.return_value)
+        assert downloader._pending_episodes == set()
@@ -2,6 +2,12 @@
 Unit tests for the DiscMonitor module
 """
 
+import select
+import struct
+import subprocess
+import time
+from pathlib import Path
+
 import pytest
 
 
@@ -39,6 +45,9 @@ class TestDiscMonitor:
         """Test title extraction from volume names"""
         assert monitor.extract_title_from_volume("THE_MATRIX") == "THE MATRIX"
         assert monitor.extract_title_from_volume("MY_DVD_DISC") == "MY"
+        assert monitor.extract_title_from_volume("LOTR_DISC_2") == "LOTR"
+        assert monitor.extract_title_from_volume("2001_A_SPACE_ODYSSEY") == "2001 A SPACE ODYSSEY"
+        assert monitor.extract_title_from_volume("SEVEN_DVD") == "SEVEN"
 
     @pytest.mark.unit
     def test_process_disc_enqueues_job(self, monitor, app_state, mock_dvd_structure):
@@ -88,6 +97,103 @@ class TestDiscMonitor:
         empty_dir.mkdir()
         assert monitor.get_disc_type(empty_dir) == "unknown"
 
+    @pytest.mark.unit
+    def test_mounted_volumes_remember_disc_type(self, monitor, tmp_path):
+        """The volume scan records each disc's type for process_disc to reuse"""
+        from unittest.mock import patch
+
+        (tmp_path / "MOVIE" / "VIDEO_TS").mkdir(parents=True)
+        (tmp_path / "ALBUM").mkdir()
+        (tmp_path / "ALBUM" / "Track 01.AIFF").write_bytes(b"\x00")
+        (tmp_path / "DOCS").mkdir()
+        (tmp_path / "stray.aiff").write_bytes(b"\x00")
+        monitor.mount_path = tmp_path
+
+        assert monitor.get_mounted_volumes() == {"MOVIE", "ALBUM"}
+        with patch.object(monitor, "get_disc_type") as get_type:
+            monitor.process_disc("ALBUM")
+        get_type.assert_not_called()
+        assert monitor.app_state.get_all_jobs()[0]["disc_type"] == "audio_cd"
+
+    @pytest.mark.unit
+    def test_unchanged_mounts_not_relisted(self, monitor, tmp_path):
+        """Polling again without a mount change reuses each volume's classification"""
+        from unittest.mock import patch
+
+        from src import disc_monitor
+
+        volumes = tmp_path / "Volumes"
+        (volumes / "MOVIE" / "VIDEO_TS").mkdir(parents=True)
+        (volumes / "USB_STICK").mkdir()
+        monitor.mount_path = volumes
+        monitor._mtime_fast_path = False
+        disc_monitor._classify_mounted.cache_clear()
+
+        with patch(
+            "src.disc_monitor._classify_volume", wraps=disc_monitor._classify_volume
+        ) as classify:
+            assert monitor.get_mounted_volumes() == {"MOVIE"}
+            assert monitor.get_mounted_volumes() == {"MOVIE"}
+        assert classify.call_count == 2
+
+    @pytest.mark.unit
+    def test_unchanged_mount_path_skips_scan(self, monitor, tmp_path):
+        """While polling, an unchanged mount-path mtime reuses the last result"""
+        import os
+        from unittest.mock import patch
+
+        volumes = tmp_path / "Volumes"
+        (volumes / "MOVIE" / "VIDEO_TS").mkdir(parents=True)
+        monitor.mount_path = volumes
+        assert monitor.get_mounted_volumes() == {"MOVIE"}
+
+        with patch("src.disc_monitor.os.scandir") as scandir:
+            assert monitor.get_mounted_volumes() == {"MOVIE"}
+        scandir.assert_not_called()
+
+        (volumes / "SHOW" / "VIDEO_TS").mkdir(parents=True)
+        st = volumes.stat()
+        os.utime(volumes, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+        assert monitor.get_mounted_volumes() == {"MOVIE", "SHOW"}
+
+    @pytest.mark.unit
+    def test_disc_mounted_over_existing_dir_detected(self, monitor, tmp_path):
+        """A directory that becomes a disc is found even if the mount-path mtime is unchanged"""
+        import os
+        from unittest.mock import patch
+
+        volumes = tmp_path / "Volumes"
+        (volumes / "MOVIE" / "VIDEO_TS").mkdir(parents=True)
+        (volumes / "NEW_DISC").mkdir()
+        monitor.mount_path = volumes
+        assert monitor.get_mounted_volumes() == {"MOVIE"}
+        with patch("src.disc_monitor.os.scandir") as scandir:
+            assert monitor.get_mounted_volumes() == {"MOVIE"}
+        scandir.assert_not_called()
+
+        # The disc's files appear under the existing directory
+        st = volumes.stat()
+        (volumes / "NEW_DISC" / "VIDEO_TS").mkdir()
+        os.utime(volumes, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert monitor.get_mounted_volumes() == {"MOVIE", "NEW_DISC"}
+
+    @pytest.mark.unit
+    def test_unreadable_volume_rescanned_next_poll(self, monitor, tmp_path):
+        """A volume that couldn't be listed yet keeps the fast path off"""
+        from unittest.mock import patch
+
+        volumes = tmp_path / "Volumes"
+        (volumes / "MOVIE" / "VIDEO_TS").mkdir(parents=True)
+        monitor.mount_path = volumes
+        with patch("src.disc_monitor._classify_mounted", side_effect=OSError("not ready")):
+            assert monitor.get_mounted_volumes() == set()
+        assert monitor.get_mounted_volumes() == {"MOVIE"}
+
+    @pytest.mark.unit
+    def test_missing_mount_path_has_no_volumes(self, monitor, tmp_path):
+        monitor.mount_path = tmp_path / "nowhere"
+        assert monitor.get_mounted_volumes() == set()
+
     @pytest.mark.unit
     def test_process_disc_audio_cd(self, monitor, app_state, tmp_path):
         """Test that audio CD processing creates a job with disc_type=audio_cd"""
@@ -101,3 +207,448 @@ class TestDiscMonitor:
         jobs = app_state.get_all_jobs()
         assert len(jobs) == 1
         assert jobs[0]["disc_type"] == "audio_cd"
+
+    @pytest.mark.unit
+    def test_start_waits_on_mount_events(self, monitor, tmp_path):
+        """With a mount watcher the loop sleeps on events rather than polling"""
+        from unittest.mock import MagicMock, patch
+
+        monitor.mount_path = tmp_path
+        watcher = MagicMock()
+        watcher.wait.side_effect = lambda timeout: setattr(monitor, "running", False)
+        with (
+            patch("src.disc_monitor._MountWatcher.create", return_value=watcher),
+            patch("src.disc_monitor.send_notification"),
+            patch("src.disc_monitor.time.sleep") as sleep,
+        ):
+            monitor.start()
+        # The poll interval still bounds the wait, so incomplete scans are retried
+        watcher.wait.assert_called_once_with(monitor.check_interval)
+        watcher.close.assert_called_once()
+        sleep.assert_not_called()
+
+    @pytest.mark.unit
+    def test_new_discs_processed_off_the_poll_loop(self, monitor, tmp_path):
+        """check_for_new_discs returns while the disc is still being processed"""
+        import threading
+        from unittest.mock import patch
+
+        (tmp_path / "MOVIE" / "VIDEO_TS").mkdir(parents=True)
+        monitor.mount_path = tmp_path
+        release = threading.Event()
+        done = threading.Event()
+
+        def slow_process(volume_name):
+            release.wait(5)
+            done.set()
+            raise RuntimeError("rip failed")
+
+        with patch.object(monitor, "process_disc", side_effect=slow_process):
+            monitor.check_for_new_discs()
+            assert monitor.known_volumes == {"MOVIE"}
+            assert not done.is_set()
+            release.set()
+            assert done.wait(5)
+            monitor._worker.shutdown(wait=True)
+
+    @pytest.mark.unit
+    def test_restart_skips_discs_already_handled(self, app_state, tmp_path):
+        """Discs processed before a restart are only processed again after a remount"""
+        import json
+        from unittest.mock import MagicMock, patch
+
+        from src.disc_monitor import DiscMonitor
+
+        volumes = tmp_path / "Volumes"
+        (volumes / "MOVIE" / "VIDEO_TS").mkdir(parents=True)
+        (volumes / "SHOW" / "VIDEO_TS").mkdir(parents=True)
+
+        def run_start():
+            monitor = DiscMonitor(app_state=app_state)
+            monitor.mount_path = volumes
+            watcher = MagicMock()
+
+            def stop_when_idle(*args):
+                # Let the startup discs finish instead of being cancelled
+                monitor._worker.submit(lambda: None).result()
+                monitor.running = False
+
+            watcher.wait.side_effect = stop_when_idle
+            with (
+                patch("src.disc_monitor._MountWatcher.create", return_value=watcher),
+                patch("src.disc_monitor.send_notification"),
+                patch.object(monitor, "process_disc") as process,
+            ):
+                monitor.start()
+            return monitor, {call.args[0] for call in process.call_args_list}
+
+        monitor, processed = run_start()
+        assert processed == {"MOVIE", "SHOW"}
+
+        # SHOW was ejected and a disc mounted under the same name while stopped
+        seen = json.loads(monitor._seen_path.read_text())
+        seen["SHOW"][1] += 1
+        monitor._seen_path.write_text(json.dumps(seen))
+        _, processed = run_start()
+        assert processed == {"SHOW"}
+
+        monitor.clear_known_volumes()
+        _, processed = run_start()
+        assert processed == {"MOVIE", "SHOW"}
+
+    @pytest.mark.unit
+    def test_only_successfully_processed_discs_are_remembered(self, app_state, tmp_path):
+        """Failed, cancelled or notify-only discs are processed again after a restart"""
+        from unittest.mock import MagicMock, patch
+
+        from src.disc_monitor import DiscMonitor
+
+        volumes = tmp_path / "Volumes"
+        for vol in ("GOOD", "BAD", "LATER"):
+            (volumes / vol / "VIDEO_TS").mkdir(parents=True)
+
+        def process(volume_name):
+            if volume_name == "BAD":
+                raise RuntimeError("rip failed")
+            return True
+
+        monitor = DiscMonitor(app_state=app_state)
+        monitor.mount_path = volumes
+        with (
+            patch.object(monitor, "process_disc", side_effect=process),
+            patch("src.disc_monitor.send_notification"),
+        ):
+            monitor._safe_process_disc("GOOD")
+            monitor._safe_process_disc("BAD")
+            monitor.config["automation"]["auto_detect_disc"] = False
+            monitor.check_for_new_discs()
+        assert set(monitor._seen_volumes) == {"GOOD"}
+
+        # Restart with auto-rip on: only GOOD is skipped
+        monitor = DiscMonitor(app_state=app_state)
+        monitor.mount_path = volumes
+        watcher = MagicMock()
+
+        def stop_when_idle(*args):
+            monitor._worker.submit(lambda: None).result()
+            monitor.running = False
+
+        watcher.wait.side_effect = stop_when_idle
+        with (
+            patch("src.disc_monitor._MountWatcher.create", return_value=watcher),
+            patch("src.disc_monitor.send_notification"),
+            patch.object(monitor, "process_disc") as process_disc,
+        ):
+            monitor.start()
+        assert {c.args[0] for c in process_disc.call_args_list} == {"BAD", "LATER"}
+
+    @pytest.mark.unit
+    def test_standalone_shutdown_stops_rip_without_waiting(self, monitor, tmp_path):
+        """Without a job queue, stopping cancels the rip instead of blocking on it"""
+        import threading
+        from unittest.mock import MagicMock, patch
+
+        volumes = tmp_path / "Volumes"
+        (volumes / "MOVIE" / "VIDEO_TS").mkdir(parents=True)
+        monitor.mount_path = volumes
+        monitor.app_state = None
+        cancelled = threading.Event()
+        monitor.ripper = MagicMock()
+        monitor.ripper.cancel.side_effect = cancelled.set
+
+        def rip(**kwargs):
+            cancelled.wait(5)
+            return None  # HandBrake was terminated
+
+        monitor.ripper.rip_disc.side_effect = rip
+        watcher = MagicMock()
+        watcher.wait.side_effect = lambda timeout: setattr(monitor, "running", False)
+        with (
+            patch("src.disc_monitor._MountWatcher.create", return_value=watcher),
+            patch("src.disc_monitor.send_notification"),
+            patch.object(monitor, "get_disc_hints", return_value={}),
+        ):
+            monitor.start()
+            monitor.ripper.cancel.assert_called_once()
+            monitor._worker.shutdown(wait=True)
+        # The cancelled rip is retried after a restart
+        assert monitor._seen_volumes == {}
+
+    @pytest.mark.unit
+    def test_ejected_discs_are_forgotten(self, monitor, tmp_path):
+        import json
+        from unittest.mock import patch
+
+        volumes = tmp_path / "Volumes"
+        (volumes / "MOVIE" / "VIDEO_TS").mkdir(parents=True)
+        monitor.mount_path = volumes
+        with patch.object(monitor, "process_disc"):
+            monitor._safe_process_disc("MOVIE")
+        monitor.known_volumes = {"MOVIE"}
+        assert "MOVIE" in monitor._seen_volumes
+
+        (volumes / "MOVIE" / "VIDEO_TS").rmdir()
+        (volumes / "MOVIE").rmdir()
+        monitor.check_for_new_discs()
+        assert monitor._seen_volumes == {}
+        assert json.loads(monitor._seen_path.read_text()) == {}
+
+    @pytest.mark.unit
+    def test_audio_cd_info_keeps_track_order(self, monitor, tmp_path):
+        """Concurrent probes still report durations in track order"""
+        from unittest.mock import MagicMock, patch
+
+        cd_dir = tmp_path / "CD"
+        cd_dir.mkdir()
+        for n in (1, 2, 3):
+            (cd_dir / f"Track {n:02d}.aiff").write_bytes(b"\x00")
+
+        def fake_run(cmd, **kwargs):
+            if cmd[-1].endswith("02.aiff"):
+                raise subprocess.TimeoutExpired(cmd, 10)
+            duration = 100.0 if cmd[-1].endswith("01.aiff") else 300.0
+            return MagicMock(stdout=f"{duration}\n")
+
+        with patch("subprocess.run", side_effect=fake_run):
+            info = monitor.get_audio_cd_info(cd_dir)
+        assert info["track_count"] == 3
+        assert info["track_durations"] == [100.0, 300.0]
+        assert info["total_duration_seconds"] == 400.0
+
+    @pytest.mark.unit
+    def test_audio_cd_durations_from_headers(self, monitor, tmp_path):
+        """AIFF and WAV tracks are timed from their headers without ffprobe"""
+        import wave
+        from unittest.mock import patch
+
+        cd_dir = tmp_path / "CD"
+        cd_dir.mkdir()
+        # 2-channel 16-bit 44.1 kHz AIFF header claiming 3 minutes of samples
+        comm = struct.pack(">hIhHQ", 2, 44100 * 180, 16, 0x400E, 0xAC44 << 48)
+        body = b"AIFF" + b"COMM" + struct.pack(">I", len(comm)) + comm
+        aiff = b"FORM" + struct.pack(">I", len(body)) + body
+        (cd_dir / "Track 01.aiff").write_bytes(aiff)
+        with wave.open(str(cd_dir / "Track 02.wav"), "wb") as w:
+            w.setnchannels(2)
+            w.setsampwidth(2)
+            w.setframerate(44100)
+            w.writeframes(b"\x00" * 4 * 22050)
+
+        with patch("subprocess.run") as run:
+            info = monitor.get_audio_cd_info(cd_dir)
+        run.assert_not_called()
+        assert info["track_durations"] == [180.0, 0.5]
+
+    @pytest.mark.unit
+    def test_audio_cd_info_from_toc(self, monitor, tmp_path):
+        """With libdiscid the TOC supplies the disc ID and durations; no track is probed"""
+        from unittest.mock import MagicMock, patch
+
+        cd_dir = tmp_path / "CD"
+        cd_dir.mkdir()
+        for n in (1, 2):
+            (cd_dir / f"Track {n:02d}.aiff").write_bytes(b"\x00")
+        disc = MagicMock(
+            id="lwHl8fGzJyLXQR33ug60E8jhf4k-",
+            toc="1 2 33000 150 15150",
+            track_offsets=(150, 15150),
+            track_lengths=(15000, 17850),
+        )
+        libdiscid = MagicMock()
+        libdiscid.read.return_value = disc
+
+        with (
+            patch.dict("sys.modules", {"libdiscid": libdiscid}),
+            patch.object(monitor, "_device_for", return_value="/dev/sr0"),
+            patch.object(monitor, "_probe_duration") as probe,
+        ):
+            info = monitor.get_audio_cd_info(cd_dir)
+        libdiscid.read.assert_called_once_with("/dev/sr0")
+        probe.assert_not_called()
+        assert info["discid"] == "lwHl8fGzJyLXQR33ug60E8jhf4k-"
+        assert info["track_durations"] == [200.0, 238.0]
+        assert info["total_duration_seconds"] == 438.0
+        assert len(info["track_files"]) == 2
+
+    @pytest.mark.unit
+    def test_device_for_reads_mount_table(self, monitor, tmp_path):
+        from unittest.mock import patch
+
+        mounts = tmp_path / "mounts"
+        mounts.write_text(
+            "/dev/sda1 / ext4 rw 0 0\n/dev/sr0 /media/user/My\\040Album iso9660 ro 0 0\n"
+        )
+        with (
+            patch("src.disc_monitor._PROC_MOUNTS", str(mounts)),
+            patch("src.disc_monitor.sys.platform", "linux"),
+        ):
+            assert monitor._device_for(Path("/media/user/My Album")) == "/dev/sr0"
+            assert monitor._device_for(Path("/media/user/Other")) is None
+
+    @pytest.mark.unit
+    def test_dvd_hints_from_handbrake_scan(self, monitor, mock_dvd_structure):
+        """Title durations are read from the scan summary, then HandBrake is stopped"""
+        import io
+        from unittest.mock import MagicMock, patch
+
+        scan = (
+            "[12:00:01] scan: DVD has 2 title(s)\n"
+            "+ title 1:\n  + duration: 01:58:30\n  + chapters:\n    + 1: duration 00:05:00\n"
+            "+ title 2:\n  + duration: 00:03:10\n"
+            "HandBrake has exited.\n"
+            "+ duration: 09:00:00\n"
+        )
+        proc = MagicMock(stderr=io.StringIO(scan))
+        proc.__enter__.return_value = proc
+        proc.poll.return_value = None
+        with patch("src.disc_monitor.subprocess.Popen", return_value=proc):
+            hints = monitor.get_dvd_disc_hints(mock_dvd_structure)
+        assert hints["title_count"] == 2
+        assert hints["estimated_runtime_min"] == 118
+        proc.kill.assert_called_once()
+
+    @pytest.mark.unit
+    def test_hung_handbrake_scan_is_killed(self, monitor, mock_dvd_structure, tmp_path):
+        """A scan that outlives handbrake_scan_timeout is killed and yields no hints"""
+        fake_handbrake = tmp_path / "HandBrakeCLI"
+        fake_handbrake.write_text("#!/bin/sh\nexec sleep 30\n")
+        fake_handbrake.chmod(0o755)
+        monitor._handbrake = str(fake_handbrake)
+        monitor._scan_timeout = 0.2
+
+        start = time.monotonic()
+        hints = monitor.get_dvd_disc_hints(mock_dvd_structure)
+        assert time.monotonic() - start < 5
+        assert hints["estimated_runtime_min"] is None
+
+    @pytest.mark.unit
+    def test_dvd_hints_without_handbrake(self, monitor, mock_dvd_structure):
+        from unittest.mock import patch
+
+        with patch("src.disc_monitor.subprocess.Popen", side_effect=FileNotFoundError):
+            hints = monitor.get_dvd_disc_hints(mock_dvd_structure)
+        assert hints["title_count"] == 0
+        assert hints["estimated_runtime_min"] is None
+
+    @pytest.mark.unit
+    def test_dvd_hints_from_ifo_files(self, monitor, mock_dvd_structure):
+        """IFO playback times are used without spawning HandBrake"""
+        from unittest.mock import patch
+
+        video_ts = mock_dvd_structure / "VIDEO_TS"
+        # Title 1 -> VTS 1 title 1 (1:58:30); title 2 -> VTS 1 title 2 (0:00:05, a logo)
+        vmg = bytearray(2 * 2048)
+        vmg[:12] = b"DVDVIDEO-VMG"
+        struct.pack_into(">I", vmg, 0xC4, 1)
+        struct.pack_into(">H", vmg, 2048, 2)
+        struct.pack_into(">BB", vmg, 2048 + 8 + 6, 1, 1)
+        struct.pack_into(">BB", vmg, 2048 + 20 + 6, 1, 2)
+        (video_ts / "VIDEO_TS.IFO").write_bytes(bytes(vmg))
+        vts = bytearray(2 * 2048)
+        vts[:12] = b"DVDVIDEO-VTS"
+        struct.pack_into(">I", vts, 0xCC, 1)
+        struct.pack_into(">H", vts, 2048, 2)
+        struct.pack_into(">II", vts, 2048 + 8, 0x81000000, 0x100)
+        struct.pack_into(">II", vts, 2048 + 16, 0x82000000, 0x200)
+        struct.pack_into(">BBB", vts, 2048 + 0x104, 0x01, 0x58, 0x30)
+        struct.pack_into(">BBB", vts, 2048 + 0x204, 0x00, 0x00, 0x05)
+        (video_ts / "VTS_01_0.IFO").write_bytes(bytes(vts))
+
+        with patch("src.disc_monitor.subprocess.Popen") as popen:
+            hints = monitor.get_dvd_disc_hints(mock_dvd_structure)
+        popen.assert_not_called()
+        assert hints["title_count"] == 1
+        assert hints["estimated_runtime_min"] == 118
+
+    @pytest.mark.unit
+    def test_bluray_hints_from_playlists(self, monitor, tmp_path):
+        """MPLS play item IN/OUT times give the Blu-ray runtime"""
+        from unittest.mock import patch
+
+        playlist_dir = tmp_path / "BD" / "BDMV" / "PLAYLIST"
+        playlist_dir.mkdir(parents=True)
+        items = [(0, 45000 * 3600), (45000 * 10, 45000 * 610)]  # 60 min + 10 min
+        mpls = bytearray(b"MPLS0200" + struct.pack(">I", 40) + bytes(28))
+        mpls += struct.pack(">IHHH", 0, 0, len(items), 0)
+        for in_time, out_time in items:
+            mpls += struct.pack(">H", 20) + b"00001M2TS" + bytes(3)
+            mpls += struct.pack(">II", in_time, out_time)
+        (playlist_dir / "00800.mpls").write_bytes(bytes(mpls))
+
+        with patch("src.disc_monitor.subprocess.Popen") as popen:
+            hints = monitor.get_dvd_disc_hints(tmp_path / "BD")
+        popen.assert_not_called()
+        assert hints["title_count"] == 1
+        assert hints["estimated_runtime_min"] == 70
+
+    @pytest.mark.unit
+    def test_disc_hints_cached_by_fingerprint(self, monitor, mock_dvd_structure):
+        """Re-inserting the same disc reuses the first scan's hints"""
+        from unittest.mock import patch
+
+        (mock_dvd_structure / "VIDEO_TS" / "VTS_01_1.VOB").write_bytes(b"\x00" * 64)
+        hints = {"title_count": 3, "estimated_runtime_min": 120}
+        with patch.object(monitor, "get_dvd_disc_hints", return_value=hints) as scan:
+            first = monitor.get_disc_hints(mock_dvd_structure, "dvd")
+            second = monitor.get_disc_hints(mock_dvd_structure, "dvd")
+        assert first == second == hints
+        scan.assert_called_once()
+
+    @pytest.mark.unit
+    def test_failed_disc_scan_not_cached(self, monitor, mock_dvd_structure):
+        """A scan that found no titles is retried on the next insertion"""
+        from unittest.mock import patch
+
+        (mock_dvd_structure / "VIDEO_TS" / "VTS_01_1.VOB").write_bytes(b"\x00" * 64)
+        failed = {"disc_label": "TEST_DVD", "estimated_runtime_min": None, "title_count": 0}
+        hints = {"title_count": 3, "estimated_runtime_min": 120}
+        with patch.object(monitor, "get_dvd_disc_hints", side_effect=[failed, hints]) as scan:
+            assert monitor.get_disc_hints(mock_dvd_structure, "dvd") == failed
+            assert monitor.get_disc_hints(mock_dvd_structure, "dvd") == hints
+        assert scan.call_count == 2
+
+    @pytest.mark.unit
+    def test_unreadable_disc_skips_hints_cache(self, monitor, mock_dvd_structure):
+        """Without a fingerprint the disc is scanned and the cache is not touched"""
+        from unittest.mock import patch
+
+        hints = {"title_count": 3, "estimated_runtime_min": 120}
+        with (
+            patch.object(monitor, "disc_fingerprint", return_value=None),
+            patch.object(monitor, "_get_hints_cache") as get_cache,
+            patch.object(monitor, "get_dvd_disc_hints", return_value=hints),
+        ):
+            assert monitor.get_disc_hints(mock_dvd_structure, "dvd") == hints
+        get_cache.assert_not_called()
+
+    @pytest.mark.unit
+    def test_fingerprint_tracks_content(self, monitor, mock_dvd_structure):
+        """A different set of files on the disc gives a different fingerprint"""
+        before = monitor.disc_fingerprint(mock_dvd_structure, "dvd")
+        (mock_dvd_structure / "VIDEO_TS" / "VTS_02_1.VOB").write_bytes(b"\x00")
+        assert monitor.disc_fingerprint(mock_dvd_structure, "dvd") != before
+        assert monitor.disc_fingerprint(mock_dvd_structure, "unknown") is None
+
+
+@pytest.mark.skipif(not hasattr(select, "epoll"), reason="mount events need Linux epoll")
+class TestMountWatcher:
+    def test_idle_wait_times_out(self):
+        from src.disc_monitor import _MountWatcher
+
+        watcher = _MountWatcher.create()
+        try:
+            assert watcher.wait(timeout=0) is False
+        finally:
+            watcher.close()
+
+    def test_wake_interrupts_wait(self):
+        from src.disc_monitor import _MountWatcher
+
+        watcher = _MountWatcher.create()
+        try:
+            watcher.wake()
+            start = time.monotonic()
+            assert watcher.wait(timeout=5) is False
+            assert time.monotonic() - start < 1
+        finally:
+            watcher.close()
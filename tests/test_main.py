@@ -2,6 +2,7 @@
 
 import json
 import logging
+import shutil
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -84,6 +85,99 @@ class TestSyncAlbumPoster:
         me = MagicMock()
         _sync_album_poster(str(album_dir), metadata, me, logger)
 
+    def test_poster_and_track_metadata_per_audio_file(self, tmp_path, logger):
+        from src.utils import get_data_dir
+        from src.workers.poster_sync import sync_album_poster
+
+        poster = tmp_path / "poster.jpg"
+        poster.write_bytes(b"\xff\xd8poster")
+        album_dir = tmp_path / "Album"
+        album_dir.mkdir()
+        for name in ("10 - Last.flac", "2 - Second.flac", "cover.jpg"):
+            (album_dir / name).touch()
+        (get_data_dir() / "thumbnails").mkdir(exist_ok=True)
+        meta_dir = get_data_dir() / "metadata"
+        meta_dir.mkdir(exist_ok=True)
+        (meta_dir / "2 - Second.json").write_text(json.dumps({"title": "Second"}))
+
+        sync_album_poster(str(album_dir), {"poster_file": str(poster)}, MagicMock(), logger)
+
+        thumbs = get_data_dir() / "thumbnails"
+        assert sorted(p.name for p in thumbs.iterdir()) == [
+            "10 - Last_poster.jpg",
+            "2 - Second_poster.jpg",
+        ]
+        track_text = (meta_dir / "2 - Second.json").read_text()
+        assert json.loads(track_text)["poster_file"] == str(thumbs / "2 - Second_poster.jpg")
+        assert "\n" not in track_text and ": " not in track_text  # compact JSON
+
+        # Posters are independent copies: rewriting the source in place later
+        # (as poster downloads do) must not change them
+        poster.write_bytes(b"\xff\xd8another title's poster")
+        assert (thumbs / "10 - Last_poster.jpg").read_bytes() == b"\xff\xd8poster"
+        poster.write_bytes(b"\xff\xd8poster")
+
+        # A second sync leaves the already-correct JSON untouched
+        inode = (meta_dir / "2 - Second.json").stat().st_ino
+        sync_album_poster(str(album_dir), {"poster_file": str(poster)}, MagicMock(), logger)
+        assert (meta_dir / "2 - Second.json").stat().st_ino == inode
+        assert not list(meta_dir.glob("*.tmp"))
+
+    def test_new_cover_replaces_poster_without_touching_old(self, tmp_path, logger):
+        from src.utils import get_data_dir
+        from src.workers.poster_sync import sync_album_poster
+
+        old_cover, new_cover = tmp_path / "old.jpg", tmp_path / "new.jpg"
+        old_cover.write_bytes(b"old")
+        new_cover.write_bytes(b"new")
+        album_dir = tmp_path / "Album"
+        album_dir.mkdir()
+        (album_dir / "01.mp3").touch()
+        (get_data_dir() / "thumbnails").mkdir(exist_ok=True)
+
+        sync_album_poster(str(album_dir), {"poster_file": str(old_cover)}, MagicMock(), logger)
+        sync_album_poster(str(album_dir), {"poster_file": str(new_cover)}, MagicMock(), logger)
+
+        assert (get_data_dir() / "thumbnails" / "01_poster.jpg").read_bytes() == b"new"
+        assert old_cover.read_bytes() == b"old"
+
+    def test_cover_read_once_per_album(self, tmp_path, logger):
+        """Only the first track's poster is copied from the cover itself"""
+        from src.utils import get_data_dir
+        from src.workers.poster_sync import sync_album_poster
+
+        cover = tmp_path / "cover.jpg"
+        cover.write_bytes(b"cover")
+        album_dir = tmp_path / "Album"
+        album_dir.mkdir()
+        for n in range(1, 4):
+            (album_dir / f"{n:02d}.mp3").touch()
+        thumbs = get_data_dir() / "thumbnails"
+        thumbs.mkdir(exist_ok=True)
+
+        with patch("src.workers.poster_sync.shutil.copyfile", wraps=shutil.copyfile) as copy:
+            sync_album_poster(str(album_dir), {"poster_file": str(cover)}, MagicMock(), logger)
+
+        sources = [call.args[0] for call in copy.call_args_list]
+        assert sources.count(str(cover)) == 1
+        assert len(sources) == 3
+        inodes = {(thumbs / f"{n:02d}_poster.jpg").stat().st_ino for n in range(1, 4)}
+        assert len(inodes) == 3 and cover.stat().st_ino not in inodes
+
+    def test_video_poster_is_independent_copy(self, tmp_path, logger):
+        from src.utils import get_data_dir
+        from src.workers.poster_sync import sync_video_poster
+
+        poster = tmp_path / "poster.jpg"
+        poster.write_bytes(b"\xff\xd8poster")
+        (get_data_dir() / "thumbnails").mkdir(exist_ok=True)
+        metadata = {"poster_file": str(poster)}
+        sync_video_poster("/movies/Film (2020).mp4", metadata, MagicMock(), logger)
+        dest = get_data_dir() / "thumbnails" / "Film (2020)_poster.jpg"
+        assert dest.read_bytes() == b"\xff\xd8poster"
+        assert dest.stat().st_ino != poster.stat().st_ino
+        assert metadata["poster_file"] == str(dest)
+
 
 # ── job_worker basics ────────────────────────────────────────────
 
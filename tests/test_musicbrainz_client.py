@@ -224,6 +224,35 @@ class TestValidateReleaseDurations:
         assert result is None
 
 
+# ── _fetch_cover_art_url ─────────────────────────────────────────
+
+
+class TestFetchCoverArtUrl:
+    def _resp(self, content_type, images=None):
+        resp = MagicMock()
+        resp.status_code = 200
+        resp.headers = {"Content-Type": content_type}
+        resp.json.return_value = {"images": images or []}
+        return resp
+
+    def test_prefers_front_image(self, client):
+        resp = self._resp(
+            "application/json",
+            [
+                {"types": ["Back"], "image": "https://cover.art/back.jpg"},
+                {"types": ["Front"], "image": "https://cover.art/front.jpg"},
+            ],
+        )
+        with patch.object(client, "_mb_request", return_value=resp):
+            assert client._fetch_cover_art_url("rel-1") == "https://cover.art/front.jpg"
+
+    def test_non_json_body_not_parsed(self, client):
+        resp = self._resp("text/html")
+        with patch.object(client, "_mb_request", return_value=resp):
+            assert client._fetch_cover_art_url("rel-1") is None
+        resp.json.assert_not_called()
+
+
 # ── lookup_musicbrainz_by_release_id ─────────────────────────────
 
 
@@ -279,6 +308,41 @@ class TestLookupByReleaseId:
                 assert result["artist"] == "Test Artist"
 
 
+# ── release_from_recording ───────────────────────────────────────
+
+
+class TestReleaseFromRecording:
+    def test_prefers_matching_album_release(self, client):
+        resp = MagicMock()
+        resp.json.return_value = {
+            "releases": [
+                {"id": "no-media", "title": "Bootleg"},
+                {
+                    "id": "single",
+                    "media": [{"track-count": 10}],
+                    "release-group": {"primary-type": "Single"},
+                },
+                {
+                    "id": "album",
+                    "media": [{"track-count": 10}],
+                    "release-group": {"primary-type": "Album"},
+                },
+                {
+                    "id": "wrong-count",
+                    "media": [{"track-count": 12}],
+                    "release-group": {"primary-type": "Album"},
+                },
+            ]
+        }
+        with patch.object(client, "_mb_request", return_value=resp):
+            with patch.object(
+                client, "lookup_musicbrainz_by_release_id", return_value={"title": "A"}
+            ) as mock_lookup:
+                result = client.release_from_recording("rec-1", {"track_count": 10})
+        mock_lookup.assert_called_once_with("album")
+        assert result == {"title": "A"}
+
+
 # ── search_musicbrainz ───────────────────────────────────────────
 
 
@@ -288,6 +352,25 @@ class TestSearchMusicbrainz:
             result = client.search_musicbrainz("Nonexistent Album XYZ")
             assert result is None
 
+    def test_duration_mismatch_rejected_before_cover_art(self, client):
+        search = MagicMock()
+        search.json.return_value = {
+            "releases": [{"id": "rel-1", "title": "Real Album", "media": [{"track-count": 2}]}]
+        }
+        detail = MagicMock()
+        detail.json.return_value = {
+            "title": "Real Album",
+            "media": [
+                {"tracks": [{"number": "1", "length": 200000}, {"number": "2", "length": 300000}]}
+            ],
+        }
+        with patch.object(client, "_mb_request", side_effect=[search, detail]) as mock_req:
+            result = client.search_musicbrainz(
+                "Real Album", disc_hints={"track_count": 2, "track_durations": [60, 60]}
+            )
+        assert result is None
+        assert mock_req.call_count == 2
+
 
 # ── download_cover_art ───────────────────────────────────────────
 
@@ -315,6 +398,20 @@ class TestDownloadCoverArt:
         assert client.download_cover_art("https://example.com/art.jpg", str(out)) is True
         assert out.exists()
 
+    @patch("requests.get")
+    def test_matching_format_written_without_reencode(self, mock_get, client, tmp_path):
+        resp = MagicMock()
+        resp.headers = {"Content-Type": "image/jpeg"}
+        resp.iter_content.return_value = [b"\xff\xd8raw", b"jpeg"]
+        resp.raise_for_status = MagicMock()
+        mock_get.return_value = resp
+
+        out = tmp_path / "cover.jpg"
+        with patch("PIL.Image.open") as mock_open:
+            assert client.download_cover_art("https://example.com/art.jpg", str(out)) is True
+            mock_open.assert_not_called()
+        assert out.read_bytes() == b"\xff\xd8rawjpeg"
+
     @patch("requests.get")
     def test_download_failure(self, mock_get, client, tmp_path):
         mock_get.side_effect = Exception("network fail")
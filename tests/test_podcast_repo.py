@@ -153,10 +153,43 @@ class TestEpisodes:
         episodes = app_state.get_episodes(pod_id)
         assert episodes[0]["title"] == "Ep 2"
 
+    def test_add_episodes_bulk(self, app_state):
+        pod_id = app_state.add_podcast(feed_url="https://example.com/feed.xml", title="Pod")
+        count = app_state.add_episodes_bulk(
+            pod_id,
+            [
+                {"title": "Ep 1", "audio_url": "https://example.com/ep1.mp3"},
+                {
+                    "title": "Ep 2",
+                    "audio_url": "https://example.com/ep2.mp3",
+                    "duration_seconds": 60,
+                    "published_at": "2024-06-01",
+                },
+            ],
+        )
+        assert count == 2
+        episodes = app_state.get_episodes(pod_id)
+        assert [e["title"] for e in episodes] == ["Ep 2", "Ep 1"]
+        assert episodes[0]["duration_seconds"] == 60
+
+    def test_add_episodes_bulk_empty(self, app_state):
+        pod_id = app_state.add_podcast(feed_url="https://example.com/feed.xml", title="Pod")
+        assert app_state.add_episodes_bulk(pod_id, []) == 0
+
     def test_empty_episodes(self, app_state):
         pod_id = app_state.add_podcast(feed_url="https://example.com/feed.xml", title="Pod")
         assert app_state.get_episodes(pod_id) == []
 
+    def test_get_episode_by_id(self, app_state):
+        pod_id = app_state.add_podcast(feed_url="https://example.com/feed.xml", title="Pod")
+        ep_id = app_state.add_episode(
+            podcast_id=pod_id, title="Ep 1", audio_url="https://example.com/ep1.mp3"
+        )
+        episode = app_state.get_episode(ep_id)
+        assert episode["title"] == "Ep 1"
+        assert episode["podcast_id"] == pod_id
+        assert app_state.get_episode("missing") is None
+
 
 # ── update_episode ───────────────────────────────────────────────
 
@@ -187,3 +220,11 @@ class TestEpisodeExists:
     def test_not_exists(self, app_state):
         pod_id = app_state.add_podcast(feed_url="https://example.com/feed.xml", title="Pod")
         assert app_state.episode_exists(pod_id, "https://example.com/nope.mp3") is False
+
+    def test_get_known_audio_urls(self, app_state):
+        pod_id = app_state.add_podcast(feed_url="https://example.com/feed.xml", title="Pod")
+        other = app_state.add_podcast(feed_url="https://example.com/other.xml", title="Other")
+        app_state.add_episode(podcast_id=pod_id, title="A", audio_url="https://x/a.mp3")
+        app_state.add_episode(podcast_id=pod_id, title="B", audio_url="https://x/b.mp3")
+        app_state.add_episode(podcast_id=other, title="C", audio_url="https://x/c.mp3")
+        assert app_state.get_known_audio_urls(pod_id) == {"https://x/a.mp3", "https://x/b.mp3"}
@@ -96,3 +96,28 @@ class TestRipper:
         assert result_path.exists()
         # Audio CD output should be under music/ subdirectory
         assert "music" in result_path.parts
+
+    @pytest.mark.unit
+    def test_cancel_terminates_running_rip(self, ripper):
+        """cancel() stops the HandBrake process of a rip in progress"""
+        process = MagicMock()
+        process.poll.return_value = None
+        ripper._process = process
+        ripper.cancel()
+        process.terminate.assert_called_once()
+
+    @pytest.mark.unit
+    @patch("subprocess.run")
+    def test_cancelled_audio_cd_rip_stops_between_tracks(self, mock_run, ripper, tmp_path):
+        cd_dir = tmp_path / "MY_CD"
+        cd_dir.mkdir()
+        for n in (1, 2, 3):
+            (cd_dir / f"Track {n:02d}.aiff").write_bytes(b"\x00")
+
+        def convert(cmd, **kwargs):
+            ripper.cancel()  # e.g. SIGTERM while the first track converts
+            return MagicMock(returncode=0)
+
+        mock_run.side_effect = convert
+        assert ripper.rip_audio_cd(source_path=str(cd_dir), album_name="Test") is None
+        assert mock_run.call_count == 1
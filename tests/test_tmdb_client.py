@@ -1,10 +1,11 @@
 """Tests for TMDBClient — search, title cleaning, image download, disambiguation."""
 
+import sqlite3
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.clients.tmdb_client import TMDBClient
+from src.clients.tmdb_client import TMDBClient, _MetadataCache
 
 
 @pytest.fixture
@@ -17,6 +18,20 @@ def client_no_key():
     return TMDBClient(api_key=None)
 
 
+def _route_by_url(search_responses, detail_resp=None, credits_resp=None):
+    """Serve search responses in order; detail and credits by URL (fetched concurrently)."""
+    search_iter = iter(search_responses)
+
+    def _get(url, **kwargs):
+        if url.endswith("/credits"):
+            return credits_resp
+        if "/search/" in url:
+            return next(search_iter)
+        return detail_resp
+
+    return _get
+
+
 # ── search_tmdb ──────────────────────────────────────────────────
 
 
@@ -24,7 +39,7 @@ class TestSearchTmdb:
     def test_no_api_key_returns_none(self, client_no_key):
         assert client_no_key.search_tmdb("The Matrix") is None
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_successful_search(self, mock_get, client):
         search_resp = MagicMock()
         search_resp.json.return_value = {"results": [{"id": 603, "title": "The Matrix"}]}
@@ -49,19 +64,19 @@ class TestSearchTmdb:
             ],
             "cast": [{"name": f"Actor{i}"} for i in range(12)],
         }
-        mock_get.side_effect = [search_resp, detail_resp, credits_resp]
+        mock_get.side_effect = _route_by_url([search_resp], detail_resp, credits_resp)
 
         result = client.search_tmdb("The_Matrix")
         assert result is not None
         assert result["title"] == "The Matrix"
-        assert result["year"] == "1999"
+        assert result["year"] == 1999
         assert result["runtime_minutes"] == 136
         assert result["director"] == "Lana Wachowski"
         assert len(result["cast"]) == 10
         assert result["collection_name"] == "The Matrix Collection"
         assert result["genres"] == ["Action"]
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_no_results_tries_fallback(self, mock_get, client):
         empty_resp = MagicMock()
         empty_resp.json.return_value = {"results": []}
@@ -73,7 +88,7 @@ class TestSearchTmdb:
         assert result is None
         assert mock_get.call_count == 2
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fallback_finds_result(self, mock_get, client):
         empty_resp = MagicMock()
         empty_resp.json.return_value = {"results": []}
@@ -94,7 +109,7 @@ class TestSearchTmdb:
         }
         credits_resp = MagicMock()
         credits_resp.json.return_value = {"crew": [], "cast": []}
-        mock_get.side_effect = [empty_resp, fallback_resp, detail_resp, credits_resp]
+        mock_get.side_effect = _route_by_url([empty_resp, fallback_resp], detail_resp, credits_resp)
 
         result = client.search_tmdb("SOME_DVD_2023_DISC1")
         assert result is not None
@@ -102,7 +117,7 @@ class TestSearchTmdb:
         assert result["director"] is None
         assert result["cast"] == []
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_no_collection(self, mock_get, client):
         search_resp = MagicMock()
         search_resp.json.return_value = {"results": [{"id": 1}]}
@@ -121,19 +136,50 @@ class TestSearchTmdb:
         }
         credits_resp = MagicMock()
         credits_resp.json.return_value = {}
-        mock_get.side_effect = [search_resp, detail_resp, credits_resp]
+        mock_get.side_effect = _route_by_url([search_resp], detail_resp, credits_resp)
 
         result = client.search_tmdb("Solo")
         assert result["year"] is None
         assert result["collection_name"] is None
 
-    @patch("requests.get")
+    def test_repeat_search_memoised_per_instance(self, client):
+        with patch.object(client, "_search_tmdb", return_value={"title": "X", "cast": []}) as m:
+            first = client.search_tmdb("X", disc_hints={"track_durations": [1, 2]})
+            first["cast"].append("mutated")
+            second = client.search_tmdb("X", disc_hints={"track_durations": [1, 2]})
+        m.assert_called_once()
+        assert second == {"title": "X", "cast": []}
+
+    def test_failed_search_not_memoised(self, client):
+        with patch.object(client, "_search_tmdb", return_value=None) as m:
+            client.search_tmdb("X")
+            client.search_tmdb("X")
+        assert m.call_count == 2
+
+    def test_batch_search_preserves_order(self, client):
+        def fake_search(title, year, disc_hints):
+            return None if title == "Missing" else {"title": title, "year": year}
+
+        with patch.object(client, "_search_tmdb", side_effect=fake_search):
+            results = client.batch_search_tmdb(
+                [("Alien", 1979, None), ("Missing", None, None), ("Heat", 1995, {"runtime": 170})]
+            )
+        assert results == [
+            {"title": "Alien", "year": 1979},
+            None,
+            {"title": "Heat", "year": 1995},
+        ]
+
+    def test_batch_search_empty(self, client):
+        assert client.batch_search_tmdb([]) == []
+
+    @patch("requests.Session.get")
     def test_request_exception_returns_none(self, mock_get, client):
         mock_get.side_effect = Exception("Network error")
         result = client.search_tmdb("Anything")
         assert result is None
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_search_with_year(self, mock_get, client):
         search_resp = MagicMock()
         search_resp.json.return_value = {"results": [{"id": 42}]}
@@ -152,14 +198,74 @@ class TestSearchTmdb:
         }
         credits_resp = MagicMock()
         credits_resp.json.return_value = {}
-        mock_get.side_effect = [search_resp, detail_resp, credits_resp]
+        mock_get.side_effect = _route_by_url([search_resp], detail_resp, credits_resp)
 
         result = client.search_tmdb("Movie", year=2020)
-        assert result["year"] == "2020"
+        assert result["year"] == 2020
         call_params = mock_get.call_args_list[0][1]["params"]
         assert call_params["year"] == 2020
 
 
+# ── Response cache ───────────────────────────────────────────────
+
+
+class TestResponseCache:
+    def test_roundtrip(self, tmp_path):
+        cache = _MetadataCache(tmp_path / "cache.db")
+        cache.put("k", {"results": [{"id": 1}]})
+        assert cache.get("k", ttl=60) == {"results": [{"id": 1}]}
+
+    def test_expired_entry_is_miss(self, tmp_path):
+        cache = _MetadataCache(tmp_path / "cache.db")
+        cache.put("k", {"a": 1})
+        with patch("time.time", return_value=10**12):
+            assert cache.get("k", ttl=60) is None
+
+    @patch("requests.Session.get")
+    def test_repeat_search_served_from_cache(self, mock_get, tmp_path):
+        cache_path = str(tmp_path / "tmdb.db")
+        search_resp = MagicMock()
+        search_resp.json.return_value = {"results": [{"id": 7}]}
+        detail_resp = MagicMock()
+        detail_resp.json.return_value = {"title": "Seven", "release_date": "1995-09-22"}
+        credits_resp = MagicMock()
+        credits_resp.json.return_value = {"crew": [], "cast": []}
+        mock_get.side_effect = _route_by_url([search_resp], detail_resp, credits_resp)
+
+        first = TMDBClient(api_key="fake-key", cache_path=cache_path).search_tmdb("Seven")
+        second = TMDBClient(api_key="fake-key", cache_path=cache_path).search_tmdb("Seven")
+
+        assert first == second
+        assert mock_get.call_count == 3
+
+    @patch("requests.Session.get")
+    def test_api_key_not_in_cache_key(self, mock_get, tmp_path):
+        db = tmp_path / "tmdb.db"
+        client = TMDBClient(api_key="secret-key", cache_path=str(db))
+        resp = MagicMock()
+        resp.json.return_value = {"runtime": 100}
+        mock_get.return_value = resp
+
+        client._fetch_movie_detail(5)
+
+        keys = [row[0] for row in sqlite3.connect(str(db)).execute("SELECT key FROM responses")]
+        assert keys == ["https://api.themoviedb.org/3/movie/5?"]
+
+    @patch("requests.Session.get")
+    def test_stale_entry_revalidated_with_etag(self, mock_get, tmp_path):
+        client = TMDBClient(api_key="fake-key", cache_path=str(tmp_path / "tmdb.db"))
+        fresh = MagicMock(status_code=200, headers={"ETag": '"v1"'})
+        fresh.json.return_value = {"runtime": 100}
+        mock_get.return_value = fresh
+        assert client._fetch_movie_detail(5) == {"runtime": 100}
+
+        mock_get.return_value = MagicMock(status_code=304, headers={})
+        with patch("time.time", return_value=10**12):
+            assert client._fetch_movie_detail(5) == {"runtime": 100}
+        assert mock_get.call_args[1]["headers"] == {"If-None-Match": '"v1"'}
+        mock_get.return_value.json.assert_not_called()
+
+
 # ── Title cleaning ───────────────────────────────────────────────
 
 
@@ -227,32 +333,66 @@ class TestPickBestTmdbMatch:
         results = [{"id": 42}]
         assert client._pick_best_tmdb_match(results, {}) == 42
 
-    @patch("requests.get")
+    @staticmethod
+    def _detail_by_id(responses):
+        """Route concurrent detail requests to a response by movie ID."""
+
+        def _get(url, **kwargs):
+            outcome = responses[int(url.rsplit("/", 1)[1])]
+            if isinstance(outcome, Exception):
+                raise outcome
+            resp = MagicMock()
+            resp.json.return_value = outcome
+            return resp
+
+        return _get
+
+    @patch("requests.Session.get")
     def test_runtime_disambiguation(self, mock_get, client):
         results = [{"id": 1}, {"id": 2}, {"id": 3}]
-        for runtime in [90, 135, 200]:
-            resp = MagicMock()
-            resp.json.return_value = {"runtime": runtime}
-        detail_responses = []
-        for runtime in [90, 135, 200]:
-            resp = MagicMock()
-            resp.json.return_value = {"runtime": runtime}
-            detail_responses.append(resp)
-        mock_get.side_effect = detail_responses
+        mock_get.side_effect = self._detail_by_id(
+            {1: {"runtime": 90}, 2: {"runtime": 135}, 3: {"runtime": 200}}
+        )
 
         best = client._pick_best_tmdb_match(results, {"estimated_runtime_min": 130})
         assert best == 2  # closest to 130 min
+        assert mock_get.call_count == 3
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_runtime_disambiguation_handles_fetch_error(self, mock_get, client):
         results = [{"id": 1}, {"id": 2}]
-        ok_resp = MagicMock()
-        ok_resp.json.return_value = {"runtime": 120}
-        mock_get.side_effect = [ok_resp, Exception("fail")]
+        mock_get.side_effect = self._detail_by_id({1: {"runtime": 120}, 2: Exception("fail")})
 
         best = client._pick_best_tmdb_match(results, {"estimated_runtime_min": 120})
         assert best == 1
 
+    @patch("requests.Session.get")
+    def test_runtime_tie_keeps_search_order(self, mock_get, client):
+        results = [{"id": 1}, {"id": 2}]
+        mock_get.side_effect = self._detail_by_id({1: {"runtime": 110}, 2: {"runtime": 130}})
+
+        assert client._pick_best_tmdb_match(results, {"estimated_runtime_min": 120}) == 1
+
+    @patch("requests.Session.get")
+    def test_dominant_popularity_skips_runtime_lookups(self, mock_get, client):
+        results = [
+            {"id": 1, "popularity": 90.0, "release_date": "1999-03-31"},
+            {"id": 2, "popularity": 12.0, "release_date": "2003-05-15"},
+        ]
+        best = client._pick_best_tmdb_match(results, {"estimated_runtime_min": 100}, year=1999)
+        assert best == 1
+        mock_get.assert_not_called()
+
+    @patch("requests.Session.get")
+    def test_dominant_popularity_wrong_year_still_checks_runtime(self, mock_get, client):
+        results = [
+            {"id": 1, "popularity": 90.0, "release_date": "2021-01-01"},
+            {"id": 2, "popularity": 12.0, "release_date": "1984-01-01"},
+        ]
+        mock_get.side_effect = self._detail_by_id({1: {"runtime": 150}, 2: {"runtime": 100}})
+        best = client._pick_best_tmdb_match(results, {"estimated_runtime_min": 100}, year=1984)
+        assert best == 2
+
 
 # ── Image download ───────────────────────────────────────────────
 
@@ -262,7 +402,7 @@ class TestDownloadImage:
         assert client._download_image("", "/out.jpg") is False
         assert client._download_image(None, "/out.jpg") is False
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_successful_download(self, mock_get, client, tmp_path):
         import io
 
@@ -272,14 +412,46 @@ class TestDownloadImage:
         buf = io.BytesIO()
         img.save(buf, format="JPEG")
         img_resp = MagicMock()
-        img_resp.content = buf.getvalue()
+        img_resp.iter_content.return_value = [buf.getvalue()]
         mock_get.return_value = img_resp
 
         out = tmp_path / "poster.jpg"
+        with patch("PIL.Image.open") as mock_open:
+            assert client._download_image("/test.jpg", str(out)) is True
+            mock_open.assert_not_called()
+        assert out.read_bytes() == buf.getvalue()
+
+    @patch("requests.Session.get")
+    def test_format_conversion_uses_pil(self, mock_get, client, tmp_path):
+        import io
+
+        from PIL import Image
+
+        buf = io.BytesIO()
+        Image.new("RGB", (10, 10), color="blue").save(buf, format="JPEG")
+        img_resp = MagicMock()
+        img_resp.content = buf.getvalue()
+        mock_get.return_value = img_resp
+
+        out = tmp_path / "poster.png"
         assert client._download_image("/test.jpg", str(out)) is True
-        assert out.exists()
+        assert Image.open(out).format == "PNG"
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
+    def test_unchanged_image_not_rewritten(self, mock_get, client, tmp_path):
+        out = tmp_path / "poster.jpg"
+        mock_get.return_value = MagicMock(headers={"ETag": '"abc"'})
+        mock_get.return_value.iter_content.return_value = [b"jpeg-bytes"]
+        assert client._download_image("/p.jpg", str(out)) is True
+        assert (tmp_path / "poster.jpg.etag").read_text() == '"abc"'
+
+        mock_get.return_value = MagicMock(status_code=304)
+        assert client._download_image("/p.jpg", str(out)) is True
+        assert mock_get.call_args[1]["headers"] == {"If-None-Match": '"abc"'}
+        mock_get.return_value.iter_content.assert_not_called()
+        assert out.read_bytes() == b"jpeg-bytes"
+
+    @patch("requests.Session.get")
     def test_download_failure_returns_false(self, mock_get, client, tmp_path):
         mock_get.side_effect = Exception("timeout")
         assert client._download_image("/x.jpg", str(tmp_path / "x.jpg")) is False